@@ -0,0 +1,5 @@
+"""Benchmark suite of singletonize, run with `python -m benchmarks`."""
+__all__ = ['Result', 'GROUPS', 'run', 'check_regressions', 'report', 'load_medians']
+
+from ._timing import Result
+from .runner import GROUPS, run, check_regressions, report, load_medians
@@ -0,0 +1,43 @@
+"""Command line entry point writing the benchmark report as JSON."""
+from .runner import GROUPS, run, check_regressions, report, load_medians
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+DEFAULT_THRESHOLDS = os.path.join(os.path.dirname(__file__), 'thresholds.json')
+
+def main(argv: Optional[List[str]] = None) -> int:
+  """Run the benchmarks, write the report and return 1 if a guarded benchmark regressed."""
+  parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+  parser.add_argument('groups', nargs='*', metavar='group', help=f'groups to run among {", ".join(GROUPS)}')
+  parser.add_argument('--quick', action='store_true', help='run fewer and shorter rounds')
+  parser.add_argument('--output', help='file to write the JSON report to, stdout by default')
+  parser.add_argument('--thresholds', default=DEFAULT_THRESHOLDS, help='JSON file of median ceilings by benchmark name')
+  parser.add_argument('--baseline', help='previous JSON report to compare the guarded benchmarks against')
+  parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown against the baseline')
+  args = parser.parse_args(argv)
+
+  with open(args.thresholds) as file:
+    thresholds = json.load(file)
+
+  results = run(args.groups or None, args.quick)
+  baseline = load_medians(args.baseline) if args.baseline else None
+  regressions = check_regressions(results, thresholds, baseline, args.tolerance)
+  output = json.dumps(report(results, regressions), indent=2)
+
+  if args.output:
+    with open(args.output, 'w') as file:
+      file.write(output + '\n')
+  else:
+    print(output)
+
+  for regression in regressions:
+    print(f'Regression: {regression}', file=sys.stderr)
+
+  return 1 if regressions else 0
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,111 @@
+"""Timing helpers and the result record shared by every benchmark group."""
+import timeit
+from statistics import median
+from threading import Barrier, Event, Thread
+from time import perf_counter
+from types import TracebackType
+from typing import Callable, Dict, List, NamedTuple, Optional, Type, Any
+
+class Result(NamedTuple):
+  """Outcome of one benchmark, `median` and `best` being in `unit`."""
+  name: str
+  unit: str
+  median: float
+  best: float
+  samples: int
+
+  def as_dict(self) -> Dict[str, Any]:
+    """Serialize the result for the JSON report."""
+    return self._asdict()
+
+def time_statement(name: str, statement: str, namespace: Dict[str, Any], quick: bool) -> Result:
+  """
+  Time a statement in nanoseconds per execution, with `timeit` loops sized to the clock.
+
+  :param name: Benchmark name
+  :param statement: Statement to time, compiled once so only the loop overhead is added
+  :param namespace: Globals of the statement
+  :param quick: Run fewer and shorter repeats
+  :return Result: Median and best nanoseconds per execution
+  """
+  timer = timeit.Timer(statement, globals=namespace)
+  # Size each repeat to about 20 ms in quick mode and 200 ms otherwise.
+  target = 0.02 if quick else 0.2
+  number = 1
+
+  while (elapsed := timer.timeit(number)) < target / 10:
+    number *= 10
+
+  number = max(1, int(number * target / elapsed))
+  repeat = 3 if quick else 7
+  samples = [total / number * 1e9 for total in timer.repeat(repeat, number)]
+  return Result(name, 'ns', median(samples), min(samples), repeat)
+
+def time_rounds(name: str, round: Callable[[], None], rounds: int, setup: Optional[Callable[[], None]] = None) -> Result:
+  """
+  Time whole rounds of an operation in nanoseconds, running `setup` untimed before each.
+
+  :param name: Benchmark name
+  :param round: Operation timed once per round
+  :param rounds: Number of rounds
+  :param setup: Untimed preparation of each round
+  :return Result: Median and best nanoseconds per round
+  """
+  samples: List[float] = []
+
+  for _ in range(rounds):
+    if setup is not None:
+      setup()
+
+    start = perf_counter()
+    round()
+    samples.append((perf_counter() - start) * 1e9)
+
+  return Result(name, 'ns', median(samples), min(samples), rounds)
+
+class ParkedThreads:
+  """
+  Threads started once and released together for each timed round.
+
+  Rounds time the work of the threads, not their startup.
+  """
+  def __init__(self, count: int, work: Callable[[int], None]) -> None:
+    """
+    Start the threads, parked until the first round.
+
+    :param count: Number of threads
+    :param work: Work of one round, called with the thread index
+    """
+    self._start = Barrier(count + 1)
+    self._end = Barrier(count + 1)
+    self._stop = Event()
+    self._work = work
+    self._threads = [Thread(target=self._run, args=(index,), daemon=True) for index in range(count)]
+
+    for thread in self._threads:
+      thread.start()
+
+  def _run(self, index: int) -> None:
+    while True:
+      self._start.wait()
+
+      if self._stop.is_set():
+        return
+
+      self._work(index)
+      self._end.wait()
+
+  def round(self) -> None:
+    """Release the threads and wait for all of them to finish their work."""
+    self._start.wait()
+    self._end.wait()
+
+  def __enter__(self) -> 'ParkedThreads':
+    return self
+
+  def __exit__(self, kind: Optional[Type[BaseException]], error: Optional[BaseException], traceback: Optional[TracebackType]) -> None:
+    self._stop.set()
+    self._start.wait()
+
+    for thread in self._threads:
+      thread.join()
@@ -0,0 +1,45 @@
+"""Throughput of the attribute helpers `update_instance`, `instance_as_dict`, `instance_as_json`, `instance_changes_since` and `snapshot`."""
+from ._timing import Result, time_statement
+from singletonize import Singleton
+
+from typing import Dict, List, Any
+
+class Settings(Singleton):
+  def __init__(self) -> None:
+    for index in range(16):
+      setattr(self, f'field_{index}', index)
+
+class SnapshotSettings(Singleton, snapshot=True):
+  def __init__(self) -> None:
+    for index in range(16):
+      setattr(self, f'field_{index}', index)
+
+class SlotSettings(Singleton, slots=tuple(f'field_{index}' for index in range(16))):
+  def __init__(self) -> None:
+    for index in range(16):
+      setattr(self, f'field_{index}', index)
+
+def run(quick: bool) -> List[Result]:
+  """Time updates of a few attributes, copies, encodings, change queries and snapshots of 16-attribute instances, in a dict, copy-on-write and in slots."""
+  namespace: Dict[str, Any] = {'Settings': Settings, 'SnapshotSettings': SnapshotSettings, 'SlotSettings': SlotSettings}
+  Settings()
+  SnapshotSettings()
+  SlotSettings()
+  results: List[Result] = []
+
+  for name in ('Settings', 'SnapshotSettings', 'SlotSettings'):
+    results += [
+      time_statement(f'update_instance[{name},fields=1]', f'{name}.update_instance(field_0=1)', namespace, quick),
+      time_statement(f'update_instance[{name},fields=4]', f'{name}.update_instance(field_0=1, field_1=2, field_2=3, field_3=4)', namespace, quick)
+    ]
+    # Changes are tracked from the first query on, so updates are timed before it.
+    namespace['version'] = namespace[name].instance_changes_since().version
+    results += [
+      time_statement(f'instance_as_dict[{name},fields=16]', f'{name}.instance_as_dict()', namespace, quick),
+      time_statement(f'instance_as_json[{name},fields=16]', f'{name}.instance_as_json()', namespace, quick),
+      time_statement(f'instance_changes_since[{name},fields=16]', f'{name}.instance_changes_since(version)', namespace, quick),
+      time_statement(f'snapshot[{name},fields=16]', f'{name}.snapshot()', namespace, quick),
+      time_statement(f'read[{name}]', f'{name}().field_0', namespace, quick)
+    ]
+
+  return results
@@ -0,0 +1,38 @@
+"""Lookup latency of existing instances, the path every caller pays."""
+from ._timing import Result, time_statement
+from singletonize import Singleton, SingletonABC, ThreadLocalSingleton, Multiton
+
+from typing import List
+
+class Hit(Singleton):
+  pass
+
+class HitABC(SingletonABC):
+  pass
+
+class HitThreadLocal(ThreadLocalSingleton):
+  pass
+
+class HitMultiton(Multiton):
+  def __init__(self, key: str) -> None:
+    self.key = key
+
+class Plain:
+  pass
+
+def run(quick: bool) -> List[Result]:
+  """Time calls returning an existing instance, next to a plain instantiation for scale."""
+  namespace = {'Hit': Hit, 'HitABC': HitABC, 'HitThreadLocal': HitThreadLocal, 'HitMultiton': HitMultiton, 'Plain': Plain}
+  Hit()
+  HitABC()
+  HitThreadLocal()
+  HitMultiton('key')
+
+  return [
+    time_statement('hit[Singleton]', 'Hit()', namespace, quick),
+    time_statement('hit[Singleton.get_instance]', 'Hit.get_instance()', namespace, quick),
+    time_statement('hit[SingletonABC]', 'HitABC()', namespace, quick),
+    time_statement('hit[ThreadLocalSingleton]', 'HitThreadLocal()', namespace, quick),
+    time_statement('hit[Multiton]', "HitMultiton('key')", namespace, quick),
+    time_statement('instantiate[plain]', 'Plain()', namespace, quick)
+  ]
@@ -0,0 +1,112 @@
+"""Cost of detaching and resetting instances against the size of the live heap, and of warm-start restores."""
+from ._timing import Result, time_rounds
+from singletonize import Singleton, detach_all, flush_cleanup
+
+import hashlib
+import os
+import tempfile
+from typing import List, Type, cast
+
+HEAP_SIZES = (0, 100_000, 1_000_000)
+QUICK_HEAP_SIZES = (0, 10_000)
+TABLE_ROWS = 100_000
+BULK_CLASSES = 50
+QUICK_TABLE_ROWS = 10_000
+
+class Detached(Singleton, cleanup='attributes-only'):
+  def __init__(self) -> None:
+    self.payload = list(range(100))
+
+class DeepDetached(Singleton, cleanup='deep'):
+  def __init__(self) -> None:
+    self.payload = list(range(100))
+
+def measure(cls: Type[Singleton], size: int, rounds: int) -> List[Result]:
+  """Time `detach` and `reset_instance` of a class until their cleanup completes."""
+  strategy = type(cls).get_cleanup_strategy(cls) # type: ignore[attr-defined]
+
+  def detach() -> None:
+    cls.detach()
+    flush_cleanup(60)
+
+  def reset_instance() -> None:
+    cls.reset_instance()
+    flush_cleanup(60)
+
+  results = [
+    time_rounds(f'detach[cleanup={strategy},heap={size}]', detach, rounds, cls),
+    time_rounds(f'reset_instance[cleanup={strategy},heap={size}]', reset_instance, rounds, cls)
+  ]
+  cls.detach()
+  flush_cleanup(60)
+  return results
+
+def measure_bulk(classes: int, size: int, rounds: int) -> List[Result]:
+  """Time detaching many `deep` classes one by one, waiting for each cleanup, against a single `detach_all`."""
+  bulk: List[Type[Singleton]] = [
+    cast(Type[Singleton], type(f'Bulk{index}', (DeepDetached,), {}))
+    for index in range(classes)
+  ]
+
+  def create() -> None:
+    for cls in bulk:
+      cls()
+
+  def detach_loop() -> None:
+    for cls in bulk:
+      cls.detach()
+      flush_cleanup(60)
+
+  def detach_bulk() -> None:
+    detach_all(bulk)
+    flush_cleanup(60)
+
+  return [
+    time_rounds(f'detach_loop[classes={classes},cleanup=deep,heap={size}]', detach_loop, rounds, create),
+    time_rounds(f'detach_all[classes={classes},cleanup=deep,heap={size}]', detach_bulk, rounds, create)
+  ]
+
+def measure_warm_start(rows: int, rounds: int) -> List[Result]:
+  """Time the creation of an instance building a lookup table and a 16 MB buffer, by `__init__` and from its snapshot."""
+  with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, 'index.snap')
+
+    class Index(Singleton, warm_start=path, warm_start_key='v1'):
+      def __init__(self) -> None:
+        self.table = {row: hashlib.sha1(str(row).encode()).hexdigest() for row in range(rows)}
+        self.buffer = memoryview(bytearray(16 << 20))
+
+    def create() -> None:
+      Index()
+
+    def detach() -> None:
+      Index.detach()
+      flush_cleanup(60)
+
+    results = [time_rounds(f'create[Index,rows={rows},init]', create, rounds, detach)]
+    Index()
+    Index.save_snapshot()
+    results.append(time_rounds(f'create[Index,rows={rows},warm_start]', create, rounds, detach))
+    detach()
+
+  return results
+
+def run(quick: bool) -> List[Result]:
+  """
+  Time `detach` and `reset_instance` with bounded and heap-scanning cleanups, bulk detaches, then warm-start restores.
+
+  A heap of gc-tracked containers is kept alive while timing, which the `deep`
+  cleanup scans for referrers and collects.
+  """
+  results: List[Result] = []
+  rounds = 3 if quick else 10
+
+  for size in QUICK_HEAP_SIZES if quick else HEAP_SIZES:
+    heap = [[] for _ in range(size)]
+    results.extend(measure(Detached, size, rounds))
+    results.extend(measure(DeepDetached, size, rounds))
+    results.extend(measure_bulk(BULK_CLASSES, size, rounds))
+    del heap
+
+  results.extend(measure_warm_start(QUICK_TABLE_ROWS if quick else TABLE_ROWS, rounds))
+  return results
@@ -0,0 +1,125 @@
+"""Memory of singleton instances, the cost of defining singleton classes and of reporting their memory."""
+from ._timing import Result, time_rounds, time_statement
+from singletonize import Singleton, flush_cleanup, memory_report
+
+import gc
+import tracemalloc
+from time import perf_counter
+from typing import Callable, List, Any
+
+CHURN_CLASSES = 100_000
+QUICK_CHURN_CLASSES = 10_000
+
+def traced_bytes(allocate: Callable[[], Any], count: int) -> float:
+  """Bytes still allocated per item after building `count` items with `allocate`."""
+  gc.collect()
+  tracemalloc.start()
+
+  try:
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [allocate() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+  finally:
+    tracemalloc.stop()
+
+  del kept
+  return (after - before) / count
+
+def init(self: Any) -> None:
+  self.host = 'localhost'
+  self.port = 80
+  self.timeout = 5.0
+  self.retries = 3
+
+def define(base: type, index: int, **options: Any) -> type:
+  """Define a class holding four attributes."""
+  return type(base)(f'Defined{index}', (base,), {'__init__': init}, **options)
+
+def measure_churn(count: int, quick: bool) -> List[Result]:
+  """
+  Define and use `count` classes, time a lookup while they are all alive, then drop them.
+
+  Later rounds are traced, and the memory a round leaves allocated after the
+  previous one is what dropped classes keep in the registry. The first traced
+  round is not counted, since it sizes the subclass table CPython keeps for
+  the base class, as it does for plain classes.
+  """
+  def define_and_create() -> List[type]:
+    classes = [define(Singleton, index) for index in range(count)]
+
+    for cls in classes:
+      cls()
+
+    return classes
+
+  def drop(classes: List[type]) -> None:
+    for cls in classes:
+      cls.detach() # type: ignore[attr-defined]
+
+    flush_cleanup(60)
+    classes.clear()
+    gc.collect()
+
+  start = perf_counter()
+  classes = define_and_create()
+  churn = (perf_counter() - start) / count * 1e9
+  hit = time_statement(f'hit[Singleton,classes={count}]', 'last()', {'last': classes[-1]}, quick)
+  drop(classes)
+  tracemalloc.start()
+
+  try:
+    drop(define_and_create())
+    before = tracemalloc.get_traced_memory()[0]
+    drop(define_and_create())
+    retained = tracemalloc.get_traced_memory()[0] - before
+  finally:
+    tracemalloc.stop()
+
+  return [
+    Result(f'define_and_create[Singleton,classes={count}]', 'ns', churn, churn, count),
+    hit,
+    Result(f'retained_after_drop[classes={count}]', 'bytes', retained, retained, count)
+  ]
+
+def run(quick: bool) -> List[Result]:
+  """
+  Measure bytes per instance and per class definition, next to plain classes.
+
+  Instances are measured on distinct classes, so the per-class registry entries
+  an instance adds are part of its cost. A `memory_report` then walks them all.
+  """
+  count = 200 if quick else 2000
+  singletons = [define(Singleton, index) for index in range(count)]
+  slot_singletons = [define(Singleton, index, slots=('host', 'port', 'timeout', 'retries')) for index in range(count)]
+  plains = [define(object, index) for index in range(count)]
+  singleton_instances = iter(singletons)
+  slot_instances = iter(slot_singletons)
+  plain_instances = iter(plains)
+  indexes = iter(range(count * 4))
+  instance_bytes = traced_bytes(lambda: next(singleton_instances)(), count)
+  slot_instance_bytes = traced_bytes(lambda: next(slot_instances)(), count)
+  plain_instance_bytes = traced_bytes(lambda: next(plain_instances)(), count)
+  class_bytes = traced_bytes(lambda: define(Singleton, next(indexes)), count)
+  plain_class_bytes = traced_bytes(lambda: define(object, next(indexes)), count)
+
+  report = time_rounds(f'memory_report[classes={count * 2}]', memory_report, 3 if quick else 10)
+
+  for cls in (*singletons, *slot_singletons):
+    cls.detach()
+
+  def define_classes() -> None:
+    for index in range(100):
+      define(Singleton, index)
+
+  definition = time_rounds('define_class[Singleton]', define_classes, 5 if quick else 20)
+
+  return [
+    Result('memory_per_instance[Singleton]', 'bytes', instance_bytes, instance_bytes, count),
+    Result('memory_per_instance[Singleton,slots]', 'bytes', slot_instance_bytes, slot_instance_bytes, count),
+    Result('memory_per_instance[plain]', 'bytes', plain_instance_bytes, plain_instance_bytes, count),
+    Result('memory_per_class[Singleton]', 'bytes', class_bytes, class_bytes, count),
+    Result('memory_per_class[plain]', 'bytes', plain_class_bytes, plain_class_bytes, count),
+    definition._replace(median=definition.median / 100, best=definition.best / 100),
+    report,
+    *measure_churn(QUICK_CHURN_CLASSES if quick else CHURN_CLASSES, quick)
+  ]
@@ -0,0 +1,33 @@
+"""Latency of concurrent first calls racing to create the instance."""
+from ._timing import Result, ParkedThreads, time_rounds
+from singletonize import Singleton, flush_cleanup
+
+from typing import List, Optional, Any
+
+THREADS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+class Storm(Singleton):
+  pass
+
+def storm(threads: int, rounds: int) -> Result:
+  """Time rounds where parked threads call a detached class at once."""
+  instances: List[Optional[Any]] = [None] * threads
+
+  def create(index: int) -> None:
+    instances[index] = Storm()
+
+  def reset() -> None:
+    Storm.detach()
+    flush_cleanup(5)
+
+  with ParkedThreads(threads, create) as parked:
+    result = time_rounds(f'miss_storm[threads={threads}]', parked.round, rounds, reset)
+
+  if any(instance is not instances[0] for instance in instances):
+    raise RuntimeError(f'Miss storm with {threads} threads created several instances')
+
+  return result
+
+def run(quick: bool) -> List[Result]:
+  """Time miss storms from 1 to 128 threads."""
+  return [storm(threads, 5 if quick else 50) for threads in THREADS]
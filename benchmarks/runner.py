@@ -0,0 +1,89 @@
+"""Running benchmark groups and checking their results against thresholds."""
+from ._timing import Result
+from . import hot_path, miss_storm, scaling, lifecycle, data, memory
+
+import json
+import platform
+import sys
+import sysconfig
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional, Any
+
+GROUPS: Dict[str, ModuleType] = {
+  'hot_path': hot_path,
+  'miss_storm': miss_storm,
+  'scaling': scaling,
+  'lifecycle': lifecycle,
+  'data': data,
+  'memory': memory
+}
+
+def run(groups: Optional[Iterable[str]] = None, quick: bool = False) -> List[Result]:
+  """
+  Run benchmark groups in order.
+
+  :param groups: Names of the groups to run, defaults to all of them
+  :param quick: Run fewer and shorter rounds, for smoke checks
+  :return List[Result]: Results of every benchmark run
+  :raises ValueError: If a group name is unknown
+  """
+  names = list(GROUPS if groups is None else groups)
+  unknown = [name for name in names if name not in GROUPS]
+
+  if unknown:
+    raise ValueError(f'Unknown benchmark groups {unknown}, expected some of {list(GROUPS)}')
+
+  return [result for name in names for result in GROUPS[name].run(quick)]
+
+def check_regressions(
+  results: Iterable[Result],
+  thresholds: Dict[str, float],
+  baseline: Optional[Dict[str, float]] = None,
+  tolerance: float = 0.25
+) -> List[str]:
+  """
+  Find the guarded benchmarks that slowed down.
+
+  Each benchmark named in `thresholds` fails when its median exceeds its ceiling,
+  or exceeds its `baseline` median by more than `tolerance`.
+
+  :param results: Benchmark results
+  :param thresholds: Ceiling of the median by benchmark name
+  :param baseline: Medians of a previous run by benchmark name
+  :param tolerance: Allowed relative slowdown against the baseline
+  :return List[str]: Description of each regression, empty if none
+  """
+  regressions: List[str] = []
+
+  for result in results:
+    ceiling = thresholds.get(result.name)
+
+    if ceiling is None:
+      continue
+
+    if result.median > ceiling:
+      regressions.append(f'{result.name}: {result.median:.1f} {result.unit} exceeds the threshold of {ceiling:.1f}')
+
+    previous = (baseline or {}).get(result.name)
+
+    if previous is not None and result.median > previous * (1 + tolerance):
+      regressions.append(f'{result.name}: {result.median:.1f} {result.unit} is over {tolerance:.0%} slower than the baseline {previous:.1f}')
+
+  return regressions
+
+def report(results: Iterable[Result], regressions: List[str]) -> Dict[str, Any]:
+  """Build the JSON report of a run."""
+  return {
+    'python': sys.version.split()[0],
+    'implementation': platform.python_implementation(),
+    'platform': platform.platform(),
+    'free_threaded_build': bool(sysconfig.get_config_var('Py_GIL_DISABLED')),
+    'gil_enabled': getattr(sys, '_is_gil_enabled', lambda: True)(),
+    'results': [result.as_dict() for result in results],
+    'regressions': regressions
+  }
+
+def load_medians(path: str) -> Dict[str, float]:
+  """Read the medians by benchmark name from a previous JSON report."""
+  with open(path) as file:
+    return {result['name']: result['median'] for result in json.load(file)['results']}
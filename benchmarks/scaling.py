@@ -0,0 +1,50 @@
+"""Aggregate hit throughput against thread count, to compare GIL and free-threaded builds."""
+from ._timing import Result, ParkedThreads, time_rounds
+from singletonize import Singleton, Multiton
+
+import os
+from itertools import repeat
+from typing import Callable, List, Tuple, Any
+
+class Shared(Singleton):
+  pass
+
+class Keyed(Multiton):
+  def __init__(self, key: str) -> None:
+    self.key = key
+
+def thread_counts() -> Tuple[int, ...]:
+  """Powers of two up to twice the available cores, capped to 64."""
+  limit = min(2 * (os.cpu_count() or 1), 64)
+  return tuple(2 ** power for power in range(limit.bit_length()) if 2 ** power <= limit)
+
+def hits_per_second(name: str, lookup: Callable[[], Any], threads: int, hits: int, rounds: int) -> Result:
+  """Measure the hits per second of threads all looking up the same instance."""
+  def work(index: int) -> None:
+    for _ in repeat(None, hits):
+      lookup()
+
+  with ParkedThreads(threads, work) as parked:
+    timed = time_rounds(name, parked.round, rounds)
+
+  total = threads * hits * 1e9
+  return Result(name, 'hits/s', total / timed.median, total / timed.best, rounds)
+
+def run(quick: bool) -> List[Result]:
+  """
+  Measure hit throughput from one thread to twice the cores.
+
+  Run it on a free-threaded build with `PYTHON_GIL=0` and `PYTHON_GIL=1` to
+  compare both modes, the report records which one was active.
+  """
+  hits = 20_000 if quick else 200_000
+  rounds = 3 if quick else 7
+  Shared()
+  Keyed('key')
+  results: List[Result] = []
+
+  for threads in thread_counts():
+    results.append(hits_per_second(f'hits_per_second[Singleton,threads={threads}]', Shared, threads, hits, rounds))
+    results.append(hits_per_second(f'hits_per_second[Multiton,threads={threads}]', lambda: Keyed('key'), threads, hits, rounds))
+
+  return results
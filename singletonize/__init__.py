@@ -1,3 +1,34 @@
-__all__ = ['Singleton', 'SingletonABC']
+__all__ = ['Singleton', 'SingletonABC', 'AsyncSingleton', 'AsyncSingletonABC', 'SharedMemorySingleton', 'SharedField',
+  'ThreadLocalSingleton', 'ContextSingleton', 'Multiton',
+  'flush_cleanup', 'set_cleanup_strategy', 'untouched_proxies', 'warmup', 'WarmupResult', 'initialize', 'shutdown', 'prefork',
+  'live_singletons', 'detach_all', 'reset_many',
+  'RefreshStats', 'StatsSnapshot', 'enable_stats', 'disable_stats', 'stats', 'reset_stats',
+  'LifecycleEvent', 'subscribe', 'unsubscribe', 'StateChanges',
+  'MemoryUsage', 'memory_report', 'start_memory_sampling', 'stop_memory_sampling']
 
-from ._singleton import Singleton, SingletonABC
+from ._metaclasses import SingletonMeta
+from ._utils import (
+  untouched_proxies, warmup, WarmupResult, RefreshStats, StatsSnapshot, SharedField, LifecycleEvent, StateChanges, MemoryUsage
+)
+from ._singleton import (
+  Singleton, SingletonABC, AsyncSingleton, AsyncSingletonABC, SharedMemorySingleton, ThreadLocalSingleton, ContextSingleton,
+  Multiton
+)
+
+flush_cleanup = SingletonMeta.flush_cleanup
+set_cleanup_strategy = SingletonMeta.set_cleanup_strategy
+initialize = SingletonMeta.initialize
+shutdown = SingletonMeta.shutdown
+prefork = SingletonMeta.prefork
+live_singletons = SingletonMeta.live_singletons
+detach_all = SingletonMeta.detach_all
+reset_many = SingletonMeta.reset_many
+enable_stats = SingletonMeta.enable_stats
+disable_stats = SingletonMeta.disable_stats
+stats = SingletonMeta.stats
+reset_stats = SingletonMeta.reset_stats
+subscribe = SingletonMeta.subscribe
+unsubscribe = SingletonMeta.unsubscribe
+memory_report = SingletonMeta.memory_report
+start_memory_sampling = SingletonMeta.start_memory_sampling
+stop_memory_sampling = SingletonMeta.stop_memory_sampling
@@ -1,3 +1,8 @@
-__all__ = ['SingletonMeta', 'SingletonABCMeta']
+__all__ = ['SingletonMeta', 'SingletonABCMeta', 'AsyncSingletonMeta', 'AsyncSingletonABCMeta', 'SharedMemorySingletonMeta',
+  'ScopedSingletonMeta', 'ThreadLocalSingletonMeta', 'ContextSingletonMeta', 'MultitonMeta']
 
-from .singleton_meta import SingletonMeta, SingletonABCMeta
\ No newline at end of file
+from .singleton_meta import SingletonMeta, SingletonABCMeta
+from .async_singleton_meta import AsyncSingletonMeta, AsyncSingletonABCMeta
+from .shared_memory_singleton_meta import SharedMemorySingletonMeta
+from .scoped_singleton_meta import ScopedSingletonMeta, ThreadLocalSingletonMeta, ContextSingletonMeta
+from .multiton_meta import MultitonMeta
@@ -0,0 +1,110 @@
+"""Module for asynchronous Singleton metaclasses implementation."""
+from .._utils import PendingCreation
+from .singleton_meta import SingletonMeta
+
+import asyncio
+import os
+from abc import ABCMeta
+from typing import Type, TypeVar, Dict, Tuple, cast, Any
+
+_T = TypeVar('_T')
+
+class AsyncSingletonMeta(SingletonMeta):
+  """
+  Metaclass for creating Singleton classes built by an async factory.
+
+  The instance is created with `await aget_instance()`, never by calling the class.
+  Concurrent coroutines share one in-flight creation future per class, so the
+  factory runs once and its outcome is delivered to every waiter. Creation is
+  expected to happen from a single event loop.
+  """
+  __slots__ = ()
+  _futures: Dict[Type[Any], 'asyncio.Future[Any]'] = {}
+  _swappable = False
+  _restorable = False
+
+  def __call__(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """Return the singleton instance, which must have been created asynchronously."""
+    instance: _T = cls._singleton_instance # type: ignore[attr-defined]
+    if instance is not None:
+      return instance
+
+    raise RuntimeError(f'{cls.__qualname__} has no instance yet, use `await {cls.__qualname__}.aget_instance()`')
+
+  @classmethod
+  def construct(mcs, cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """Build a new object of the class, left writable for the rest of `acreate`."""
+    return cast(_T, type.__call__(cls, *args, **kwargs))
+
+  @classmethod
+  async def aget_instance(mcs, cls: Type[_T], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> _T:
+    """Create or return the singleton instance, awaiting any creation already in flight."""
+    instance = cls.__dict__['_singleton_instance']
+    if instance is not None:
+      return cast(_T, instance)
+
+    future = mcs._futures.get(cls)
+
+    if future is not None:
+      try:
+        return cast(_T, await asyncio.shield(future))
+      except asyncio.CancelledError:
+        raise
+      except BaseException as error:
+        raise PendingCreation.copy_error(error) from error
+
+    future = mcs._futures[cls] = asyncio.get_running_loop().create_future()
+
+    try:
+      instance = await getattr(cls, 'acreate')(*args, **kwargs)
+      SingletonMeta._seal(cls, instance)
+
+      with mcs._locks[cls]:
+        existing = cls.__dict__['_singleton_instance']
+
+        if existing is None:
+          mcs._install(cls, instance)
+        else:
+          instance = existing
+    except BaseException as error:
+      mcs._futures.pop(cls, None)
+
+      if isinstance(error, asyncio.CancelledError):
+        future.cancel()
+      else:
+        future.set_exception(error)
+        # Mark the error as retrieved so an unawaited future is not reported.
+        future.exception()
+
+      raise
+
+    mcs._futures.pop(cls, None)
+    future.set_result(instance)
+    return cast(_T, instance)
+
+  @classmethod
+  async def adetach(mcs, cls: Type[_T]) -> None:
+    """Detach the instance, awaiting its `aclose` hook before the cleanup is scheduled."""
+    removed = mcs._remove(cls)
+
+    if removed is None:
+      return
+
+    instance, tracked = removed
+
+    try:
+      aclose = getattr(instance, 'aclose', None)
+
+      if aclose is not None:
+        await aclose()
+    finally:
+      mcs._release(cls, instance, tracked)
+
+class AsyncSingletonABCMeta(AsyncSingletonMeta, ABCMeta):
+  """Metaclass for creating abstract Singleton classes built by an async factory."""
+
+  __slots__ = ()
+
+if hasattr(os, 'register_at_fork'):
+  # Event loops do not survive a fork, and neither do their pending futures.
+  os.register_at_fork(after_in_child=AsyncSingletonMeta._futures.clear)
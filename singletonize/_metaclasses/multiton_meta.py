@@ -0,0 +1,212 @@
+"""Module for Multiton metaclass implementation."""
+from .._utils import ClassRecord, PendingCreation
+from .singleton_meta import SingletonMeta
+
+import os
+from collections import OrderedDict
+from threading import get_ident
+from typing import Type, TypeVar, Callable, Dict, Hashable, List, Literal, Optional, Tuple, cast, Any
+
+_T = TypeVar('_T')
+EvictionPolicy = Literal['lru', 'fifo']
+EVICTION_POLICIES: Tuple[EvictionPolicy, ...] = ('lru', 'fifo')
+
+def default_key(*args: Any, **kwargs: Any) -> Hashable:
+  """Key instances on their constructor arguments."""
+  return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+class MultitonMeta(SingletonMeta):
+  """
+  Metaclass for creating Multiton classes, holding one instance per key.
+
+  The key is computed from the constructor arguments by the `key` class keyword.
+  With `max_instances`, creating an instance beyond the bound evicts the least
+  recently used (`lru`) or the oldest (`fifo`) instance through the detach path.
+  """
+  __slots__ = ()
+  _swappable = False
+  _restorable = False
+  _class_keywords: Tuple[str, ...] = (*SingletonMeta._class_keywords, 'key', 'max_instances', 'eviction')
+
+  def __init__(
+    cls,
+    name: str,
+    bases: tuple[type, ...],
+    namespace: Dict[str, Any],
+    key: Optional[Callable[..., Hashable]] = None,
+    max_instances: Optional[int] = None,
+    eviction: Optional[EvictionPolicy] = None,
+    **kwargs: Any
+  ) -> None:
+    """Initialize the per-class instance map and options, inheriting unset options."""
+    super().__init__(name, bases, namespace, **kwargs)
+
+    if max_instances is not None and max_instances < 1:
+      raise ValueError(f'max_instances must be positive, got {max_instances}')
+
+    if eviction is not None and eviction not in EVICTION_POLICIES:
+      raise ValueError(f'Unknown eviction policy {eviction!r}, expected one of {EVICTION_POLICIES}')
+
+    max_instances = max_instances or getattr(cls, '_multiton_max_instances', None)
+    eviction = eviction or getattr(cls, '_multiton_eviction', 'lru')
+
+    type.__setattr__(cls, '_multiton_key', key or getattr(cls, '_multiton_key', default_key))
+    type.__setattr__(cls, '_multiton_max_instances', max_instances)
+    type.__setattr__(cls, '_multiton_eviction', eviction)
+    # Only a bounded LRU map reorders keys on lookup.
+    type.__setattr__(cls, '_multiton_lru', max_instances is not None and eviction == 'lru')
+    type.__setattr__(cls, '_multiton_instances', OrderedDict() if max_instances else {})
+    type.__setattr__(cls, '_multiton_pending', {})
+
+  def __call__(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """Create or return the instance for the key of the arguments."""
+    key = cls._multiton_key(*args, **kwargs) # type: ignore[attr-defined]
+    instance: _T = cls._multiton_instances.get(key) # type: ignore[attr-defined]
+
+    if instance is not None:
+      if cls._multiton_lru: # type: ignore[attr-defined]
+        try:
+          cls._multiton_instances.move_to_end(key) # type: ignore[attr-defined]
+        except KeyError:
+          # Evicted concurrently, the caller still gets the instance it looked up.
+          pass
+
+      return instance
+
+    return MultitonMeta._create_key(cls, key, args, kwargs)
+
+  @classmethod
+  def _create_key(mcs, cls: Type[_T], key: Hashable, args: tuple[Any, ...], kwargs: Dict[str, Any]) -> _T:
+    """
+    Build the instance of a key once while concurrent callers wait on its completion.
+
+    Keys are created independently: the class lock is only held to claim or join
+    the pending creation of the key, and to publish its instance.
+    """
+    if cls in mcs._fork_blocked:
+      raise RuntimeError(f'{cls.__qualname__} instances were inherited from the parent process and cannot be used after fork')
+
+    lock = mcs._locks[cls]
+    instances: Dict[Hashable, Any] = cls.__dict__['_multiton_instances']
+    pending_keys: Dict[Hashable, PendingCreation] = cls.__dict__['_multiton_pending']
+
+    with lock:
+      instance = instances.get(key)
+      if instance is not None:
+        return cast(_T, instance)
+
+      pending = pending_keys.get(key)
+      owner = pending is None
+
+      if pending is None:
+        pending = pending_keys[key] = PendingCreation()
+
+    if not owner:
+      if pending.owner == get_ident():
+        raise RuntimeError(f'Recursive construction of {cls.__qualname__} for key {key!r}')
+
+      return cast(_T, pending.wait())
+
+    evicted: List[Any] = []
+
+    try:
+      instance = type(cls).construct(cls, *args, **kwargs) # type: ignore[attr-defined]
+
+      with lock:
+        try:
+          instances[key] = instance
+          max_instances = cls.__dict__['_multiton_max_instances']
+
+          while max_instances is not None and len(instances) > max_instances:
+            evicted.append(cast(OrderedDict[Hashable, Any], instances).popitem(last=False)[1])
+        finally:
+          del pending_keys[key]
+    except BaseException as error:
+      with lock:
+        pending_keys.pop(key, None)
+
+      pending.fail(error)
+      raise
+
+    pending.complete(instance)
+
+    if evicted:
+      type(cls)._release(cls, evicted, []) # type: ignore[attr-defined]
+
+    return cast(_T, instance)
+
+  @classmethod
+  def get_instance_or_none(mcs, cls: Type[_T], *args: Any, **kwargs: Any) -> _T | None:
+    """Get the instance for the key of the arguments."""
+    return cast(_T | None, cls.__dict__['_multiton_instances'].get(cls._multiton_key(*args, **kwargs))) # type: ignore[attr-defined]
+
+  @classmethod
+  def has_instance(mcs, cls: Type[_T], *args: Any, **kwargs: Any) -> bool:
+    """Check if the key of the arguments has an instance."""
+    return mcs.get_instance_or_none(cls, *args, **kwargs) is not None
+
+  @classmethod
+  def instances(mcs, cls: Type[_T]) -> Dict[Hashable, _T]:
+    """Get a snapshot of the live instances by key, least recently used first."""
+    with mcs._locks[cls]:
+      return dict(cls.__dict__['_multiton_instances'])
+
+  @classmethod
+  def live_instances(mcs, cls: Type[_T]) -> List[_T]:
+    """Get the live instances of every key."""
+    return list(mcs.instances(cls).values())
+
+  @classmethod
+  def evict(mcs, cls: Type[_T], *args: Any, **kwargs: Any) -> bool:
+    """Detach the instance for the key of the arguments, returning whether there was one."""
+    key = cls._multiton_key(*args, **kwargs) # type: ignore[attr-defined]
+
+    with mcs._locks[cls]:
+      instance = cls.__dict__['_multiton_instances'].pop(key, None)
+
+    if instance is None:
+      return False
+
+    type(cls)._release(cls, [instance], []) # type: ignore[attr-defined]
+    return True
+
+  @classmethod
+  def _remove(mcs, cls: Type[_T]) -> Optional[Tuple[Any, List[Any]]]:
+    """Unregister every instance of the class, returning them with the tracked holders."""
+    with mcs._locks[cls]:
+      instances: Dict[Hashable, Any] = cls.__dict__['_multiton_instances']
+
+      if not instances:
+        return None
+
+      removed = list(instances.values())
+      instances.clear()
+      return removed, [*mcs._refs.pop(cls, ()), *mcs._held.pop(cls, ())]
+
+  @classmethod
+  def _release(mcs, cls: Type[_T], instances: List[Any], tracked: List[Any]) -> None: # type: ignore[override]
+    """Schedule the cleanup of unregistered instances."""
+    for instance in instances:
+      super()._release(cls, instance, tracked)
+
+  @classmethod
+  def _after_fork_in_child(mcs) -> None:
+    """Drop creations in flight in the parent and apply the fork policies."""
+    for cls in ClassRecord.owners():
+      if not isinstance(cls, MultitonMeta):
+        continue
+
+      cls.__dict__['_multiton_pending'].clear()
+      policy = SingletonMeta.get_fork_policy(cls)
+      instances = cls.__dict__['_multiton_instances']
+
+      if policy == 'inherit' or not instances:
+        continue
+
+      instances.clear()
+
+      if policy == 'fail':
+        SingletonMeta._fork_blocked[cls] = True
+
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(after_in_child=MultitonMeta._after_fork_in_child)
@@ -0,0 +1,186 @@
+"""Module for thread-local and context-scoped Singleton metaclasses implementation."""
+from .._utils import ScopeState
+from .singleton_meta import SingletonMeta
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import local
+from typing import Type, TypeVar, Dict, List, Iterator, Optional, Tuple, cast, Any
+from weakref import WeakSet, finalize
+
+_T = TypeVar('_T')
+
+class ScopedSingletonMeta(SingletonMeta):
+  """
+  Base metaclass for Singleton classes holding one instance per scope.
+
+  Scopes never share an instance, so lookups and creations take no lock. When a
+  scope ends, its instance is released with the cleanup strategy of the class.
+  """
+  __slots__ = ()
+  _swappable = False
+  _restorable = False
+
+  @classmethod
+  def _get_state(mcs, cls: Type[Any]) -> Optional[ScopeState]:
+    """Get the state of the current scope."""
+    raise NotImplementedError
+
+  @classmethod
+  def _set_state(mcs, cls: Type[Any], state: Optional[ScopeState]) -> None:
+    """Replace the state of the current scope."""
+    raise NotImplementedError
+
+  @classmethod
+  def _create(mcs, cls: Type[_T], args: tuple[Any, ...], kwargs: Dict[str, Any]) -> _T:
+    """Build the instance of the current scope."""
+    if cls in mcs._fork_blocked:
+      raise RuntimeError(f'{cls.__qualname__} instance was inherited from the parent process and cannot be used after fork')
+
+    state = mcs._get_state(cls)
+
+    if state is not None:
+      if state.instance is not None:
+        return cast(_T, state.instance)
+
+      if state.creating:
+        raise RuntimeError(f'Recursive construction of singleton {cls.__qualname__}')
+
+    # A fresh state, so contexts copied from this one keep whatever they already share.
+    state = ScopeState()
+    state.creating = True
+    mcs._set_state(cls, state)
+
+    try:
+      instance = type(cls).construct(cls, *args, **kwargs) # type: ignore[attr-defined]
+    finally:
+      state.creating = False
+
+    state.instance = instance
+    state.finalizer = finalize(state, ScopedSingletonMeta._end_scope, cls, instance, state.refs, state.held)
+    state.finalizer.atexit = False
+    return cast(_T, instance)
+
+  @staticmethod
+  def _end_scope(cls: Type[Any], instance: Any, refs: WeakSet[Any], held: List[Any]) -> None:
+    """Release the instance of a scope that ended."""
+    type(cls)._release(cls, instance, [*refs, *held])
+
+  @classmethod
+  def get_instance_or_none(mcs, cls: Type[_T]) -> _T | None:
+    """Get the instance of the current scope."""
+    state = mcs._get_state(cls)
+    return None if state is None else cast(_T | None, state.instance)
+
+  @classmethod
+  def has_instance(mcs, cls: Type[_T]) -> bool:
+    """Check if the current scope has an instance."""
+    return mcs.get_instance_or_none(cls) is not None
+
+  @classmethod
+  def live_instances(mcs, cls: Type[_T]) -> List[_T]:
+    """Get the instance of the current scope, the only one reachable from this thread."""
+    instance = mcs.get_instance_or_none(cls)
+    return [] if instance is None else [instance]
+
+  @classmethod
+  def track(mcs, cls: Type[_T], holder: object) -> None:
+    """Register an object holding the instance of the current scope."""
+    state = mcs._get_state(cls)
+
+    if state is None or state.instance is None:
+      raise RuntimeError(f'{cls.__qualname__} has no instance in this scope to track holders of')
+
+    if isinstance(holder, (dict, list, set)):
+      state.held.append(holder)
+      return
+
+    try:
+      state.refs.add(holder)
+    except TypeError:
+      raise TypeError(
+        f'Cannot track {type(holder).__name__} holder: it must support weak references '
+        'or be a dict, list or set'
+      ) from None
+
+  @classmethod
+  def _remove(mcs, cls: Type[_T]) -> Optional[Tuple[Any, List[Any]]]:
+    """Unregister the instance of the current scope, returning it with its tracked holders."""
+    state = mcs._get_state(cls)
+
+    if state is None or state.instance is None:
+      return None
+
+    instance, state.instance = state.instance, None
+    cast(finalize, state.finalizer).detach()
+    tracked = [*state.refs, *state.held]
+    state.refs, state.held = WeakSet(), []
+    return instance, tracked
+
+  @classmethod
+  @contextmanager
+  def scope(mcs, cls: Type[Any]) -> Iterator[None]:
+    """Run a block with its own instance, detached when the block exits."""
+    previous = mcs._get_state(cls)
+    mcs._set_state(cls, None)
+
+    try:
+      yield
+    finally:
+      mcs.detach(cls)
+      mcs._set_state(cls, previous)
+
+class ThreadLocalSingletonMeta(ScopedSingletonMeta):
+  """Metaclass for Singleton classes holding one instance per thread."""
+  __slots__ = ()
+
+  def __init__(cls, name: str, bases: tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any) -> None:
+    """Initialize the thread-local instance storage."""
+    super().__init__(name, bases, namespace, **kwargs)
+    type.__setattr__(cls, '_scope_local', local())
+
+  def __call__(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """Create or return the instance of the current thread."""
+    state = getattr(cls._scope_local, 'state', None) # type: ignore[attr-defined]
+    if state is not None and state.instance is not None:
+      return cast(_T, state.instance)
+
+    return cast(_T, ThreadLocalSingletonMeta._create(cls, args, kwargs))
+
+  @classmethod
+  def _get_state(mcs, cls: Type[Any]) -> Optional[ScopeState]:
+    return getattr(cls.__dict__['_scope_local'], 'state', None)
+
+  @classmethod
+  def _set_state(mcs, cls: Type[Any], state: Optional[ScopeState]) -> None:
+    cls.__dict__['_scope_local'].state = state
+
+class ContextSingletonMeta(ScopedSingletonMeta):
+  """
+  Metaclass for Singleton classes holding one instance per `contextvars` context.
+
+  Contexts copied from one holding an instance, such as the asyncio tasks it
+  starts, share that instance until they create their own.
+  """
+  __slots__ = ()
+
+  def __init__(cls, name: str, bases: tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any) -> None:
+    """Initialize the context variable holding the instance."""
+    super().__init__(name, bases, namespace, **kwargs)
+    type.__setattr__(cls, '_scope_var', ContextVar(f'{cls.__qualname__}_singleton', default=None))
+
+  def __call__(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """Create or return the instance of the current context."""
+    state = cls._scope_var.get() # type: ignore[attr-defined]
+    if state is not None and state.instance is not None:
+      return cast(_T, state.instance)
+
+    return cast(_T, ContextSingletonMeta._create(cls, args, kwargs))
+
+  @classmethod
+  def _get_state(mcs, cls: Type[Any]) -> Optional[ScopeState]:
+    return cast(Optional[ScopeState], cls.__dict__['_scope_var'].get())
+
+  @classmethod
+  def _set_state(mcs, cls: Type[Any], state: Optional[ScopeState]) -> None:
+    cls.__dict__['_scope_var'].set(state)
@@ -0,0 +1,121 @@
+"""Module for shared memory Singleton metaclass implementation."""
+from .._utils import ClassRecord, SharedField, SharedSegment
+from .singleton_meta import SingletonMeta
+
+import hashlib
+import os
+from typing import Type, TypeVar, Dict, Iterable, List, Optional, Tuple, Any
+
+_T = TypeVar('_T')
+
+class SharedMemorySingletonMeta(SingletonMeta):
+  """
+  Metaclass for Singleton classes keeping their `SharedField`s in shared memory.
+
+  The first process creating the instance creates the segment, later ones attach
+  to it zero-copy. Each process leaves the segment when its instance is detached,
+  and the last one unlinks it.
+  """
+  __slots__ = ()
+  _class_keywords: Tuple[str, ...] = (*SingletonMeta._class_keywords, 'segment')
+  _restorable = False
+
+  def __init__(
+    cls,
+    name: str,
+    bases: tuple[type, ...],
+    namespace: Dict[str, Any],
+    segment: Optional[str] = None,
+    **kwargs: Any
+  ) -> None:
+    """Lay out the shared fields of the class, named by `segment` or after the class."""
+    super().__init__(name, bases, namespace, **kwargs)
+    fields: Dict[str, SharedField] = {}
+
+    for base in reversed(cls.__mro__):
+      for key, value in vars(base).items():
+        if isinstance(value, SharedField):
+          fields[key] = value
+        else:
+          fields.pop(key, None)
+
+    if not fields:
+      type.__setattr__(cls, '_shared_segment', None)
+      return
+
+    if segment is None:
+      digest = hashlib.sha1(f'{cls.__module__}.{cls.__qualname__}'.encode()).hexdigest()
+      segment = f'singletonize_{digest[:16]}'
+
+    type.__setattr__(cls, '_shared_segment', SharedSegment(segment, fields))
+
+  @classmethod
+  def construct(mcs, cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Attach the segment, then build the object.
+
+    The process creating the segment calls the `init_shared` hook of the object
+    before releasing the segment lock, so other processes never see it uninitialized.
+    """
+    segment: Optional[SharedSegment] = cls.__dict__['_shared_segment']
+
+    if segment is None:
+      return super().construct(cls, *args, **kwargs)
+
+    with segment.lock:
+      attaching = not segment.attached
+      created = segment.attach() if attaching else False
+
+      try:
+        instance = super().construct(cls, *args, **kwargs)
+        init_shared = getattr(instance, 'init_shared', None)
+
+        if created and init_shared is not None:
+          init_shared()
+      except BaseException:
+        if attaching:
+          segment.detach()
+
+        raise
+
+    return instance
+
+  @classmethod
+  def update_state(mcs, cls: Type[_T], instance: _T, changes: Dict[str, Any], removed: Iterable[str] = ()) -> None:
+    """Set and delete attributes of an object with the segment lock held, serializing the writers of every process."""
+    segment: Optional[SharedSegment] = cls.__dict__['_shared_segment']
+
+    if segment is None:
+      super().update_state(cls, instance, changes, removed)
+      return
+
+    # The class lock is taken first, in the order `_remove` takes them.
+    with mcs._locks[cls], segment.lock:
+      super().update_state(cls, instance, changes, removed)
+
+  @classmethod
+  def _remove(mcs, cls: Type[_T]) -> Optional[Tuple[Any, List[Any]]]:
+    """Unregister the instance and leave the segment."""
+    removed = super()._remove(cls)
+    segment: Optional[SharedSegment] = cls.__dict__['_shared_segment']
+
+    if removed is not None and segment is not None:
+      with segment.lock:
+        segment.detach()
+
+    return removed
+
+  @classmethod
+  def _after_fork_in_child(mcs) -> None:
+    """Count the child as attached to inherited segments, unless its class refuses forks."""
+    for cls in ClassRecord.owners():
+      segment: Optional[SharedSegment] = cls.__dict__.get('_shared_segment')
+
+      if segment is None:
+        continue
+
+      keep = cls not in SingletonMeta._fork_blocked
+      segment.after_fork_in_child(keep)
+
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(after_in_child=SharedMemorySingletonMeta._after_fork_in_child)
@@ -1,50 +1,326 @@
 """Module for Singleton metaclasses implementation."""
-from .._utils import InstanceCleaner
+from .._utils import (
+  InstanceCleaner, CleanupScheduler, CleanupStrategy, PendingCreation,
+  DependencyGraph, WarmupResult, WarmupSpec, warmup, RefreshScheduler, RefreshStats, ClassRecord, RecordField, SlotLayout,
+  WarmSnapshot, WarmStartKey, MemoryAccounting, MemoryUsage, ChangeTracker, StateChanges, SingletonStats, StatsSnapshot, STATS_EVENTS, LifecycleHooks, LifecycleEvent, LifecycleEventName,
+  Subscription
+)
 
-from threading import RLock
-from typing import Type, TypeVar, Dict, cast, Any
+import gc
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from threading import RLock, get_ident
+from time import perf_counter
+from typing import Type, TypeVar, Callable, Dict, List, Tuple, Iterable, Iterator, Literal, Mapping, Optional, Union, cast, Any
 from abc import ABCMeta
-from weakref import WeakKeyDictionary, WeakSet
+from weakref import WeakSet
 
 _T = TypeVar('_T')
+ForkPolicy = Literal['inherit', 'recreate-in-child', 'fail']
+FORK_POLICIES: Tuple[ForkPolicy, ...] = ('inherit', 'recreate-in-child', 'fail')
+# Objects walked per class by `memory_report` before it stops.
+MEMORY_WALK_LIMIT = 100_000
 
 class SingletonMeta(type):
   """Metaclass for creating Singleton classes."""
   __slots__ = ()
-  _instances: WeakKeyDictionary[Type[Any], Any] = WeakKeyDictionary()
-  _locks: WeakKeyDictionary[Type[Any], RLock] = WeakKeyDictionary()
-  _refs: Dict[Type[Any], WeakSet[Any]] = {}
+  # Per-class state lives in one record in each class namespace, so no structure is shared between classes.
+  _locks: RecordField[RLock] = RecordField('lock')
+  _refs: RecordField[WeakSet[Any]] = RecordField('refs')
+  _held: RecordField[List[Any]] = RecordField('held')
+  _pending: RecordField[PendingCreation] = RecordField('pending')
+  _dependencies: RecordField[Tuple[Type[Any], ...]] = RecordField('dependencies')
+  _graph_lock = RLock()
+  _fork_blocked: RecordField[bool] = RecordField('fork_blocked')
+  _refresh_stats: RecordField[RefreshStats] = RecordField('refresh_stats')
+  _refresh_args: RecordField[Tuple[Tuple[Any, ...], Dict[str, Any]]] = RecordField('refresh_args')
+  # Borrow counts and instances waiting for their borrowers to retire, by instance id.
+  _borrows: RecordField[Dict[int, int]] = RecordField('borrows')
+  _retiring: RecordField[Dict[int, Any]] = RecordField('retiring')
+  _default_cleanup: CleanupStrategy = 'attributes-only'
+  _class_keywords: Tuple[str, ...] = ('cleanup', 'depends_on', 'fork', 'ttl', 'refresh_ahead', 'grace', 'snapshot', 'slots',
+    'warm_start', 'warm_start_key')
+  # Whether the instance lives in the class slot and is built by `construct`, so it can be refreshed and swapped.
+  _swappable = True
+  # Whether the instance can be restored from a warm-start snapshot instead of running `__init__`.
+  _restorable = True
+
+  def __new__(mcs, name: str, bases: tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any) -> 'SingletonMeta':
+    """Create the class, consuming the singleton class keywords and laying out the slots of `slots` classes."""
+    # Subclasses of slots classes are slots-backed as well.
+    slots = kwargs.get('slots') or any(getattr(base, '_slot_fields', None) is not None for base in bases)
+    fields = SlotLayout.apply(namespace, bases, slots) if slots else None
+
+    for keyword in mcs._class_keywords:
+      kwargs.pop(keyword, None)
+
+    cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    if fields is not None:
+      type.__setattr__(cls, '_slot_fields', fields)
+
+    return cls
+
+  def __init__(
+    cls,
+    name: str,
+    bases: tuple[type, ...],
+    namespace: Dict[str, Any],
+    cleanup: Optional[CleanupStrategy] = None,
+    depends_on: Iterable[Type[Any]] = (),
+    fork: Optional[ForkPolicy] = None,
+    ttl: Optional[float] = None,
+    refresh_ahead: Optional[float] = None,
+    grace: Optional[float] = None,
+    snapshot: bool = False,
+    slots: Union[bool, Iterable[str]] = False,
+    warm_start: Optional[Union[str, 'os.PathLike[str]']] = None,
+    warm_start_key: Optional[WarmStartKey] = None,
+    **kwargs: Any
+  ) -> None:
+    """Initialize the per-class instance slot, creation lock and options."""
+    super().__init__(name, bases, namespace, **kwargs)
+    # Every class owns its slot so a subclass never sees its parent's instance.
+    type.__setattr__(cls, '_singleton_instance', None)
+    ClassRecord.attach(cls).lock = RLock()
+
+    if cleanup is not None:
+      type.__setattr__(cls, '_cleanup_strategy', InstanceCleaner.validate_strategy(cleanup))
+
+    if depends_on:
+      SingletonMeta.add_dependencies(cls, *depends_on)
+
+    if fork is not None:
+      if fork not in FORK_POLICIES:
+        raise ValueError(f'Unknown fork policy {fork!r}, expected one of {FORK_POLICIES}')
+
+      type.__setattr__(cls, '_fork_policy', fork)
+
+    if ttl is not None:
+      if not type(cls)._swappable:
+        raise TypeError(f'{type(cls).__name__} classes do not support ttl')
+
+      if ttl <= 0:
+        raise ValueError(f'ttl must be positive, got {ttl}')
+
+      type.__setattr__(cls, '_ttl', ttl)
+
+    if refresh_ahead is not None:
+      if not 0 < refresh_ahead <= 1:
+        raise ValueError(f'refresh_ahead must be in (0, 1], got {refresh_ahead}')
+
+      type.__setattr__(cls, '_refresh_ahead', refresh_ahead)
+
+    if grace is not None:
+      if grace < 0:
+        raise ValueError(f'grace must not be negative, got {grace}')
+
+      type.__setattr__(cls, '_swap_grace', grace)
+
+    if snapshot:
+      if getattr(cls, '_slot_fields', None) is not None:
+        raise TypeError('Slots singletons do not support snapshot state')
+
+      type.__setattr__(cls, '_snapshot_state', True)
+
+    if warm_start is not None:
+      if not type(cls)._restorable:
+        raise TypeError(f'{type(cls).__name__} classes do not support warm_start')
+
+      if warm_start_key is None:
+        raise ValueError('warm_start requires a warm_start_key identifying the version of the saved state')
+
+      type.__setattr__(cls, '_warm_start', (os.fspath(warm_start), warm_start_key))
 
   def __call__(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
     """Create or return the singleton instance."""
-    if instance := SingletonMeta._instances.get(cls):
-      return cast(_T, instance)
+    instance: _T = cls._singleton_instance # type: ignore[attr-defined]
+    if instance is not None:
+      return instance
+
+    return SingletonMeta._create(cls, args, kwargs)
 
-    instances = SingletonMeta._instances
-    refs = SingletonMeta._refs
-    lock = SingletonMeta._locks.setdefault(cls, RLock())
+  _plain_call = __call__
+
+  def _instrumented_call(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """Create or return the singleton instance, counting lookups and emitting sampled hits."""
+    instance: _T = cls._singleton_instance # type: ignore[attr-defined]
+
+    if SingletonStats.enabled:
+      record = cls.__dict__.get('_singleton_stats') or SingletonStats.record_for(cls)
+
+      if instance is None:
+        record.misses += 1
+      else:
+        record.hits += 1
+
+    if instance is not None:
+      if LifecycleHooks.hits:
+        LifecycleHooks.hit(cls)
+
+      return instance
+
+    return SingletonMeta._create(cls, args, kwargs)
+
+  @classmethod
+  def _create(mcs, cls: Type[_T], args: tuple[Any, ...], kwargs: Dict[str, Any]) -> _T:
+    """
+    Build the instance once while concurrent callers wait on its completion.
+
+    The per-class lock is only held to claim or join the pending creation,
+    never while `__init__` runs or lifecycle handlers are called.
+    """
+    if cls in mcs._fork_blocked:
+      raise RuntimeError(f'{cls.__qualname__} instance was inherited from the parent process and cannot be used after fork')
+
+    lock = mcs._locks[cls]
+    observed = LifecycleHooks.active
+    start = perf_counter() if observed else 0.0
 
     with lock:
-      if cls not in instances:
-        instance = super(SingletonMeta, cast(SingletonMeta, cls)).__call__(*args, **kwargs)
-        instances[cls] = instance
+      waited = perf_counter() - start if observed else 0.0
+      instance = cls.__dict__['_singleton_instance']
+      pending = None if instance is not None else mcs._pending.get(cls)
+      owner = instance is None and pending is None
+
+      if owner:
+        pending = mcs._pending[cls] = PendingCreation()
+
+    if observed:
+      LifecycleHooks.emit('lock_wait', cls, waited)
+
+    if instance is not None:
+      return cast(_T, instance)
+
+    pending = cast(PendingCreation, pending)
+
+    if not owner:
+      if pending.owner == get_ident():
+        raise RuntimeError(f'Recursive construction of singleton {cls.__qualname__}')
+
+      if not observed:
+        return cast(_T, pending.wait())
+
+      start = perf_counter()
+
+      try:
+        return cast(_T, pending.wait())
+      finally:
+        LifecycleHooks.emit('wait', cls, perf_counter() - start)
+
+    if observed:
+      LifecycleHooks.emit('create_start', cls)
+      start = perf_counter()
+
+    try:
+      instance = mcs._restore(cls) if '_warm_start' in cls.__dict__ else None
+
+      if instance is None:
+        instance = type(cls).construct(cls, *args, **kwargs) # type: ignore[attr-defined]
+
+      with lock:
+        try:
+          # A swap may have installed an instance meanwhile, which wins.
+          installed = cls.__dict__['_singleton_instance'] is None
+
+          if installed:
+            mcs._install(cls, instance)
+          else:
+            instance = cls.__dict__['_singleton_instance']
+        finally:
+          del mcs._pending[cls]
+    except BaseException as error:
+      with lock:
+        mcs._pending.pop(cls, None)
+
+      pending.fail(error)
+
+      if observed:
+        LifecycleHooks.emit('create_end', cls, perf_counter() - start, error)
+
+      raise
+
+    pending.complete(instance)
+
+    if observed:
+      LifecycleHooks.emit('create_end', cls, perf_counter() - start)
+
+    if installed and getattr(cls, '_ttl', None) is not None:
+      mcs._refresh_args[cls] = (args, kwargs)
+      mcs._schedule_refresh(cls, failed=False)
+
+    return cast(_T, instance)
+
+  @classmethod
+  def construct(mcs, cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """Build a new object of the class without registering it as the instance."""
+    instance = cast(_T, super(SingletonMeta, cast(SingletonMeta, cls)).__call__(*args, **kwargs))
+    mcs._seal(cls, instance)
+    return instance
+
+  @classmethod
+  def _restore(mcs, cls: Type[_T]) -> Optional[_T]:
+    """Build an object of the class from its warm-start snapshot without calling `__init__`, if the snapshot is current."""
+    path, key = cls.__dict__['_warm_start']
+    instance = cast(_T, cls.__new__(cls)) # type: ignore[call-overload]
+    state = WarmSnapshot.read(path, cls, WarmSnapshot.key_of(key), instance)
+
+    if state is None:
+      return None
+
+    if getattr(cls, '_slot_fields', None) is None:
+      vars(instance).update(state)
+    else:
+      for name, value in state.items():
+        object.__setattr__(instance, name, value)
+
+    mcs._seal(cls, instance)
+    return instance
+
+  @classmethod
+  def save_snapshot(mcs, cls: Type[_T], path: Optional[Union[str, 'os.PathLike[str]']] = None) -> None:
+    """Write the attributes of the instance to the warm-start snapshot of the class, creating the instance if needed."""
+    spec = cls.__dict__.get('_warm_start')
 
-        if cls not in refs:
-          refs[cls] = WeakSet()
+    if spec is None:
+      raise TypeError(f'{cls.__qualname__} declares no warm_start snapshot')
 
-        refs[cls].add(instances[cls])
+    instance = cls()
 
-        SingletonMeta._set_del(instance)
+    # Copied under the class lock so no `update_instance` is half applied, leaving out what `_install` sets.
+    with mcs._locks[cls]:
+      state = {name: value for name, value in SlotLayout.attributes(instance).items() if name not in ('_updating', '__del__')}
 
-      return cast(_T, instances[cls])
+    WarmSnapshot.write(os.fspath(path) if path is not None else spec[0], cls, WarmSnapshot.key_of(spec[1]), instance, state)
+
+  @classmethod
+  def _seal(mcs, cls: Type[_T], instance: _T) -> None:
+    """Make the public fields of a built slots object read-only outside of updates."""
+    if getattr(cls, '_slot_fields', None) is not None:
+      object.__setattr__(instance, '_updating', False)
+
+  @classmethod
+  def _install(mcs, cls: Type[_T], instance: _T) -> None:
+    """Register a constructed instance; the caller holds the class lock."""
+    mcs._set_del(instance)
+    type.__setattr__(cls, '_singleton_instance', instance)
 
   @classmethod
   def _set_del(mcs, cls: Type[_T]) -> None:
+    # Written straight into the instance dict so `BaseSingleton.__setattr__` cannot reject it.
+    namespace = getattr(cls, '__dict__', None)
+
+    # The published dicts of `snapshot` objects are never mutated, and hold only their attributes.
+    if not isinstance(namespace, dict) or getattr(type(cls), '_snapshot_state', False):
+      return
+
     if not hasattr(cls, '__del__'):
       def base_del(self: Type[_T]) -> None:
         SingletonMeta.detach(cast(Type[_T], type(self)))
 
-      setattr(cls, '__del__', base_del.__get__(cls))
+      namespace['__del__'] = base_del.__get__(cls)
     else:
       original_del = getattr(cls, '__del__').__get__(cls)
 
@@ -52,32 +328,655 @@ class SingletonMeta(type):
         original_del()
         SingletonMeta.detach(cast(Type[_T], type(self)))
 
-      setattr(cls, '__del__', enhanced_del.__get__(cls))
+      namespace['__del__'] = enhanced_del.__get__(cls)
 
   @classmethod
   def get_instance_or_none(mcs, cls: Type[_T]) -> _T | None:
     """Get the instance of the Singleton class."""
-    return mcs._instances.get(cls)
+    return cast(_T | None, cls.__dict__.get('_singleton_instance'))
 
   @classmethod
   def has_instance(mcs, cls: Type[_T]) -> bool:
     """Check if the Singleton class has an instance."""
-    return cls in mcs._instances
+    return cls.__dict__.get('_singleton_instance') is not None
+
+  @classmethod
+  def update_state(mcs, cls: Type[_T], instance: _T, changes: Dict[str, Any], removed: Iterable[str] = ()) -> None:
+    """
+    Set and delete attributes of an object, serialized with the other writers of the class.
+
+    Objects of `snapshot` classes never have their attribute dict mutated: a copy
+    with the changes applied is published in a single store, so lock-free readers
+    see either version whole.
+    """
+    with mcs._locks[cls]:
+      tracker: Optional[ChangeTracker] = cls.__dict__.get('_singleton_changes')
+
+      if getattr(cls, '_snapshot_state', False):
+        state = dict(vars(instance))
+        state.update(changes)
+
+        for key in removed:
+          del state[key]
+
+        object.__setattr__(instance, '__dict__', state)
+
+        if tracker is not None:
+          tracker.record(instance, changes, removed)
+
+        return
+
+      # The flag lets `BaseSingleton.__setattr__` replace existing attributes.
+      object.__setattr__(instance, '_updating', True)
+
+      try:
+        for key, value in changes.items():
+          setattr(instance, key, value)
+
+        for key in removed:
+          delattr(instance, key)
+      finally:
+        object.__setattr__(instance, '_updating', False)
+        # Deletions are recorded by `BaseSingleton.__delattr__`.
+        if tracker is not None:
+          tracker.record(instance, changes)
+
+  @classmethod
+  def record_changes(mcs, cls: Type[_T], instance: _T, changed: Iterable[str], removed: Iterable[str] = ()) -> None:
+    """Record attributes of an object set or deleted outside of `update_state`, if the changes of its class are tracked."""
+    tracker: Optional[ChangeTracker] = cls.__dict__.get('_singleton_changes')
+
+    if tracker is not None:
+      with mcs._locks[cls]:
+        tracker.record(instance, changed, removed)
+
+  @classmethod
+  def changes_since(mcs, cls: Type[_T], instance: Optional[_T], version: int) -> StateChanges:
+    """Get the public attributes of an object of the class changed after a version, tracking the class from now on."""
+    with mcs._locks[cls]:
+      tracker = ChangeTracker.for_class(cls)
+
+      if instance is None:
+        return StateChanges(tracker.version, {}, (), True)
+
+      return tracker.changes_since(instance, version)
+
+  @classmethod
+  def set_cleanup_strategy(mcs, strategy: CleanupStrategy) -> None:
+    """Set the cleanup strategy used by classes that do not declare their own."""
+    SingletonMeta._default_cleanup = InstanceCleaner.validate_strategy(strategy)
+
+  @classmethod
+  def get_cleanup_strategy(mcs, cls: Type[_T]) -> CleanupStrategy:
+    """Get the cleanup strategy applied when the class instance is detached."""
+    return cast(CleanupStrategy, getattr(cls, '_cleanup_strategy', None) or SingletonMeta._default_cleanup)
+
+  @classmethod
+  def track(mcs, cls: Type[_T], holder: object) -> None:
+    """
+    Register an object holding the instance so `tracked` cleanup releases its references.
+
+    Objects are tracked weakly. Dicts, lists and sets cannot be weakly referenced,
+    so they are kept until the instance is detached.
+    """
+    if isinstance(holder, (dict, list, set)):
+      with mcs._locks[cls]:
+        mcs._held.setdefault(cls, []).append(holder)
+
+      return
+
+    try:
+      with mcs._locks[cls]:
+        mcs._refs.setdefault(cls, WeakSet()).add(holder)
+    except TypeError:
+      raise TypeError(
+        f'Cannot track {type(holder).__name__} holder: it must support weak references '
+        'or be a dict, list or set'
+      ) from None
+
+  @classmethod
+  def flush_cleanup(mcs, timeout: Optional[float] = None) -> bool:
+    """Wait for the background cleanup of every detached instance, False on timeout."""
+    return CleanupScheduler.flush(timeout)
+
+  @classmethod
+  def add_dependencies(mcs, cls: Type[_T], *dependencies: Type[Any]) -> None:
+    """
+    Declare singleton classes the class depends on.
+
+    Raises TypeError if a dependency is not a Singleton class or closes a cycle.
+    """
+    for dependency in dependencies:
+      if not isinstance(dependency, SingletonMeta):
+        raise TypeError(f'{cls.__qualname__} can only depend on Singleton classes, got {dependency!r}')
+
+    with mcs._graph_lock:
+      previous = mcs._dependencies.get(cls, ())
+      mcs._dependencies[cls] = tuple(dict.fromkeys((*previous, *dependencies)))
+      cycle = DependencyGraph.find_cycle(mcs._dependencies, cls)
+
+      if cycle is not None:
+        if previous:
+          mcs._dependencies[cls] = previous
+        else:
+          del mcs._dependencies[cls]
+
+        raise TypeError(f'Dependency cycle: {" -> ".join(node.__qualname__ for node in cycle)}')
+
+  @classmethod
+  def get_dependencies(mcs, cls: Type[_T]) -> Tuple[Type[Any], ...]:
+    """Get the classes the class directly depends on."""
+    return mcs._dependencies.get(cls, ())
+
+  @classmethod
+  def initialize(
+    mcs,
+    specs: Iterable[WarmupSpec],
+    max_workers: Optional[int] = None
+  ) -> Dict[Type[Any], WarmupResult]:
+    """
+    Create the classes and their dependencies level by level, in parallel within a level.
+
+    Dependencies that are not listed are created without arguments. A class whose
+    dependency failed is skipped and reported with a RuntimeError.
+    """
+    by_class = {spec if isinstance(spec, type) else spec[0]: spec for spec in specs}
+    classes = DependencyGraph.closure(mcs._dependencies, by_class)
+    results: Dict[Type[Any], WarmupResult] = {}
+
+    for level in DependencyGraph.levels(mcs._dependencies, classes):
+      ready: List[WarmupSpec] = []
+
+      for cls in level:
+        failed = [dep for dep in mcs.get_dependencies(cls) if results[dep].error is not None]
+
+        if failed:
+          error = RuntimeError(f'{cls.__qualname__} skipped, dependency {failed[0].__qualname__} failed')
+          results[cls] = WarmupResult(None, 0.0, error)
+        else:
+          ready.append(by_class.get(cls, cls))
+
+      results.update(warmup(ready, max_workers))
+
+    return results
+
+  @classmethod
+  def shutdown(
+    mcs,
+    classes: Optional[Iterable[Type[Any]]] = None,
+    max_workers: Optional[int] = None
+  ) -> Dict[Type[Any], Optional[BaseException]]:
+    """
+    Detach live instances dependents first, level by level, in parallel within a level.
+
+    Live dependents of the given classes are detached as well.
+    Defaults to every live instance.
+    """
+    targets = mcs._locks.keys() if classes is None else list(classes)
+    live = [cls for cls in DependencyGraph.dependents(mcs._dependencies, targets) if mcs.has_instance(cls)]
+    errors: Dict[Type[Any], Optional[BaseException]] = {}
+
+    def detach(cls: Type[Any]) -> Optional[BaseException]:
+      try:
+        mcs.detach(cls)
+      except Exception as error:
+        return error
+
+      return None
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(live), 1), thread_name_prefix='singletonize-shutdown') as executor:
+      for level in reversed(DependencyGraph.levels(mcs._dependencies, live)):
+        errors.update(zip(level, executor.map(detach, level)))
+
+    return errors
+
+  @classmethod
+  def live_singletons(mcs, base: Optional[Type[Any]] = None, module: Optional[str] = None) -> List[Type[Any]]:
+    """
+    Get the classes with a live instance, optionally only the subclasses of `base`.
+
+    `module` keeps the classes defined in that module or in its submodules.
+    """
+    classes: List[Type[Any]] = []
+
+    for cls in mcs._locks.keys():
+      if base is not None and not issubclass(cls, base):
+        continue
+
+      if module is not None and cls.__module__ != module and not cls.__module__.startswith(f'{module}.'):
+        continue
+
+      if type(cls).live_instances(cls):
+        classes.append(cls)
+
+    return classes
+
+  @classmethod
+  def detach_all(
+    mcs,
+    classes: Optional[Iterable[Type[Any]]] = None,
+    base: Optional[Type[Any]] = None,
+    module: Optional[str] = None
+  ) -> List[Type[Any]]:
+    """
+    Detach the instances of many classes at once, cleaning them up in a single background pass.
+
+    Defaults to the `live_singletons` matching `base` and `module`. The class locks
+    are all taken, in one global order, while the instances are unregistered, so
+    no caller sees some of them detached and others not. Their cleanups are then
+    queued together and share one referrer scan and one collection.
+    Returns the classes whose instances were detached, dependents first.
+    """
+    targets = mcs.live_singletons(base, module) if classes is None else list(dict.fromkeys(classes))
+    # Ordering by id gives every bulk operation the same lock order, and other operations hold one class lock at most.
+    locks = sorted({id(lock): lock for lock in (mcs._locks[cls] for cls in targets)}.items())
+    removed: List[Tuple[Type[Any], Tuple[Any, List[Any]]]] = []
+
+    with ExitStack() as stack:
+      for _, lock in locks:
+        stack.enter_context(lock)
+
+      for level in reversed(DependencyGraph.levels(mcs._dependencies, targets)):
+        for cls in level:
+          entry = type(cls)._remove(cls)
+
+          if entry is not None:
+            removed.append((cls, entry))
+
+    with CleanupScheduler.batch():
+      for cls, entry in removed:
+        if LifecycleHooks.active:
+          LifecycleHooks.emit('detach', cls)
+
+        type(cls)._release(cls, *entry)
+
+    return [cls for cls, _ in removed]
+
+  @classmethod
+  def reset_many(
+    mcs,
+    specs: Union[Mapping[Type[Any], Tuple[Any, ...]], Iterable[WarmupSpec]],
+    max_workers: Optional[int] = None
+  ) -> Dict[Type[Any], WarmupResult]:
+    """
+    Reset many classes at once: detach them with `detach_all`, then create them again with `initialize`.
+
+    Specs are a mapping of classes to their arguments, or `initialize` specs.
+    Every instance of a Multiton class is detached.
+    """
+    if isinstance(specs, Mapping):
+      specs = [(cls, tuple(args)) for cls, args in specs.items()]
+
+    specs = list(specs)
+    classes = [spec if isinstance(spec, type) else spec[0] for spec in specs]
+
+    if LifecycleHooks.active:
+      for cls in classes:
+        LifecycleHooks.emit('reset', cls)
+
+    mcs.detach_all(classes)
+    return mcs.initialize(specs, max_workers)
+
+  @classmethod
+  def detach(mcs, cls: Type[_T], cascade: bool = False) -> None:
+    """
+    Detach the instance of the Singleton class, cleaning it up in the background.
+
+    With `cascade`, live dependents are detached first.
+    """
+    if cascade:
+      mcs.shutdown([cls])
+      return
+
+    removed = type(cls)._remove(cls) # type: ignore[attr-defined]
+
+    if removed is not None:
+      if LifecycleHooks.active:
+        LifecycleHooks.emit('detach', cls)
+
+      type(cls)._release(cls, *removed) # type: ignore[attr-defined]
+
+  @classmethod
+  def _remove(mcs, cls: Type[_T]) -> Optional[Tuple[Any, List[Any]]]:
+    """Unregister the instance, returning it with its tracked holders."""
+    with mcs._locks[cls]:
+      instance = cls.__dict__['_singleton_instance']
+
+      if instance is None:
+        return None
+
+      type.__setattr__(cls, '_singleton_instance', None)
+
+      if mcs._refresh_args.pop(cls, None) is not None:
+        RefreshScheduler.cancel(cls)
+
+      return instance, [*mcs._refs.pop(cls, ()), *mcs._held.pop(cls, ())]
+
+  @classmethod
+  def _swap(mcs, cls: Type[_T], instance: _T) -> Any:
+    """
+    Install a new instance in place of the current one, returning the previous one.
+
+    Holders tracked for the previous instance are forgotten, not cleared, since it stays usable.
+    The caller holds the class lock. Lock-free readers see either instance, never none.
+    """
+    previous = cls.__dict__['_singleton_instance']
+    mcs._refs.pop(cls, None)
+    mcs._held.pop(cls, None)
+    mcs._install(cls, instance)
+    return previous
+
+  @classmethod
+  def _release(mcs, cls: Type[_T], instance: Any, tracked: List[Any]) -> None:
+    """Schedule the cleanup of an unregistered instance."""
+    CleanupScheduler.schedule(instance, mcs.get_cleanup_strategy(cls), tracked)
+
+  @classmethod
+  def get_refresh_stats(mcs, cls: Type[_T]) -> RefreshStats:
+    """Get the number, latency and last error of the background refreshes of the class."""
+    return mcs._refresh_stats.get(cls) or RefreshStats(0, 0, None, None)
+
+  @classmethod
+  def _schedule_refresh(mcs, cls: Type[_T], failed: bool) -> None:
+    """Schedule the next refresh ahead of expiry, or a retry after a failed refresh."""
+    ttl: float = getattr(cls, '_ttl')
+    ahead: float = getattr(cls, '_refresh_ahead', 0.8)
+    delay = max(ttl * (1 - ahead), ttl / 10) if failed else ttl * ahead
+    RefreshScheduler.schedule(cls, delay, partial(mcs._refresh, cls))
+
+  @classmethod
+  def _refresh(mcs, cls: Type[_T]) -> None:
+    """
+    Build a replacement off the hot path, then swap it in.
+
+    Callers keep getting the current instance while the replacement is built,
+    and for as long as refreshes fail.
+    """
+    current = cls.__dict__['_singleton_instance']
+    spec = mcs._refresh_args.get(cls)
+
+    if current is None or spec is None:
+      return
+
+    args, kwargs = spec
+    stats = mcs.get_refresh_stats(cls)
+    start = perf_counter()
+
+    try:
+      instance = mcs._restore(cls) if '_warm_start' in cls.__dict__ else None
+
+      if instance is None:
+        instance = type(cls).construct(cls, *args, **kwargs) # type: ignore[attr-defined]
+    except Exception as error:
+      mcs._refresh_stats[cls] = stats._replace(failures=stats.failures + 1, last_duration=perf_counter() - start, last_error=error)
+      mcs._schedule_refresh(cls, failed=True)
+      return
+
+    duration = perf_counter() - start
+
+    with mcs._locks[cls]:
+      # Detached or replaced meanwhile: the replacement is dropped.
+      if cls.__dict__['_singleton_instance'] is not current:
+        return
+
+      previous = mcs._swap(cls, instance)
+
+    mcs._refresh_stats[cls] = stats._replace(refreshes=stats.refreshes + 1, last_duration=duration, last_error=None)
+    mcs._schedule_refresh(cls, failed=False)
+
+    if LifecycleHooks.active:
+      LifecycleHooks.emit('swap', cls, duration)
+
+    mcs._retire(cls, previous)
+
+  @classmethod
+  def swap(mcs, cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Replace the instance without a window where callers see none or block.
+
+    The replacement is built outside the class lock and installed in one store.
+    The previous instance is never cleaned up: callers holding it keep using it.
+    The registry drops it after the `grace` period of the class, once every
+    `borrow` of it has ended.
+    """
+    if not type(cls)._swappable:
+      raise TypeError(f'{type(cls).__name__} classes do not support swapping')
+
+    start = perf_counter()
+    instance = type(cls).construct(cls, *args, **kwargs) # type: ignore[attr-defined]
+    duration = perf_counter() - start
+
+    with mcs._locks[cls]:
+      previous = mcs._swap(cls, instance)
+
+      if getattr(cls, '_ttl', None) is not None:
+        mcs._refresh_args[cls] = (args, kwargs)
+        mcs._schedule_refresh(cls, failed=False)
+
+    if LifecycleHooks.active:
+      LifecycleHooks.emit('swap', cls, duration)
+
+    if previous is not None:
+      mcs._retire(cls, previous)
+
+    return instance
+
+  @classmethod
+  @contextmanager
+  def borrow(mcs, cls: Type[_T], *args: Any, **kwargs: Any) -> Iterator[_T]:
+    """Use the current instance, which the registry keeps referenced until the block exits."""
+    if not type(cls)._swappable:
+      raise TypeError(f'{type(cls).__name__} classes do not support swapping')
+
+    while True:
+      with mcs._locks[cls]:
+        instance = cls.__dict__['_singleton_instance']
+
+        if instance is not None:
+          key = id(instance)
+          borrows = mcs._borrows.setdefault(cls, {})
+          borrows[key] = borrows.get(key, 0) + 1
+          break
+
+      cls(*args, **kwargs)
+
+    try:
+      yield cast(_T, instance)
+    finally:
+      # Looked up again, a fork in between replaces the lock.
+      with mcs._locks[cls]:
+        count = borrows.pop(key) - 1
+
+        if count:
+          borrows[key] = count
+        else:
+          # The last borrow ends: the registry drops a retired instance.
+          mcs._retiring.get(cls, {}).pop(key, None)
 
   @classmethod
-  def detach(mcs, cls: Type[_T]) -> None:
-    """Detach the instance of the Singleton class."""
-    with mcs._locks.setdefault(cls, RLock()):
-      if instance := mcs._instances.get(cls):
-        mcs._instances.pop(cls, None)
+  def _retire(mcs, cls: Type[_T], instance: Any) -> None:
+    """
+    Drop the references of the registry to a replaced instance once its grace period has passed.
+
+    The instance is never cleaned up: callers still holding it keep using it,
+    and it is freed by the last of them.
+    """
+    grace: float = getattr(cls, '_swap_grace', 0.0)
+
+    if grace:
+      RefreshScheduler.schedule(object(), grace, partial(mcs._retire_unborrowed, cls, instance))
+    else:
+      mcs._retire_unborrowed(cls, instance)
+
+  @classmethod
+  def _retire_unborrowed(mcs, cls: Type[_T], instance: Any) -> None:
+    """Drop a replaced instance now, or keep it until its last borrow ends."""
+    with mcs._locks[cls]:
+      key = id(instance)
+
+      if mcs._borrows.get(cls, {}).get(key):
+        mcs._retiring.setdefault(cls, {})[key] = instance
+
+  @classmethod
+  def subscribe(
+    mcs,
+    handler: Callable[[LifecycleEvent], None],
+    events: Optional[Iterable[LifecycleEventName]] = None,
+    sample_rate: float = 1.0
+  ) -> Subscription:
+    """
+    Call a handler on lifecycle events, delivering `sample_rate` of the `hit` events.
+
+    Subscribing to `hit` events switches lookups through `SingletonMeta` to an
+    instrumented `__call__` until no subscriber is left.
+    """
+    subscription = LifecycleHooks.subscribe(handler, events, sample_rate)
+    mcs._select_call()
+    return subscription
+
+  @classmethod
+  def unsubscribe(mcs, subscription: Subscription) -> None:
+    """Stop calling a handler registered with `subscribe`."""
+    LifecycleHooks.unsubscribe(subscription)
+    mcs._select_call()
+
+  @classmethod
+  def enable_stats(mcs) -> None:
+    """
+    Start recording per-class usage statistics.
+
+    Lookups through `SingletonMeta` switch to an instrumented `__call__` counting
+    hits and misses, so the regular lookup pays nothing while statistics are disabled.
+    """
+    if not SingletonStats.enabled:
+      SingletonStats.enabled = True
+      type.__setattr__(SingletonStats, 'subscription', LifecycleHooks.subscribe(SingletonStats.observe, STATS_EVENTS))
+      mcs._select_call()
+
+  @classmethod
+  def disable_stats(mcs) -> None:
+    """Stop recording statistics, keeping those recorded so far."""
+    if SingletonStats.enabled:
+      SingletonStats.enabled = False
+      LifecycleHooks.unsubscribe(getattr(SingletonStats, 'subscription'))
+      mcs._select_call()
+
+  @classmethod
+  def _select_call(mcs) -> None:
+    """Install the instrumented lookup only while statistics or `hit` subscribers need it."""
+    instrumented = SingletonStats.enabled or LifecycleHooks.hits
+    call = SingletonMeta._instrumented_call if instrumented else SingletonMeta._plain_call
+    type.__setattr__(SingletonMeta, '__call__', call)
+
+  @classmethod
+  def stats(mcs) -> Dict[Type[Any], StatsSnapshot]:
+    """Get a snapshot of the statistics of every class used while recording."""
+    return SingletonStats.snapshot()
+
+  @classmethod
+  def reset_stats(mcs) -> None:
+    """Discard the statistics recorded so far."""
+    SingletonStats.reset()
+
+  @classmethod
+  def live_instances(mcs, cls: Type[_T]) -> List[_T]:
+    """Get the live instances of the class."""
+    instance = cls.__dict__.get('_singleton_instance')
+    return [] if instance is None else [instance]
+
+  @classmethod
+  def memory_report(mcs, max_objects: int = MEMORY_WALK_LIMIT) -> Dict[Type[Any], MemoryUsage]:
+    """
+    Measure the memory reachable from the live instances of every class, largest first.
+
+    Each report is a sample of the size history, which flags the classes whose
+    size kept increasing over the last samples.
+    """
+    report: Dict[Type[Any], MemoryUsage] = {}
+
+    for cls in mcs._locks.keys():
+      instances = type(cls).live_instances(cls)
+
+      if instances:
+        report[cls] = MemoryAccounting.measure(cls, instances, max_objects)
+
+    return dict(sorted(report.items(), key=lambda item: item[1].bytes, reverse=True))
+
+  @classmethod
+  def start_memory_sampling(
+    mcs,
+    interval: float,
+    on_growth: Optional[Callable[[Type[Any], MemoryUsage], None]] = None,
+    max_objects: int = MEMORY_WALK_LIMIT
+  ) -> None:
+    """
+    Take a `memory_report` every `interval` seconds on a background thread.
+
+    `on_growth` is called on that thread for every class flagged as growing.
+    Starting again replaces the previous sampler.
+    """
+    if interval <= 0:
+      raise ValueError(f'interval must be positive, got {interval}')
+
+    def sample() -> None:
+      for cls, usage in mcs.memory_report(max_objects).items():
+        if usage.growing and on_growth is not None:
+          on_growth(cls, usage)
+
+    MemoryAccounting.start_sampling(interval, sample)
+
+  @classmethod
+  def stop_memory_sampling(mcs) -> None:
+    """Stop the background memory sampler, keeping the size history."""
+    MemoryAccounting.stop_sampling()
+
+  @classmethod
+  def get_fork_policy(mcs, cls: Type[_T]) -> ForkPolicy:
+    """Get what a forked child process does with the inherited instance of the class."""
+    return cast(ForkPolicy, getattr(cls, '_fork_policy', 'inherit'))
+
+  @classmethod
+  def prefork(mcs, specs: Iterable[WarmupSpec], max_workers: Optional[int] = None) -> Dict[Type[Any], WarmupResult]:
+    """
+    Warm up singletons in the parent process, then freeze the heap before forking workers.
+
+    Frozen objects are ignored by the garbage collector, so children inheriting the
+    instances keep sharing their memory pages copy-on-write.
+    """
+    results = mcs.initialize(specs, max_workers)
+    gc.collect()
+    gc.freeze()
+    return results
+
+  @classmethod
+  def _after_fork_in_child(mcs) -> None:
+    """Replace locks possibly held by parent threads and apply the fork policies."""
+    SingletonMeta._graph_lock = RLock()
+    SingletonMeta._pending.clear()
+
+    for cls in SingletonMeta._locks.keys():
+      SingletonMeta._locks[cls] = RLock()
+
+      if cls.__dict__['_singleton_instance'] is None:
+        continue
+
+      policy = SingletonMeta.get_fork_policy(cls)
+
+      if policy == 'inherit':
+        # The refresh worker did not survive the fork.
+        if cls in SingletonMeta._refresh_args:
+          SingletonMeta._schedule_refresh(cls, failed=False)
+
+        continue
 
-        if cls in mcs._refs:
-          mcs._refs[cls].clear()
-          del mcs._refs[cls]
+      # The inherited instance may share sockets or files with the parent, so it is dropped without cleanup.
+      SingletonMeta._remove(cls)
 
-        InstanceCleaner.cleanup(instance)
+      if policy == 'fail':
+        SingletonMeta._fork_blocked[cls] = True
 
-        mcs._locks.pop(cls, None)
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(after_in_child=SingletonMeta._after_fork_in_child)
 
 class SingletonABCMeta(SingletonMeta, ABCMeta):
   """Metaclass for creating abstract Singleton classes."""
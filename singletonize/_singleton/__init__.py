@@ -1,4 +1,11 @@
-__all__ = ['Singleton', 'SingletonABC']
+__all__ = ['Singleton', 'SingletonABC', 'AsyncSingleton', 'AsyncSingletonABC', 'SharedMemorySingleton',
+  'ThreadLocalSingleton', 'ContextSingleton', 'Multiton']
 
 from .singleton import Singleton
 from .singleton_abc import SingletonABC
+from .async_singleton import AsyncSingleton
+from .async_singleton_abc import AsyncSingletonABC
+from .shared_memory_singleton import SharedMemorySingleton
+from .thread_local_singleton import ThreadLocalSingleton
+from .context_singleton import ContextSingleton
+from .multiton import Multiton
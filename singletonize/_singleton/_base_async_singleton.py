@@ -0,0 +1,66 @@
+"""Base abstract class for all asynchronous Singleton implementations."""
+from .._metaclasses import AsyncSingletonMeta
+from ._base_singleton import BaseSingleton
+
+from typing import Type, TypeVar, Any
+
+_T = TypeVar('_T', bound='BaseAsyncSingleton')
+
+class BaseAsyncSingleton(BaseSingleton):
+  """Abstract base class containing common asynchronous Singleton functionality."""
+  __slots__ = ()
+
+  @classmethod
+  async def acreate(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Async factory hook building the singleton instance.
+
+    Override it to await the resources the instance needs, calling
+    `super().acreate(...)` to build the object itself.
+
+    :param args: Positional arguments for instance creation
+    :param kwargs: Keyword arguments for instance creation
+    :return _T: The new, not yet registered, instance
+    """
+    return AsyncSingletonMeta.construct(cls, *args, **kwargs)
+
+  async def aclose(self) -> None:
+    """
+    Async teardown hook awaited by `adetach` before the instance is cleaned up.
+
+    :return None: No return value
+    """
+
+  @classmethod
+  async def aget_instance(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Get or create the singleton instance.
+
+    Concurrent callers await the same creation, and a creation failure is raised to all of them.
+
+    :param args: Positional arguments for instance creation
+    :param kwargs: Keyword arguments for instance creation
+    :return _T: The singleton instance
+    """
+    return await AsyncSingletonMeta.aget_instance(cls, args, kwargs)
+
+  @classmethod
+  async def adetach(cls) -> None:
+    """
+    Remove the singleton instance after awaiting its `aclose` hook.
+
+    :return None: No return value
+    """
+    await AsyncSingletonMeta.adetach(cls)
+
+  @classmethod
+  async def areset_instance(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Reset the singleton instance with new parameters.
+
+    :param args: Positional arguments for new instance creation
+    :param kwargs: Keyword arguments for new instance creation
+    :return _T: The new singleton instance
+    """
+    await cls.adetach()
+    return await cls.aget_instance(*args, **kwargs)
@@ -0,0 +1,19 @@
+"""Base abstract class for Singleton implementations holding one instance per scope."""
+from ._base_singleton import BaseSingleton
+
+from typing import ContextManager
+
+class BaseScopedSingleton(BaseSingleton):
+  """Abstract base class containing common scoped Singleton functionality."""
+  __slots__ = ()
+
+  @classmethod
+  def scope(cls) -> ContextManager[None]:
+    """
+    Run a block with its own instance, detached when the block exits.
+
+    The instance of the enclosing scope is restored afterwards.
+
+    :return ContextManager[None]: Context manager delimiting the scope
+    """
+    return type(cls).scope(cls) # type: ignore[attr-defined, no-any-return]
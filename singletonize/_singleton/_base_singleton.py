@@ -1,7 +1,10 @@
 """Base abstract class for all Singleton implementations."""
-from .._metaclasses import SingletonMeta
+from .._utils import UntouchedLazyProxy, RefreshStats, LifecycleHooks, SlotLayout, StateSerializer, StateChanges
 
-from typing import Type, TypeVar, Dict, Any
+import os
+import sys
+from types import MappingProxyType
+from typing import Type, TypeVar, ContextManager, Dict, Mapping, Optional, Union, cast, Any
 
 _T = TypeVar('_T', bound='BaseSingleton')
 
@@ -15,6 +18,8 @@ class BaseSingleton():
 
     If the instance is being updated, it allows modification.
     Otherwise, it prevents setting new attributes dynamically.
+    Instances of `snapshot` classes publish a copy of their attributes instead
+    of mutating them in place.
 
     :param key: Attribute name
     :param value: Attribute value
@@ -25,8 +30,24 @@ class BaseSingleton():
       super().__setattr__(key, value)
     elif hasattr(self, key):
       raise AttributeError(f'Cannot set attribute {key} on singleton instance')
+    elif getattr(type(self), '_snapshot_state', False):
+      type(type(self)).update_state(type(self), self, {key: value}) # type: ignore[attr-defined]
     else:
       super().__setattr__(key, value)
+      type(type(self)).record_changes(type(self), self, (key,)) # type: ignore[attr-defined]
+
+  def __delattr__(self, key: str) -> None:
+    """
+    Delete an attribute of the singleton instance, publishing a copy of the attributes for `snapshot` classes.
+
+    :param key: Attribute name
+    :return None: No return value
+    """
+    if getattr(type(self), '_snapshot_state', False) and key in vars(self):
+      type(type(self)).update_state(type(self), self, {}, (key,)) # type: ignore[attr-defined]
+    else:
+      super().__delattr__(key)
+      type(type(self)).record_changes(type(self), self, (), (key,)) # type: ignore[attr-defined]
 
   @classmethod
   def get_instance(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
@@ -39,6 +60,21 @@ class BaseSingleton():
     """
     return cls(*args, **kwargs)
 
+  @classmethod
+  def lazy(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Return a proxy that creates the singleton instance on first use.
+
+    After that, the proxy forwards every access to the current instance.
+
+    :param args: Positional arguments for instance creation
+    :param kwargs: Keyword arguments for instance creation
+    :return _T: A proxy standing in for the singleton instance
+    """
+    frame = sys._getframe(1)
+    location = f'{frame.f_code.co_filename}:{frame.f_lineno}'
+    return cast(_T, UntouchedLazyProxy(cls, args, kwargs, location))
+
   @classmethod
   def has_instance(cls: Type[_T]) -> bool:
     """
@@ -46,29 +82,89 @@ class BaseSingleton():
 
     :return bool: True if an instance exists, otherwise False
     """
-    return SingletonMeta.has_instance(cls)
+    return type(cls).has_instance(cls) # type: ignore[attr-defined]
 
   @classmethod
-  def detach(cls) -> None:
+  def detach(cls, cascade: bool = False) -> None:
     """
     Remove the singleton instance, allowing a new instance to be created.
 
+    The instance is removed from the registry before returning, while its cleanup
+    runs later on a background thread. Use `singletonize.flush_cleanup()` to wait for it.
+
+    :param cascade: Whether to detach the live instances depending on this one first
+    :return None: No return value
+    """
+    type(cls).detach(cls, cascade) # type: ignore[attr-defined]
+
+  @classmethod
+  def track(cls, holder: object) -> None:
+    """
+    Register an object holding the instance, released when it is detached.
+
+    Only classes using the `tracked` cleanup strategy release tracked holders.
+
+    :param holder: Object, dict, list or set holding a reference to the instance
     :return None: No return value
+    :raises TypeError: If the holder cannot be tracked
+    """
+    type(cls).track(cls, holder) # type: ignore[attr-defined]
+
+  @classmethod
+  def refresh_stats(cls) -> RefreshStats:
     """
-    SingletonMeta.detach(cls)
+    Return the outcome of the background refreshes of a class declared with a `ttl`.
+
+    :return RefreshStats: Refresh and failure counts, last refresh duration and last error
+    """
+    return type(cls).get_refresh_stats(cls) # type: ignore[attr-defined, no-any-return]
 
   @classmethod
   def reset_instance(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
     """
     Reset the singleton instance with new parameters.
 
+    The previous instance is detached and cleaned up on a background thread.
+    Callers arriving meanwhile build the new instance, use `swap_instance` to
+    replace a live instance without that window.
+
     :param args: Positional arguments for new instance creation
     :param kwargs: Keyword arguments for new instance creation
     :return _T: The new singleton instance
     """
+    if LifecycleHooks.active:
+      LifecycleHooks.emit('reset', cls)
+
     cls.detach()
     return cls.get_instance(*args, **kwargs)
 
+  @classmethod
+  def swap_instance(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Replace the singleton instance atomically with one built from new parameters.
+
+    Callers keep getting the previous instance until the new one is installed.
+    The previous instance is never cleaned up, so callers holding it keep using it.
+    The registry drops it after the `grace` period of the class, once every
+    `borrow` of it has ended, and the last holder frees it.
+
+    :param args: Positional arguments for new instance creation
+    :param kwargs: Keyword arguments for new instance creation
+    :return _T: The new singleton instance
+    """
+    return type(cls).swap(cls, *args, **kwargs) # type: ignore[attr-defined, no-any-return]
+
+  @classmethod
+  def borrow(cls: Type[_T], *args: Any, **kwargs: Any) -> ContextManager[_T]:
+    """
+    Use the singleton instance in a block, during which the registry keeps it even if a swap replaces it.
+
+    :param args: Positional arguments for instance creation, if it does not exist
+    :param kwargs: Keyword arguments for instance creation, if it does not exist
+    :return ContextManager[_T]: Context manager yielding the instance
+    """
+    return type(cls).borrow(cls, *args, **kwargs) # type: ignore[attr-defined, no-any-return]
+
   @classmethod
   def get_instance_or_none(cls: Type[_T]) -> _T | None:
     """
@@ -77,7 +173,7 @@ class BaseSingleton():
     :return _T: Singleton instance or None if not created
     :return None: No return value
     """
-    return SingletonMeta.get_instance_or_none(cls)
+    return type(cls).get_instance_or_none(cls) # type: ignore[attr-defined]
 
   @classmethod
   def is_instance(cls: Type[_T], obj: object) -> bool:
@@ -94,26 +190,89 @@ class BaseSingleton():
     """
     Update the singleton instance's attributes with new values.
 
+    Updates are serialized. For `snapshot` classes, the new values are published
+    in a single store, so readers never see a partial update.
+
     :param kwargs: Key-value pairs of attributes to update
     :return: The updated singleton instance
     """
     instance = cls.get_instance()
-    instance._updating = True
+    type(cls).update_state(cls, instance, kwargs) # type: ignore[attr-defined]
+    return instance
 
-    try:
-      for key, value in kwargs.items():
-        setattr(instance, key, value)
-    finally:
-      instance._updating = False
+  @classmethod
+  def save_snapshot(cls: Type[_T], path: Optional[Union[str, 'os.PathLike[str]']] = None) -> None:
+    """
+    Save the instance attributes to the warm-start snapshot of the class.
 
-    return instance
+    A class declared with `warm_start` restores its instance from the snapshot,
+    memory-mapped and without calling `__init__`, while the `warm_start_key`
+    saved with it still matches.
+
+    :param path: Snapshot file path, defaults to the `warm_start` path of the class
+    :return None: No return value
+    :raises TypeError: If the class declares no `warm_start` snapshot
+    """
+    type(cls).save_snapshot(cls, path) # type: ignore[attr-defined]
+
+  @classmethod
+  def snapshot(cls: Type[_T], *args: Any, **kwargs: Any) -> Mapping[str, Any]:
+    """
+    Get a read-only view of the instance attributes, consistent across reads.
+
+    For `snapshot` classes the view costs no copy: it stays on the version it was
+    taken from while updates publish new ones. Other classes get a copy, without
+    the `__del__` hook and update flag stored on the instance.
+
+    :param args: Positional arguments for instance creation
+    :param kwargs: Keyword arguments for instance creation
+    :return Mapping[str, Any]: Attributes of the instance, private ones included
+    """
+    instance = cls.get_instance(*args, **kwargs)
+
+    if getattr(cls, '_snapshot_state', False):
+      return MappingProxyType(vars(instance))
+
+    return MappingProxyType({
+      name: value for name, value in SlotLayout.attributes(instance).items() if name not in ('_updating', '__del__')
+    })
 
   @classmethod
   def instance_as_dict(cls: Type[_T]) -> Dict[str, Any]:
     """
     Return the singleton instance's attributes as a dictionary, ignoring private attributes.
 
+    The copy is made by a serializer compiled once for the attribute layout of the class.
+
     :return Dict[str, Any]: Dictionary of instance attributes
     """
     instance = cls.get_instance_or_none()
-    return {k: v for k, v in vars(instance).items() if not k.startswith('_')} if instance else {}
+    return StateSerializer.as_dict(instance) if instance is not None else {}
+
+  @classmethod
+  def instance_as_json(cls: Type[_T]) -> bytes:
+    """
+    Return the singleton instance's public attributes encoded as a JSON object.
+
+    Scalar attributes are encoded inline by the compiled serializer, without
+    building an intermediate dictionary.
+
+    :return bytes: UTF-8 encoded JSON object, `{}` without an instance
+    :raises TypeError: If an attribute is not JSON serializable
+    """
+    instance = cls.get_instance_or_none()
+    return StateSerializer.as_json(instance) if instance is not None else b'{}'
+
+  @classmethod
+  def instance_changes_since(cls: Type[_T], version: int = 0) -> StateChanges:
+    """
+    Return the public attributes of the singleton instance changed after a version.
+
+    Pass the `version` of the previous result to get only the attributes set or
+    deleted since then. The first call, a replaced instance or an unknown version
+    give the full state, flagged by `full`.
+
+    :param version: Version returned by the previous call, 0 for the full state
+    :return StateChanges: Changed values, deleted names and the version to pass next
+    """
+    return type(cls).changes_since(cls, cls.get_instance_or_none(), version) # type: ignore[attr-defined, no-any-return]
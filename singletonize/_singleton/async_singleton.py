@@ -0,0 +1,68 @@
+"""Concrete asynchronous Singleton implementation."""
+from ._base_async_singleton import BaseAsyncSingleton
+from .._metaclasses import AsyncSingletonMeta
+
+class AsyncSingleton(BaseAsyncSingleton, metaclass=AsyncSingletonMeta):
+  """
+  Async Singleton Class Implementation
+  ======================================
+
+  This module provides a Singleton implementation for instances that wrap
+  asynchronous resources, such as HTTP clients, database pools or caches.
+
+  <br>
+
+  ## Overview
+  The `AsyncSingleton` class should be inherited by any class whose instance needs
+  to await something while it is built. It uses `AsyncSingletonMeta` as its metaclass.
+  The instance is created with `await aget_instance()`. Concurrent coroutines await the
+  same creation, and a failure is raised to every one of them. Once created, calling the
+  class returns the instance like any other Singleton.
+
+  <br>
+
+  ## Example Usage
+  ```python
+  class Database(AsyncSingleton):
+    def __init__(self, dsn: str):
+      self.dsn = dsn
+
+    @classmethod
+    async def acreate(cls, dsn: str):
+      instance = await super().acreate(dsn)
+      instance.pool = await create_pool(dsn)
+      return instance
+
+    async def aclose(self):
+      await self.pool.close()
+
+  database = await Database.aget_instance('postgres://...')
+  assert Database() is database
+  await Database.adetach()
+  ```
+
+  <br>
+
+  ## Methods
+  In addition to the `Singleton` methods:
+
+  ### `aget_instance(*args, **kwargs) -> Instance`
+  Awaits the existing instance or creates it through `acreate`.
+
+  <br>
+
+  ### `acreate(*args, **kwargs) -> Instance`
+  Async factory hook building the instance, meant to be overridden.
+
+  <br>
+
+  ### `adetach() -> None`
+  Removes the instance after awaiting its `aclose` hook.
+
+  <br>
+
+  ### `areset_instance(*args, **kwargs) -> Instance`
+  Awaits `adetach()` and creates a new instance with the provided arguments.
+  """
+
+  __slots__ = ()
@@ -0,0 +1,34 @@
+"""Abstract Base asynchronous Singleton implementation."""
+from .._metaclasses import AsyncSingletonABCMeta
+from ._base_async_singleton import BaseAsyncSingleton
+
+class AsyncSingletonABC(BaseAsyncSingleton, metaclass=AsyncSingletonABCMeta):
+  """
+  Abstract Base Async Singleton Class
+  =====================================
+
+  This module provides an abstract base class (ABC) implementation of the asynchronous
+  Singleton pattern, combining `AsyncSingleton` behavior with abstract methods.
+
+  <br>
+
+  ## Example Usage
+  ```python
+  from abc import abstractmethod
+
+  class AbstractClient(AsyncSingletonABC):
+    @abstractmethod
+    async def fetch(self, url: str) -> bytes:
+      pass
+
+  class Client(AbstractClient):
+    async def fetch(self, url: str) -> bytes:
+      ...
+
+  client = await Client.aget_instance()
+  ```
+
+  See `AsyncSingleton` for the available methods.
+  """
+
+  __slots__ = ()
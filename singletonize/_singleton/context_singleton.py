@@ -0,0 +1,47 @@
+"""Concrete context-scoped Singleton implementation."""
+from ._base_scoped_singleton import BaseScopedSingleton
+from .._metaclasses import ContextSingletonMeta
+
+class ContextSingleton(BaseScopedSingleton, metaclass=ContextSingletonMeta):
+  """
+  Context Singleton Class Implementation
+  ========================================
+
+  This module provides a Singleton implementation holding one instance per
+  `contextvars` context, such as one per request or per asyncio task.
+
+  <br>
+
+  ## Overview
+  The `ContextSingleton` class keeps its instances in a context variable, so lookups
+  take no lock. Every method of `Singleton` applies to the instance of the current
+  context. Contexts copied from one holding an instance, like the tasks it starts,
+  share that instance. Once no context references an instance, it is released with
+  the cleanup strategy of the class.
+
+  <br>
+
+  ## Example Usage
+  ```python
+  class RequestCache(ContextSingleton):
+    def __init__(self):
+      self.entries = {}
+
+  async def handle(request):
+    RequestCache().entries[request.id] = request  # one cache per task
+
+  # Or delimit the scope explicitly
+  with RequestCache.scope():
+    RequestCache().entries.clear()
+  ```
+
+  <br>
+
+  ## Methods
+  In addition to the `Singleton` methods:
+
+  ### `scope() -> ContextManager`
+  Runs a block with its own instance, detached when the block exits.
+  """
+
+  __slots__ = ()
@@ -0,0 +1,121 @@
+"""Concrete Multiton implementation."""
+from ._base_singleton import BaseSingleton
+from .._utils import LifecycleHooks
+from .._metaclasses import MultitonMeta
+
+from typing import Type, TypeVar, Dict, Hashable, Any
+
+_T = TypeVar('_T', bound='Multiton')
+
+class Multiton(BaseSingleton, metaclass=MultitonMeta):
+  """
+  Multiton Class Implementation
+  ===============================
+
+  This module provides a Multiton implementation, holding one instance per key
+  computed from the constructor arguments, such as one client per DSN.
+
+  <br>
+
+  ## Overview
+  The `Multiton` class uses `MultitonMeta` as its metaclass. Instances are keyed by
+  the constructor arguments, or by the `key` class keyword. Existing keys are read
+  without locking, and each key is built once while concurrent callers wait.
+  With `max_instances`, the least recently used (`eviction='lru'`, default) or the
+  oldest (`eviction='fifo'`) instance is detached when the bound is exceeded.
+
+  <br>
+
+  ## Example Usage
+  ```python
+  class Client(Multiton, key=lambda dsn, **options: dsn, max_instances=8):
+    def __init__(self, dsn: str, timeout: float = 5.0):
+      self.dsn = dsn
+
+  assert Client('postgres://a') is Client('postgres://a', timeout=1.0)
+  assert Client('postgres://a') is not Client('postgres://b')
+  ```
+
+  <br>
+
+  ## Methods
+  `has_instance`, `get_instance_or_none` and `reset_instance` apply to the key of
+  their arguments, while `detach()` removes every instance. In addition:
+
+  ### `evict(*args, **kwargs) -> bool`
+  Detaches the instance for the key of the arguments.
+
+  <br>
+
+  ### `instances() -> dict`
+  Returns a snapshot of the live instances by key.
+  """
+
+  __slots__ = ()
+
+  @classmethod
+  def has_instance(cls: Type[_T], *args: Any, **kwargs: Any) -> bool:
+    """
+    Check if the key of the arguments has an instance.
+
+    :param args: Positional arguments identifying the key
+    :param kwargs: Keyword arguments identifying the key
+    :return bool: True if an instance exists, otherwise False
+    """
+    return MultitonMeta.has_instance(cls, *args, **kwargs)
+
+  @classmethod
+  def get_instance_or_none(cls: Type[_T], *args: Any, **kwargs: Any) -> _T | None:
+    """
+    Return the instance for the key of the arguments if it exists, otherwise None.
+
+    :param args: Positional arguments identifying the key
+    :param kwargs: Keyword arguments identifying the key
+    :return _T: Instance or None if not created
+    """
+    return MultitonMeta.get_instance_or_none(cls, *args, **kwargs)
+
+  @classmethod
+  def evict(cls, *args: Any, **kwargs: Any) -> bool:
+    """
+    Detach the instance for the key of the arguments.
+
+    :param args: Positional arguments identifying the key
+    :param kwargs: Keyword arguments identifying the key
+    :return bool: True if an instance was detached, otherwise False
+    """
+    return MultitonMeta.evict(cls, *args, **kwargs)
+
+  @classmethod
+  def instances(cls: Type[_T]) -> Dict[Hashable, _T]:
+    """
+    Return a snapshot of the live instances by key.
+
+    :return Dict[Hashable, _T]: Instances by key
+    """
+    return MultitonMeta.instances(cls)
+
+  @classmethod
+  def reset_instance(cls: Type[_T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Replace the instance for the key of the arguments with a new one.
+
+    :param args: Arguments for instance creation, identifying the key
+    :param kwargs: Keyword arguments for instance creation
+    :return _T: The new instance
+    """
+    if LifecycleHooks.active:
+      LifecycleHooks.emit('reset', cls)
+
+    cls.evict(*args, **kwargs)
+    return cls(*args, **kwargs)
+
+  @classmethod
+  def is_instance(cls: Type[_T], obj: object) -> bool:
+    """
+    Check if the given object is one of the live instances.
+
+    :param obj: Object to check
+    :return bool: True if the object is a live instance, otherwise False
+    """
+    return isinstance(obj, cls) and any(obj is instance for instance in cls.instances().values())
@@ -0,0 +1,80 @@
+"""Concrete shared memory Singleton implementation."""
+from ._base_singleton import BaseSingleton
+from .._metaclasses import SharedMemorySingletonMeta
+from .._utils import SegmentLock
+
+from typing import Type, TypeVar
+
+_T = TypeVar('_T', bound='SharedMemorySingleton')
+
+class SharedMemorySingleton(BaseSingleton, metaclass=SharedMemorySingletonMeta):
+  """
+  Shared Memory Singleton Class Implementation
+  ==============================================
+
+  This module provides a Singleton implementation whose large, fixed-layout state
+  is stored once for every worker process instead of once per process.
+
+  <br>
+
+  ## Overview
+  Fields declared with `SharedField(format, length)` live in a
+  `multiprocessing.shared_memory` segment and read as memoryviews over it.
+  The first process creating the instance creates the segment and the others
+  attach to it without copying. `detach()` leaves the segment, and the last
+  process to leave unlinks it. A process still attached at exit leaves then.
+  The segment is named after the class, or by the `segment` class keyword.
+
+  <br>
+
+  ## Example Usage
+  ```python
+  class Lookup(SharedMemorySingleton, segment='lookup'):
+    weights = SharedField('d', 1_000_000)
+    flags = SharedField('B', 4096)
+
+    def init_shared(self):
+      self.weights[:] = load_weights()
+
+  lookup = Lookup()
+  with Lookup.shared_lock():
+    lookup.flags[0] = 1
+  ```
+
+  <br>
+
+  ## Methods
+  In addition to the `Singleton` methods:
+
+  ### `init_shared() -> None`
+  Hook called once, by the process creating the segment, before other processes can attach.
+
+  <br>
+
+  ### `shared_lock() -> SegmentLock`
+  Returns the lock serializing updates across threads and processes, also held by `update_instance`.
+  """
+
+  __slots__ = ()
+
+  def init_shared(self) -> None:
+    """
+    Initialize the shared fields, called only by the process creating the segment.
+
+    :return None: No return value
+    """
+
+  @classmethod
+  def shared_lock(cls: Type[_T]) -> SegmentLock:
+    """
+    Get the lock serializing updates of the shared fields across threads and processes.
+
+    :return SegmentLock: Reentrant context manager
+    :raises TypeError: If the class declares no shared fields
+    """
+    segment = cls.__dict__.get('_shared_segment')
+
+    if segment is None:
+      raise TypeError(f'{cls.__qualname__} declares no shared fields')
+
+    return segment.lock
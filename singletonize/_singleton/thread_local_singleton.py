@@ -0,0 +1,45 @@
+"""Concrete thread-local Singleton implementation."""
+from ._base_scoped_singleton import BaseScopedSingleton
+from .._metaclasses import ThreadLocalSingletonMeta
+
+class ThreadLocalSingleton(BaseScopedSingleton, metaclass=ThreadLocalSingletonMeta):
+  """
+  Thread-Local Singleton Class Implementation
+  =============================================
+
+  This module provides a Singleton implementation holding one instance per thread,
+  for resources that must not be shared between threads, such as parsers, database
+  cursors or scratch buffers.
+
+  <br>
+
+  ## Overview
+  The `ThreadLocalSingleton` class keeps its instances in `threading.local` storage,
+  so threads never contend on a lookup or a creation. Every method of `Singleton`
+  applies to the instance of the calling thread. When a thread ends, its instance
+  is released with the cleanup strategy of the class.
+
+  <br>
+
+  ## Example Usage
+  ```python
+  class Parser(ThreadLocalSingleton):
+    def __init__(self):
+      self.buffer = bytearray(65536)
+
+  def worker():
+    parser = Parser()
+    assert Parser() is parser  # same thread, same instance
+  ```
+
+  <br>
+
+  ## Methods
+  In addition to the `Singleton` methods:
+
+  ### `scope() -> ContextManager`
+  Runs a block with its own instance, detached when the block exits.
+  Useful when pooled threads serve unrelated tasks.
+  """
+
+  __slots__ = ()
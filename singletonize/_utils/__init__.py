@@ -1,3 +1,25 @@
-__all__ = ['InstanceCleaner']
+__all__ = ['InstanceCleaner', 'CleanupStrategy', 'CLEANUP_STRATEGIES', 'CleanupScheduler', 'PendingCreation',
+  'LazyProxy', 'UntouchedLazyProxy', 'untouched_proxies',
+  'warmup', 'WarmupResult', 'WarmupSpec', 'DependencyGraph', 'SharedField', 'SharedSegment', 'SegmentLock', 'ScopeState',
+  'RefreshScheduler', 'RefreshStats', 'ClassRecord', 'RecordField', 'SlotLayout', 'StateSerializer', 'ChangeTracker', 'StateChanges',
+  'WarmSnapshot', 'WarmStartKey', 'MemoryAccounting', 'MemoryUsage',
+  'SingletonStats', 'StatsSnapshot', 'LatencySnapshot', 'STATS_EVENTS',
+  'LifecycleHooks', 'LifecycleEvent', 'LifecycleEventName', 'LIFECYCLE_EVENTS', 'Subscription']
 
-from .instance_cleaner import InstanceCleaner
\ No newline at end of file
+from .lifecycle_hooks import LifecycleHooks, LifecycleEvent, LifecycleEventName, LIFECYCLE_EVENTS, Subscription
+from .singleton_stats import SingletonStats, StatsSnapshot, LatencySnapshot, STATS_EVENTS
+from .instance_cleaner import InstanceCleaner, CleanupStrategy, CLEANUP_STRATEGIES
+from .cleanup_scheduler import CleanupScheduler
+from .pending_creation import PendingCreation
+from .lazy_proxy import LazyProxy, UntouchedLazyProxy, untouched_proxies
+from .warmup import warmup, WarmupResult, WarmupSpec
+from .dependency_graph import DependencyGraph
+from .shared_segment import SharedField, SharedSegment, SegmentLock
+from .scope_state import ScopeState
+from .refresh_scheduler import RefreshScheduler, RefreshStats
+from .class_record import ClassRecord, RecordField
+from .slot_layout import SlotLayout
+from .state_serializer import StateSerializer
+from .change_tracker import ChangeTracker, StateChanges
+from .warm_snapshot import WarmSnapshot, WarmStartKey
+from .memory_accounting import MemoryAccounting, MemoryUsage
@@ -0,0 +1,120 @@
+"""Utility module for versioned change tracking of singleton instance attributes."""
+from .state_serializer import StateSerializer
+
+from threading import Lock
+from typing import Type, Dict, Iterable, NamedTuple, Optional, Tuple, Any
+from weakref import ref
+
+_MISSING = object()
+
+class StateChanges(NamedTuple):
+  """Public attributes changed since a version, `full` when they replace the whole previous state."""
+  version: int
+  changed: Dict[str, Any]
+  removed: Tuple[str, ...]
+  full: bool
+
+class ChangeTracker:
+  """
+  Version of the last change of each public attribute of the instance of a class.
+
+  A class gets a tracker the first time its changes are queried, so classes never
+  queried only pay a dict lookup per write. Writes are recorded under the class
+  lock, after they are applied. A tracker follows one instance: a write to, or a
+  query for, another instance starts a new base version, and queries from an
+  earlier version then get the full state.
+  """
+  __slots__ = ('version', 'base', 'fields', 'removed', 'owner')
+  _lock = Lock()
+
+  def __init__(self) -> None:
+    self.version = 0
+    self.base = 0
+    self.fields: Dict[str, int] = {}
+    self.removed: Dict[str, int] = {}
+    self.owner: Optional['ref[Any]'] = None
+
+  @classmethod
+  def for_class(cls, owner: Type[Any]) -> 'ChangeTracker':
+    """
+    Get the tracker of a class, creating it if needed.
+
+    :param owner: Singleton class
+    :return ChangeTracker: Tracker stored in the class namespace
+    """
+    tracker: Optional[ChangeTracker] = owner.__dict__.get('_singleton_changes')
+
+    if tracker is None:
+      with cls._lock:
+        tracker = owner.__dict__.get('_singleton_changes') or ChangeTracker()
+        type.__setattr__(owner, '_singleton_changes', tracker)
+
+    return tracker
+
+  def record(self, obj: object, changed: Iterable[str], removed: Iterable[str] = ()) -> None:
+    """
+    Record attributes of an object set and deleted; the caller holds the class lock.
+
+    :param obj: Object whose attributes changed
+    :param changed: Names of the attributes set
+    :param removed: Names of the attributes deleted
+    :return None: No return value
+    """
+    owner = self.owner
+
+    if owner is None or owner() is not obj:
+      self._follow(obj)
+
+    self.version = version = self.version + 1
+    fields = self.fields
+    deleted = self.removed
+
+    for name in changed:
+      if name[:1] != '_':
+        fields[name] = version
+
+        if deleted:
+          deleted.pop(name, None)
+
+    for name in removed:
+      if name[:1] != '_':
+        deleted[name] = version
+        fields.pop(name, None)
+
+  def changes_since(self, obj: object, version: int) -> StateChanges:
+    """
+    Get the public attributes of an object changed after a version; the caller holds the class lock.
+
+    :param obj: Object the changes are queried for
+    :param version: Version returned by the previous query, 0 for the full state
+    :return StateChanges: Changes, with the version to pass to the next query
+    """
+    self._follow(obj)
+
+    if not self.base <= version <= self.version:
+      return StateChanges(self.version, StateSerializer.as_dict(obj), (), True)
+
+    names = [name for name, changed in self.fields.items() if changed > version]
+    removed = tuple(name for name, changed in self.removed.items() if changed > version)
+
+    values: Dict[str, Any] = {}
+
+    for name in names:
+      value = getattr(obj, name, _MISSING)
+
+      # Deleted without going through the singleton, e.g. by `object.__delattr__`.
+      if value is not _MISSING:
+        values[name] = value
+
+    return StateChanges(self.version, values, removed, False)
+
+  def _follow(self, obj: object) -> None:
+    """Start a new base version when the object is not the tracked one."""
+    if self.owner is not None and self.owner() is obj:
+      return
+
+    self.version += 1
+    self.base = self.version
+    self.fields.clear()
+    self.removed.clear()
+    self.owner = ref(obj)
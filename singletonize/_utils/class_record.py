@@ -0,0 +1,155 @@
+"""Utility module for the per-class record of singleton state, stored in the class namespace."""
+import os
+from threading import Lock
+from typing import Type, ClassVar, Generic, Iterator, List, MutableMapping, Optional, Set, TypeVar, Any
+from weakref import WeakSet
+
+_V = TypeVar('_V')
+_MISSING: Any = object()
+
+class ClassRecord:
+  """
+  Per-class state of a singleton class, one slotted object in its namespace.
+
+  The record is created with the class and goes away with it. A field left
+  unset takes no memory beyond its slot. Classes holding a record are found
+  by walking `__subclasses__` from the root classes, the only ones kept here,
+  weakly, so defining a class adds no entry to any shared structure.
+  """
+  __slots__ = (
+    'lock', 'refs', 'held', 'pending', 'dependencies', 'fork_blocked', 'refresh_stats', 'refresh_args', 'borrows', 'retiring'
+  )
+  attribute: ClassVar[str] = '_singleton_record'
+  _roots: ClassVar[WeakSet[Type[Any]]] = WeakSet()
+  _lock: ClassVar[Lock] = Lock()
+
+  @classmethod
+  def attach(cls, owner: Type[Any]) -> 'ClassRecord':
+    """
+    Create the record of a class.
+
+    :param owner: Class getting the record
+    :return ClassRecord: Empty record of the class
+    """
+    record = cls()
+    type.__setattr__(owner, cls.attribute, record)
+
+    if not any(cls.attribute in base.__dict__ for base in owner.__bases__):
+      with cls._lock:
+        cls._roots.add(owner)
+
+    return record
+
+  @classmethod
+  def owners(cls) -> List[Type[Any]]:
+    """
+    Get a snapshot of the live classes holding a record.
+
+    :return List[Type[Any]]: Classes holding a record
+    """
+    with cls._lock:
+      stack = list(cls._roots)
+
+    seen: Set[Type[Any]] = set()
+    owners: List[Type[Any]] = []
+
+    while stack:
+      klass = stack.pop()
+
+      if klass in seen:
+        continue
+
+      seen.add(klass)
+
+      if cls.attribute in klass.__dict__:
+        owners.append(klass)
+
+      stack.extend(type.__subclasses__(klass))
+
+    return owners
+
+  @classmethod
+  def _after_fork_in_child(cls) -> None:
+    """Replace the lock possibly held by a parent thread."""
+    cls._lock = Lock()
+
+class RecordField(MutableMapping[Type[Any], _V], Generic[_V]):
+  """
+  Mapping of classes to one field of their record.
+
+  Lookups read the class dict and the record slot, so they share no structure
+  between classes, take no lock and create no weak reference, which keeps them
+  scalable on free-threaded builds. Values are never inherited by subclasses.
+  Callers serialize the writes of each class.
+  """
+  __slots__ = ('_field',)
+
+  def __init__(self, field: str) -> None:
+    """
+    Initialize the mapping.
+
+    :param field: Name of the record slot holding the value
+    """
+    self._field = field
+
+  def __getitem__(self, cls: Type[Any]) -> _V:
+    value = getattr(cls.__dict__.get(ClassRecord.attribute), self._field, _MISSING)
+
+    if value is _MISSING:
+      raise KeyError(cls)
+
+    return value # type: ignore[no-any-return]
+
+  def get(self, cls: Type[Any], default: Optional[_V] = None) -> Optional[_V]: # type: ignore[override]
+    """Get the value of a class, or `default` if it has none."""
+    return getattr(cls.__dict__.get(ClassRecord.attribute), self._field, default) # type: ignore[no-any-return]
+
+  def __contains__(self, cls: object) -> bool:
+    return hasattr(getattr(cls, '__dict__', {}).get(ClassRecord.attribute), self._field)
+
+  def __setitem__(self, cls: Type[Any], value: _V) -> None:
+    record = cls.__dict__.get(ClassRecord.attribute)
+
+    if record is None:
+      raise TypeError(f'{cls.__qualname__} has no singleton record')
+
+    setattr(record, self._field, value)
+
+  def setdefault(self, cls: Type[Any], default: _V) -> _V: # type: ignore[override]
+    """Get the value of a class, setting it to `default` if it has none."""
+    value: Optional[_V] = self.get(cls)
+
+    if value is None:
+      self[cls] = value = default
+
+    return value
+
+  def __delitem__(self, cls: Type[Any]) -> None:
+    try:
+      delattr(cls.__dict__[ClassRecord.attribute], self._field)
+    except (KeyError, AttributeError):
+      raise KeyError(cls) from None
+
+  def pop(self, cls: Type[Any], default: Optional[_V] = None) -> Optional[_V]: # type: ignore[override]
+    """Remove the value of a class and return it, or `default` if it has none."""
+    record = cls.__dict__.get(ClassRecord.attribute)
+    value: Optional[_V] = getattr(record, self._field, default)
+
+    if record is not None and hasattr(record, self._field):
+      delattr(record, self._field)
+
+    return value
+
+  def __iter__(self) -> Iterator[Type[Any]]:
+    return iter([cls for cls in ClassRecord.owners() if hasattr(cls.__dict__[ClassRecord.attribute], self._field)])
+
+  def __len__(self) -> int:
+    return sum(1 for _ in self)
+
+  def clear(self) -> None:
+    """Remove the value of every class."""
+    for cls in list(self):
+      self.pop(cls)
+
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(after_in_child=ClassRecord._after_fork_in_child)
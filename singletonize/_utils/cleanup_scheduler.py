@@ -0,0 +1,214 @@
+"""Utility module for background instance cleanup."""
+from .instance_cleaner import InstanceCleaner, CleanupStrategy
+from .lifecycle_hooks import LifecycleHooks
+
+import gc
+import os
+import sys
+from contextlib import contextmanager
+from threading import Condition, Thread, local
+from time import perf_counter
+from typing import List, Tuple, Iterable, Iterator, Optional, Callable, Any
+from weakref import ref
+
+_Job = Tuple[object, CleanupStrategy, Tuple[object, ...]]
+
+class CleanupScheduler:
+  """
+  Daemon worker that runs instance cleanups off the caller thread.
+
+  Pending cleanups are drained in batches. After a batch the worker only
+  collects the youngest generation still holding a detached instance,
+  or the full heap when the batch contains a `deep` cleanup.
+  """
+  _condition = Condition()
+  _queue: List[_Job] = []
+  # Jobs held back by the `batch` blocks of each thread.
+  _batching = local()
+  _worker: Optional[Thread] = None
+  _scheduled = 0
+  _completed = 0
+
+  @classmethod
+  def schedule(cls, obj: object, strategy: CleanupStrategy, tracked: Iterable[object] = ()) -> None:
+    """
+    Queue an object for cleanup and return immediately.
+
+    :param obj: Object to clean up
+    :param strategy: Cleanup strategy to apply
+    :param tracked: Holders whose references are released by the `tracked` strategy
+    :return None: No return value
+    """
+    InstanceCleaner.validate_strategy(strategy)
+
+    if obj is None or strategy == 'none':
+      return
+
+    held: Optional[List[_Job]] = getattr(cls._batching, 'jobs', None)
+
+    if held is not None:
+      held.append((obj, strategy, tuple(tracked)))
+      return
+
+    cls._enqueue([(obj, strategy, tuple(tracked))])
+
+  @classmethod
+  @contextmanager
+  def batch(cls) -> Iterator[None]:
+    """
+    Hold back the cleanups scheduled by this thread in the block, then queue them at once.
+
+    The worker drains them in a single batch, so they share one referrer scan and
+    one collection. Nested blocks queue with the outermost one.
+
+    :return Iterator[None]: Context of the block
+    """
+    if getattr(cls._batching, 'jobs', None) is not None:
+      yield
+      return
+
+    jobs: List[_Job] = []
+    cls._batching.jobs = jobs
+
+    try:
+      yield
+    finally:
+      cls._batching.jobs = None
+      cls._enqueue(jobs)
+
+  @classmethod
+  def _enqueue(cls, jobs: List[_Job]) -> None:
+    """Queue jobs together, starting the worker if needed."""
+    if not jobs:
+      return
+
+    with cls._condition:
+      cls._queue.extend(jobs)
+      cls._scheduled += len(jobs)
+
+      if cls._worker is None or not cls._worker.is_alive():
+        cls._worker = Thread(target=cls._run, name='singletonize-cleanup', daemon=True)
+        cls._worker.start()
+
+      cls._condition.notify_all()
+
+  @classmethod
+  def flush(cls, timeout: Optional[float] = None) -> bool:
+    """
+    Wait until every cleanup scheduled so far has run.
+
+    :param timeout: Maximum time to wait in seconds, or None to wait forever
+    :return bool: True if the queue was drained, False on timeout
+    """
+    with cls._condition:
+      target = cls._scheduled
+      return cls._condition.wait_for(lambda: cls._completed >= target, timeout)
+
+  @classmethod
+  def pending(cls) -> int:
+    """
+    Return the number of scheduled cleanups that have not run yet.
+
+    :return int: Number of pending cleanups
+    """
+    with cls._condition:
+      return cls._scheduled - cls._completed
+
+  @classmethod
+  def _after_fork_in_child(cls) -> None:
+    """Drop the worker and queue of the parent process, which do not exist in the child."""
+    cls._condition = Condition()
+    cls._queue = []
+    cls._batching = local()
+    cls._worker = None
+    cls._scheduled = cls._completed = 0
+
+  @classmethod
+  def _run(cls) -> None:
+    """Drain the queue forever, one batch at a time."""
+    while True:
+      with cls._condition:
+        cls._condition.wait_for(lambda: bool(cls._queue))
+        batch, cls._queue = cls._queue, []
+
+      # _process consumes the batch so it can drop its strong references.
+      size = len(batch)
+
+      try:
+        cls._process(batch)
+      except Exception:
+        sys.excepthook(*sys.exc_info())
+      finally:
+        with cls._condition:
+          cls._completed += size
+          cls._condition.notify_all()
+
+  @classmethod
+  def _process(cls, batch: List[_Job]) -> None:
+    """
+    Clean every object in the batch, then run a single collection pass.
+
+    The batch is emptied while processing. Attributes are released per object,
+    while the `deep` referrer scans of the whole batch share one heap scan.
+    """
+    refs: List[Callable[[], Any]] = []
+    deep: List[object] = []
+
+    while batch:
+      obj, strategy, tracked = batch.pop()
+      start = perf_counter()
+
+      try:
+        if strategy == 'deep':
+          InstanceCleaner.cleanup(obj, 'attributes-only')
+          deep.append(obj)
+        else:
+          InstanceCleaner.cleanup(obj, strategy, tracked)
+      except Exception:
+        sys.excepthook(*sys.exc_info())
+
+      if LifecycleHooks.active:
+        LifecycleHooks.emit('cleanup', type(obj), perf_counter() - start)
+
+      try:
+        refs.append(ref(obj))
+      except TypeError:
+        refs.append(lambda obj=obj: obj)
+
+      del obj, tracked
+
+    if deep:
+      try:
+        InstanceCleaner.clear_references(deep)
+      except Exception:
+        sys.excepthook(*sys.exc_info())
+
+      del deep
+      gc.collect()
+      return
+
+    alive = [obj for obj in (get() for get in refs) if obj is not None]
+
+    if not alive:
+      return
+
+    generation = cls._needed_generation(alive)
+    del alive
+
+    if generation is not None:
+      gc.collect(generation)
+
+  @staticmethod
+  def _needed_generation(objs: List[object]) -> Optional[int]:
+    """Return the young generation whose collection reaches the objects, None if all are old."""
+    ids = {id(obj) for obj in objs}
+    generation: Optional[int] = None
+
+    for candidate in (0, 1):
+      if any(id(obj) in ids for obj in gc.get_objects(candidate)):
+        generation = candidate
+
+    return generation
+
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(after_in_child=CleanupScheduler._after_fork_in_child)
@@ -0,0 +1,79 @@
+"""Utility module for singleton dependency graphs."""
+from typing import Type, Dict, List, Tuple, Set, Iterable, Mapping, Optional, Any
+
+_Graph = Mapping[Type[Any], Tuple[Type[Any], ...]]
+
+class DependencyGraph:
+  """Utility class for ordering classes by their declared dependencies."""
+  @staticmethod
+  def find_cycle(graph: _Graph, start: Type[Any]) -> Optional[List[Type[Any]]]:
+    """Return a dependency path from the class back to itself, or None."""
+    stack: List[Tuple[Type[Any], List[Type[Any]]]] = [(start, [start])]
+    seen: Set[Type[Any]] = set()
+
+    while stack:
+      node, path = stack.pop()
+
+      for dependency in graph.get(node, ()):
+        if dependency is start:
+          return path + [start]
+
+        if dependency not in seen:
+          seen.add(dependency)
+          stack.append((dependency, path + [dependency]))
+
+    return None
+
+  @staticmethod
+  def closure(graph: _Graph, classes: Iterable[Type[Any]]) -> List[Type[Any]]:
+    """Return the classes together with all their transitive dependencies."""
+    result: Dict[Type[Any], None] = {}
+    stack = list(classes)
+
+    while stack:
+      node = stack.pop()
+
+      if node not in result:
+        result[node] = None
+        stack.extend(graph.get(node, ()))
+
+    return list(result)
+
+  @staticmethod
+  def dependents(graph: _Graph, classes: Iterable[Type[Any]]) -> List[Type[Any]]:
+    """Return the classes together with every class that transitively depends on them."""
+    reverse: Dict[Type[Any], List[Type[Any]]] = {}
+
+    for node, dependencies in list(graph.items()):
+      for dependency in dependencies:
+        reverse.setdefault(dependency, []).append(node)
+
+    return DependencyGraph.closure({node: tuple(nodes) for node, nodes in reverse.items()}, classes)
+
+  @staticmethod
+  def levels(graph: _Graph, classes: Iterable[Type[Any]]) -> List[List[Type[Any]]]:
+    """
+    Group classes into levels where each class only depends on classes of earlier levels.
+
+    Dependencies outside of the given classes are ignored.
+    """
+    nodes = list(dict.fromkeys(classes))
+    members = set(nodes)
+    remaining = {node: {dep for dep in graph.get(node, ()) if dep in members and dep is not node} for node in nodes}
+    levels: List[List[Type[Any]]] = []
+
+    while remaining:
+      level = [node for node, dependencies in remaining.items() if not dependencies]
+
+      if not level:
+        raise TypeError(f'Dependency cycle between {sorted(node.__qualname__ for node in remaining)}')
+
+      for node in level:
+        del remaining[node]
+
+      for dependencies in remaining.values():
+        dependencies.difference_update(level)
+
+      levels.append(level)
+
+    return levels
@@ -1,9 +1,11 @@
 """Utility module for instance cleanup."""
 import gc
 from types import ModuleType, FunctionType
-from typing import Type, TypeVar, Dict, List, Tuple, Union, Optional, Set, cast, Any
+from typing import Type, TypeVar, Dict, List, Tuple, Union, Optional, Set, Iterable, Literal, cast, Any
 
 _T = TypeVar("_T")
+CleanupStrategy = Literal["none", "attributes-only", "tracked", "deep"]
+CLEANUP_STRATEGIES: Tuple[CleanupStrategy, ...] = ("none", "attributes-only", "tracked", "deep")
 _R = Union[
   Dict[Any, Optional[_T]],
   List[Optional[_T]],
@@ -12,39 +14,145 @@ _R = Union[
 ]
 
 class InstanceCleaner:
-  """Utility class for thorough instance cleanup."""
+  """
+  Utility class for instance cleanup.
+
+  The cost of each strategy is bounded as follows:
+
+  - `none`: nothing is touched.
+  - `attributes-only`: the instance attributes are released, cost scales with the instance.
+  - `tracked`: like `attributes-only`, plus references to the object held by the
+    `tracked` holders (objects, dicts, lists or sets) are replaced with `None`
+    or discarded, cost scales with the holders.
+  - `deep`: every referrer on the heap is scanned and a full collection is forced.
+  """
+  @staticmethod
+  def validate_strategy(strategy: str) -> CleanupStrategy:
+    """Return the strategy if it is known, otherwise raise ValueError."""
+    if strategy not in CLEANUP_STRATEGIES:
+      raise ValueError(f"Unknown cleanup strategy {strategy!r}, expected one of {CLEANUP_STRATEGIES}")
+
+    return cast(CleanupStrategy, strategy)
+
   @staticmethod
-  def cleanup(obj: Optional[Type[_T] | object]) -> None:
-    """Clean up an object and its references safely."""
-    if obj is None:
+  def cleanup(
+    obj: Optional[Type[_T] | object],
+    strategy: CleanupStrategy = "deep",
+    tracked: Iterable[object] = (),
+    collect: bool = True
+  ) -> None:
+    """
+    Clean up an object and its references safely.
+
+    :param obj: Object to clean up
+    :param strategy: Cleanup strategy to apply
+    :param tracked: Holders whose references are released by the `tracked` strategy
+    :param collect: Whether the `deep` strategy forces a full garbage collection
+    :return None: No return value
+    """
+    InstanceCleaner.validate_strategy(strategy)
+
+    if obj is None or strategy == "none":
       return
 
     InstanceCleaner._clear_attributes(obj)
-    InstanceCleaner._clear_references(obj)
-    gc.collect()
+
+    if strategy == "tracked":
+      for holder in tracked:
+        InstanceCleaner._clear_holder_references(holder, obj)
+    elif strategy == "deep":
+      InstanceCleaner._clear_references(obj)
+
+      if collect:
+        gc.collect()
 
   @staticmethod
   def _clear_attributes(obj: object) -> None:
-    """Remove attributes from an object to release references."""
-    if not hasattr(obj, "__dict__"):
-      return
+    """Remove attributes from an object to release references, including the fields of slots singletons."""
+    if hasattr(obj, "__dict__"):
+      attrs = list(obj.__dict__)
+    else:
+      attrs = list(getattr(type(obj), "_slot_fields", None) or ())
 
-    for attr in list(obj.__dict__):
+    for attr in attrs:
       try:
         delattr(obj, attr)
       except (AttributeError, TypeError):
         pass
 
   @staticmethod
-  def _clear_references(obj: Union[type[_T], object]) -> None:
-    """Clear references to an object from referrers."""
-    referrers = cast(List[_R[_T]], [
-      ref for ref in gc.get_referrers(obj)
-      if not isinstance(ref, (type, ModuleType, FunctionType))
+  def _clear_holder_references(holder: object, obj: object) -> None:
+    """Replace references of a tracked holder, container or object, that point to the object."""
+    if holder is obj:
+      return
+
+    if isinstance(holder, dict):
+      InstanceCleaner._clear_dict_references(holder, obj)
+      return
+
+    if isinstance(holder, list):
+      InstanceCleaner._clear_list_references(holder, obj)
+      return
+
+    if isinstance(holder, set):
+      holder.discard(obj)
+      return
+
+    holder_dict = getattr(holder, "__dict__", None)
+
+    if isinstance(holder_dict, dict):
+      for key, value in list(holder_dict.items()):
+        if value is obj:
+          holder_dict[key] = None
+
+    for klass in type(holder).__mro__:
+      slots = klass.__dict__.get("__slots__", ())
+
+      for slot in (slots,) if isinstance(slots, str) else slots:
+        if slot in ("__dict__", "__weakref__"):
+          continue
+
+        if slot.startswith("__") and not slot.endswith("__"):
+          slot = f"_{klass.__name__.lstrip('_')}{slot}"
+
+        descriptor = klass.__dict__.get(slot)
+
+        try:
+          if descriptor.__get__(holder, klass) is obj:
+            descriptor.__set__(holder, None)
+        except (AttributeError, TypeError):
+          pass
+
+  @staticmethod
+  def clear_references(objs: List[object]) -> None:
+    """
+    Clear references to every object from its referrers with a single heap scan.
+
+    Referrers that are tuples still need one extra scan each, since the tuple
+    itself has to be replaced in its own referrers.
+
+    :param objs: Objects whose references are cleared
+    :return None: No return value
+    """
+    if not objs:
+      return
+
+    referrers = cast(List[_R[Any]], [
+      ref for ref in gc.get_referrers(*objs)
+      if ref is not objs and not isinstance(ref, (type, ModuleType, FunctionType))
     ])
 
     for ref in referrers:
-      InstanceCleaner._clear_container_references(ref, obj)
+      for obj in objs:
+        if isinstance(ref, tuple) and not any(item is obj for item in ref):
+          continue
+
+        InstanceCleaner._clear_container_references(ref, obj)
+
+  @staticmethod
+  def _clear_references(obj: Union[type[_T], object]) -> None:
+    """Clear references to an object from referrers."""
+    InstanceCleaner.clear_references([obj])
 
   @staticmethod
   def _clear_container_references(ref: _R[_T], obj: object) -> None:
@@ -0,0 +1,174 @@
+"""Utility module for lazily created singleton instances."""
+import math
+import operator
+import os
+from threading import Lock
+from typing import Type, Dict, List, Tuple, Iterator, Callable, Any
+from weakref import WeakSet
+
+class LazyProxy:
+  """
+  Transparent proxy creating the singleton instance on first use.
+
+  Every access reads the class instance slot, so the proxy always forwards to
+  the current instance, including after a detach or reset. Proxies start as
+  `UntouchedLazyProxy` and switch class on first use, which keeps the
+  forwarding path free of any bookkeeping.
+
+  Attribute access, the container, iterator, context manager and async
+  protocols, ordering, arithmetic and numeric conversions are forwarded.
+  Equality and hashing stay identity based, so registering a proxy never
+  creates the instance. In-place operators fall back to the binary ones and
+  rebind the name to their result, and `type()` returns the proxy class.
+  """
+  __slots__ = ('_lazy_cls', '_lazy_args', '_lazy_kwargs', '_lazy_location', '__weakref__')
+  _lazy_proxies: 'WeakSet[LazyProxy]' = WeakSet()
+  _lazy_lock = Lock()
+
+  def __init__(self, cls: Type[Any], args: Tuple[Any, ...], kwargs: Dict[str, Any], location: str) -> None:
+    object.__setattr__(self, '_lazy_cls', cls)
+    object.__setattr__(self, '_lazy_args', args)
+    object.__setattr__(self, '_lazy_kwargs', kwargs)
+    object.__setattr__(self, '_lazy_location', location)
+
+    with LazyProxy._lazy_lock:
+      LazyProxy._lazy_proxies.add(self)
+
+  # Overriding __getattribute__ rather than __getattr__ skips the failed lookup on the proxy itself.
+  def __getattribute__(self, name: str) -> Any:
+    instance = _get_cls(self)._singleton_instance
+
+    if instance is None:
+      instance = _create(self)
+
+    return getattr(instance, name)
+
+  def __setattr__(self, name: str, value: Any) -> None:
+    setattr(_instance(self), name, value)
+
+  def __delattr__(self, name: str) -> None:
+    delattr(_instance(self), name)
+
+  def __repr__(self) -> str:
+    return repr(_instance(self))
+
+  def __str__(self) -> str:
+    return str(_instance(self))
+
+  def __bool__(self) -> bool:
+    return bool(_instance(self))
+
+  def __len__(self) -> int:
+    return len(_instance(self))
+
+  def __iter__(self) -> Iterator[Any]:
+    return iter(_instance(self))
+
+  def __contains__(self, item: Any) -> bool:
+    return item in _instance(self)
+
+  def __getitem__(self, key: Any) -> Any:
+    return _instance(self)[key]
+
+  def __setitem__(self, key: Any, value: Any) -> None:
+    _instance(self)[key] = value
+
+  def __delitem__(self, key: Any) -> None:
+    del _instance(self)[key]
+
+  def __call__(self, *args: Any, **kwargs: Any) -> Any:
+    return _instance(self)(*args, **kwargs)
+
+class UntouchedLazyProxy(LazyProxy):
+  """Lazy proxy that has not been used yet."""
+  __slots__ = ()
+
+  def __getattribute__(self, name: str) -> Any:
+    return getattr(_instance(self), name)
+
+_get_cls: Callable[[LazyProxy], Any] = LazyProxy.__dict__['_lazy_cls'].__get__
+_get_args: Callable[[LazyProxy], Tuple[Any, ...]] = LazyProxy.__dict__['_lazy_args'].__get__
+_get_kwargs: Callable[[LazyProxy], Dict[str, Any]] = LazyProxy.__dict__['_lazy_kwargs'].__get__
+_get_location: Callable[[LazyProxy], str] = LazyProxy.__dict__['_lazy_location'].__get__
+
+def _create(proxy: LazyProxy) -> Any:
+  """Create the instance with the arguments given to the proxy."""
+  return _get_cls(proxy)(*_get_args(proxy), **_get_kwargs(proxy))
+
+def _instance(proxy: LazyProxy) -> Any:
+  """Return the current instance, marking the proxy as used."""
+  if type(proxy) is UntouchedLazyProxy:
+    object.__setattr__(proxy, '__class__', LazyProxy)
+
+  instance = _get_cls(proxy)._singleton_instance
+  return _create(proxy) if instance is None else instance
+
+# Special methods are looked up on the type, so each forwarded one is defined on the proxy class.
+_FORWARDED: Dict[str, Callable[..., Any]] = {
+  '__next__': next,
+  '__reversed__': reversed,
+  '__enter__': lambda instance: instance.__enter__(),
+  '__exit__': lambda instance, *exc_info: instance.__exit__(*exc_info),
+  '__aenter__': lambda instance: instance.__aenter__(),
+  '__aexit__': lambda instance, *exc_info: instance.__aexit__(*exc_info),
+  '__await__': lambda instance: instance.__await__(),
+  '__aiter__': lambda instance: instance.__aiter__(),
+  '__anext__': lambda instance: instance.__anext__(),
+  '__lt__': operator.lt,
+  '__le__': operator.le,
+  '__gt__': operator.gt,
+  '__ge__': operator.ge,
+  '__neg__': operator.neg,
+  '__pos__': operator.pos,
+  '__abs__': operator.abs,
+  '__invert__': operator.invert,
+  '__index__': operator.index,
+  '__int__': int,
+  '__float__': float,
+  '__complex__': complex,
+  '__round__': round,
+  '__trunc__': math.trunc,
+  '__floor__': math.floor,
+  '__ceil__': math.ceil,
+  '__bytes__': bytes,
+  '__format__': format,
+  '__divmod__': divmod,
+  '__rdivmod__': lambda instance, other: divmod(other, instance),
+  '__pow__': pow,
+  '__rpow__': lambda instance, other: pow(other, instance)
+}
+
+for _name in ('add', 'sub', 'mul', 'matmul', 'truediv', 'floordiv', 'mod', 'lshift', 'rshift', 'and', 'xor', 'or'):
+  _binary: Callable[[Any, Any], Any] = getattr(operator, f'{_name}_' if _name in ('and', 'or') else _name)
+  _FORWARDED[f'__{_name}__'] = _binary
+  _FORWARDED[f'__r{_name}__'] = lambda instance, other, binary=_binary: binary(other, instance)
+
+def _forwarding(name: str, operation: Callable[..., Any]) -> Callable[..., Any]:
+  """Build the special method applying `operation` to the current instance."""
+  def forward(self: LazyProxy, *args: Any) -> Any:
+    return operation(_instance(self), *args)
+
+  forward.__name__ = name
+  forward.__qualname__ = f'LazyProxy.{name}'
+  return forward
+
+for _name, _operation in _FORWARDED.items():
+  setattr(LazyProxy, _name, _forwarding(_name, _operation))
+
+def _after_fork_in_child() -> None:
+  """Replace the registry lock, which a parent thread may have held while forking."""
+  LazyProxy._lazy_lock = Lock()
+
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(after_in_child=_after_fork_in_child)
+
+def untouched_proxies() -> List[Tuple[Type[Any], str]]:
+  """
+  Report the lazy proxies that were never used.
+
+  :return List[Tuple[Type[Any], str]]: Singleton class and creation location of each untouched proxy
+  """
+  with LazyProxy._lazy_lock:
+    proxies = list(LazyProxy._lazy_proxies)
+
+  return [(_get_cls(proxy), _get_location(proxy)) for proxy in proxies if type(proxy) is UntouchedLazyProxy]
@@ -0,0 +1,144 @@
+"""Utility module for singleton lifecycle event subscriptions."""
+import sys
+from threading import Lock
+from typing import Type, Callable, FrozenSet, Iterable, Literal, NamedTuple, Optional, Tuple, Any
+
+LifecycleEventName = Literal['create_start', 'create_end', 'lock_wait', 'wait', 'hit', 'detach', 'cleanup', 'swap', 'reset']
+LIFECYCLE_EVENTS: Tuple[LifecycleEventName, ...] = (
+  'create_start', 'create_end', 'lock_wait', 'wait', 'hit', 'detach', 'cleanup', 'swap', 'reset'
+)
+
+class LifecycleEvent(NamedTuple):
+  """Lifecycle event of a singleton class, with the duration in seconds of timed events."""
+  name: LifecycleEventName
+  cls: Type[Any]
+  duration: Optional[float] = None
+  error: Optional[BaseException] = None
+
+class Subscription:
+  """Handler registered for a set of lifecycle events."""
+  __slots__ = ('handler', 'events', 'interval', 'countdown')
+
+  def __init__(self, handler: Callable[[LifecycleEvent], None], events: FrozenSet[str], interval: int) -> None:
+    self.handler = handler
+    self.events = events
+    self.interval = interval
+    self.countdown = interval
+
+class LifecycleHooks:
+  """
+  Registry of lifecycle event handlers.
+
+  Emitting sites check `active` first, so without subscribers an event costs a
+  single branch. Handlers run on the emitting thread, never under a class lock,
+  and their errors are reported without interrupting the singleton operation.
+  """
+  active = False
+  # Whether a subscriber receives `hit` events, which requires the instrumented lookup.
+  hits = False
+  _lock = Lock()
+  _subscriptions: Tuple[Subscription, ...] = ()
+
+  @classmethod
+  def subscribe(
+    cls,
+    handler: Callable[[LifecycleEvent], None],
+    events: Optional[Iterable[LifecycleEventName]] = None,
+    sample_rate: float = 1.0
+  ) -> Subscription:
+    """
+    Register a handler for lifecycle events.
+
+    :param handler: Callable receiving each event
+    :param events: Event names to receive, defaults to all of them
+    :param sample_rate: Fraction of `hit` events delivered, other events are always delivered
+    :return Subscription: Handle to pass to `unsubscribe`
+    :raises ValueError: If an event name or the sample rate is invalid
+    """
+    names = frozenset(LIFECYCLE_EVENTS if events is None else events)
+    unknown = names.difference(LIFECYCLE_EVENTS)
+
+    if unknown:
+      raise ValueError(f'Unknown lifecycle events {sorted(unknown)}, expected some of {LIFECYCLE_EVENTS}')
+
+    if not 0 < sample_rate <= 1:
+      raise ValueError(f'sample_rate must be in (0, 1], got {sample_rate}')
+
+    subscription = Subscription(handler, names, round(1 / sample_rate))
+
+    with cls._lock:
+      cls._update((*cls._subscriptions, subscription))
+
+    return subscription
+
+  @classmethod
+  def unsubscribe(cls, subscription: Subscription) -> None:
+    """
+    Remove a handler registered with `subscribe`.
+
+    :param subscription: Handle returned by `subscribe`
+    :return None: No return value
+    """
+    with cls._lock:
+      cls._update(tuple(current for current in cls._subscriptions if current is not subscription))
+
+  @classmethod
+  def _update(cls, subscriptions: Tuple[Subscription, ...]) -> None:
+    """Publish a new subscription tuple, so emitters iterate a snapshot without locking."""
+    cls._subscriptions = subscriptions
+    cls.hits = any('hit' in subscription.events for subscription in subscriptions)
+    cls.active = bool(subscriptions)
+
+  @classmethod
+  def emit(
+    cls,
+    name: LifecycleEventName,
+    owner: Type[Any],
+    duration: Optional[float] = None,
+    error: Optional[BaseException] = None
+  ) -> None:
+    """
+    Deliver an event to the handlers subscribed to it.
+
+    :param name: Event name
+    :param owner: Singleton class
+    :param duration: Duration in seconds of timed events
+    :param error: Error of failed operations
+    :return None: No return value
+    """
+    event: Optional[LifecycleEvent] = None
+
+    for subscription in cls._subscriptions:
+      if name not in subscription.events:
+        continue
+
+      event = event or LifecycleEvent(name, owner, duration, error)
+
+      try:
+        subscription.handler(event)
+      except Exception:
+        sys.excepthook(*sys.exc_info())
+
+  @classmethod
+  def hit(cls, owner: Type[Any]) -> None:
+    """
+    Deliver a sampled `hit` event.
+
+    :param owner: Singleton class
+    :return None: No return value
+    """
+    for subscription in cls._subscriptions:
+      if 'hit' not in subscription.events:
+        continue
+
+      subscription.countdown -= 1
+
+      if subscription.countdown > 0:
+        continue
+
+      subscription.countdown = subscription.interval
+
+      try:
+        subscription.handler(LifecycleEvent('hit', owner))
+      except Exception:
+        sys.excepthook(*sys.exc_info())
@@ -0,0 +1,215 @@
+"""Utility module for per-singleton memory accounting."""
+import mmap
+import os
+import sys
+from array import array
+from collections import deque
+from threading import Event, Lock, Thread, current_thread
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Type, Callable, Deque, Iterable, List, NamedTuple, Optional, Tuple, Any
+from weakref import WeakKeyDictionary, ref
+
+# Objects shared by the whole program, never counted nor walked into.
+_SHARED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, ref)
+_LEAVES = (str, bytes, bytearray, array, int, float, complex, bool, range)
+_CONTAINERS = (list, tuple, set, frozenset, deque)
+
+class MemoryUsage(NamedTuple):
+  """Memory reachable from the live instances of one singleton class."""
+  instances: int
+  bytes: int
+  objects: int
+  truncated: bool
+  growing: bool
+
+class MemoryAccounting:
+  """
+  Bounded deep-size walks of singleton instances, with a short history of their sizes.
+
+  The walk follows dicts, sequences, sets, object attributes and slots, and the
+  objects exporting the buffers of memoryviews. It counts `sys.getsizeof` of each
+  object once, and stops after `max_objects`. Classes, modules, functions and
+  other singleton instances are not counted, so objects shared that way are not
+  attributed to every singleton reaching them. No heap scan is involved.
+
+  A class is flagged as growing once its last `window` samples keep increasing.
+  Samples can be taken periodically by a daemon thread of their own, so long
+  walks never delay the refresh and cleanup workers.
+  """
+  window = 4
+  _lock = Lock()
+  _sampling: Optional[Tuple[Thread, Event]] = None
+  _history: WeakKeyDictionary[Type[Any], Deque[int]] = WeakKeyDictionary()
+  _slots: WeakKeyDictionary[Type[Any], Tuple[str, ...]] = WeakKeyDictionary()
+
+  @classmethod
+  def measure(cls, owner: Type[Any], instances: List[Any], max_objects: int) -> MemoryUsage:
+    """
+    Walk the live instances of a class and record their size in its history.
+
+    :param owner: Singleton class
+    :param instances: Live instances of the class
+    :param max_objects: Number of objects after which the walk stops
+    :return MemoryUsage: Size of the instances and whether it keeps growing
+    """
+    size, objects, truncated = cls.deep_size(instances, max_objects)
+
+    with cls._lock:
+      history = cls._history.get(owner)
+
+      if history is None or history.maxlen != cls.window:
+        history = cls._history[owner] = deque(history or (), maxlen=cls.window)
+
+      history.append(size)
+      growing = len(history) == cls.window and all(before < after for before, after in zip(history, list(history)[1:]))
+
+    return MemoryUsage(len(instances), size, objects, truncated, growing)
+
+  @classmethod
+  def deep_size(cls, roots: Iterable[Any], max_objects: int) -> Tuple[int, int, bool]:
+    """
+    Get the bytes of the objects reachable from roots.
+
+    :param roots: Objects to walk from
+    :param max_objects: Number of objects after which the walk stops
+    :return Tuple[int, int, bool]: Bytes, objects counted, and whether the walk stopped early
+    """
+    stack = list(roots)
+    seen = {id(root) for root in stack}
+    size = objects = 0
+
+    while stack:
+      if objects >= max_objects:
+        return size, objects, True
+
+      obj = stack.pop()
+
+      if obj is None or isinstance(obj, _SHARED):
+        continue
+
+      objects += 1
+      size += sys.getsizeof(obj)
+
+      if isinstance(obj, _LEAVES):
+        continue
+
+      if isinstance(obj, dict):
+        children: List[Any] = [*obj.keys(), *obj.values()]
+      elif isinstance(obj, _CONTAINERS):
+        children = list(obj)
+      elif isinstance(obj, memoryview):
+        children = [] if obj.obj is None else [obj.obj]
+      elif isinstance(obj, mmap.mmap):
+        # The mapping lives outside the object.
+        size += cls._mapped(obj)
+        continue
+      else:
+        children = cls._attributes(obj)
+
+      for child in children:
+        if id(child) in seen or cls._is_singleton(child):
+          continue
+
+        seen.add(id(child))
+        stack.append(child)
+
+    return size, objects, False
+
+  @classmethod
+  def reset(cls) -> None:
+    """Discard the recorded history."""
+    with cls._lock:
+      cls._history.clear()
+
+  @classmethod
+  def start_sampling(cls, interval: float, sample: Callable[[], None]) -> None:
+    """
+    Call `sample` every `interval` seconds on a daemon thread, replacing the previous sampler.
+
+    :param interval: Seconds between samples
+    :param sample: Callable taking a sample, its errors are reported and sampling goes on
+    :return None: No return value
+    """
+    cls.stop_sampling()
+    stop = Event()
+    thread = Thread(target=cls._sample_forever, args=(interval, sample, stop), name='singletonize-memory', daemon=True)
+
+    with cls._lock:
+      cls._sampling = (thread, stop)
+
+    thread.start()
+
+  @classmethod
+  def stop_sampling(cls) -> None:
+    """
+    Stop the sampler, waiting for a sample in progress.
+
+    :return None: No return value
+    """
+    with cls._lock:
+      sampling, cls._sampling = cls._sampling, None
+
+    if sampling is not None:
+      sampling[1].set()
+
+      if sampling[0] is not current_thread():
+        sampling[0].join()
+
+  @staticmethod
+  def _sample_forever(interval: float, sample: Callable[[], None], stop: Event) -> None:
+    while not stop.wait(interval):
+      try:
+        sample()
+      except Exception:
+        sys.excepthook(*sys.exc_info())
+
+  @classmethod
+  def _after_fork_in_child(cls) -> None:
+    """Drop the sampler of the parent process, whose thread does not exist in the child."""
+    cls._lock = Lock()
+    cls._sampling = None
+
+  @classmethod
+  def _attributes(cls, obj: Any) -> List[Any]:
+    """Get the attribute dict and slot values of an object."""
+    children: List[Any] = []
+    state = getattr(obj, '__dict__', None)
+
+    if isinstance(state, dict):
+      children.append(state)
+
+    kind = type(obj)
+    names = cls._slots.get(kind)
+
+    if names is None:
+      found: List[str] = []
+
+      for klass in kind.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        found.extend(name for name in ((slots,) if isinstance(slots, str) else slots) if name not in ('__dict__', '__weakref__'))
+
+      names = cls._slots[kind] = tuple(found)
+
+    for name in names:
+      try:
+        children.append(getattr(obj, name))
+      except AttributeError:
+        pass
+
+    return children
+
+  @staticmethod
+  def _is_singleton(obj: Any) -> bool:
+    """Check whether an object is the instance of a singleton class, accounted with that class."""
+    return type(obj).__dict__.get('_singleton_instance') is obj and obj is not None
+
+  @staticmethod
+  def _mapped(mapped: mmap.mmap) -> int:
+    try:
+      return len(mapped)
+    except ValueError:
+      # Closed mapping.
+      return 0
+
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(after_in_child=MemoryAccounting._after_fork_in_child)
@@ -0,0 +1,46 @@
+"""Utility module for single-flight instance creation."""
+from copy import copy
+from threading import Event, get_ident
+from typing import Any, Optional
+
+class PendingCreation:
+  """Completion handle shared by every thread waiting on the same instance construction."""
+  __slots__ = ('owner', '_event', '_instance', '_error')
+
+  def __init__(self) -> None:
+    self.owner = get_ident()
+    self._event = Event()
+    self._instance: Any = None
+    self._error: Optional[BaseException] = None
+
+  def complete(self, instance: Any) -> None:
+    """Publish the constructed instance and wake every waiter."""
+    self._instance = instance
+    self._event.set()
+
+  def fail(self, error: BaseException) -> None:
+    """Publish the construction error and wake every waiter."""
+    self._error = error
+    self._event.set()
+
+  def wait(self) -> Any:
+    """
+    Block until the owner finishes, then return its instance or raise its error.
+
+    Each waiter raises its own copy of the error, chained to the original, so
+    concurrent raises never share and corrupt a single traceback.
+    """
+    self._event.wait()
+
+    if self._error is not None:
+      raise PendingCreation.copy_error(self._error) from self._error
+
+    return self._instance
+
+  @staticmethod
+  def copy_error(error: BaseException) -> BaseException:
+    """Return a traceback-free copy of a construction error for one waiter."""
+    try:
+      return copy(error).with_traceback(None)
+    except Exception:
+      return RuntimeError(f'Instance construction failed: {error!r}')
@@ -0,0 +1,95 @@
+"""Utility module for delayed background jobs, such as instance refreshes."""
+import heapq
+import os
+import sys
+from itertools import count
+from threading import Condition, Thread
+from time import monotonic
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple, Callable
+
+_Entry = Tuple[float, int, Hashable, Callable[[], None]]
+
+class RefreshStats(NamedTuple):
+  """Outcome of the background refreshes of one singleton class."""
+  refreshes: int
+  failures: int
+  last_duration: Optional[float]
+  last_error: Optional[BaseException]
+
+class RefreshScheduler:
+  """
+  Daemon worker running delayed jobs, such as refreshes and retirements, when they fall due.
+
+  Each key has at most one job scheduled: scheduling a key again, or cancelling
+  it, discards its previous job. Jobs run one at a time on the worker thread.
+  """
+  _condition = Condition()
+  _heap: List[_Entry] = []
+  _tokens: Dict[Hashable, int] = {}
+  _counter = count()
+  _worker: Optional[Thread] = None
+
+  @classmethod
+  def schedule(cls, key: Hashable, delay: float, job: Callable[[], None]) -> None:
+    """
+    Run a job after a delay, replacing the job previously scheduled for the key.
+
+    :param key: Identifier of the job
+    :param delay: Seconds to wait before running the job
+    :param job: Callable run on the worker thread
+    :return None: No return value
+    """
+    with cls._condition:
+      token = next(cls._counter)
+      cls._tokens[key] = token
+      heapq.heappush(cls._heap, (monotonic() + delay, token, key, job))
+
+      if cls._worker is None or not cls._worker.is_alive():
+        cls._worker = Thread(target=cls._run, name='singletonize-refresh', daemon=True)
+        cls._worker.start()
+
+      cls._condition.notify_all()
+
+  @classmethod
+  def cancel(cls, key: Hashable) -> None:
+    """
+    Discard the job scheduled for the key, if any.
+
+    :param key: Identifier of the job
+    :return None: No return value
+    """
+    with cls._condition:
+      cls._tokens.pop(key, None)
+
+  @classmethod
+  def _after_fork_in_child(cls) -> None:
+    """Drop the worker and jobs of the parent process, which do not exist in the child."""
+    cls._condition = Condition()
+    cls._heap = []
+    cls._tokens = {}
+    cls._worker = None
+
+  @classmethod
+  def _run(cls) -> None:
+    """Run the due jobs forever, sleeping until the next one."""
+    while True:
+      with cls._condition:
+        while not cls._heap or cls._heap[0][0] > monotonic():
+          cls._condition.wait(cls._heap[0][0] - monotonic() if cls._heap else None)
+
+        _, token, key, job = heapq.heappop(cls._heap)
+
+        if cls._tokens.get(key) != token:
+          continue
+
+        del cls._tokens[key]
+
+      try:
+        job()
+      except Exception:
+        sys.excepthook(*sys.exc_info())
+
+      del job
+
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(after_in_child=RefreshScheduler._after_fork_in_child)
@@ -0,0 +1,19 @@
+"""Utility module for the instance held by one thread or context."""
+from typing import Any, List, Optional
+from weakref import WeakSet, finalize
+
+class ScopeState:
+  """
+  Instance of a scoped singleton class in one thread or context, with its tracked holders.
+
+  The state is only referenced by its thread or context, so it is collected when
+  that scope ends, which triggers the finalizer releasing the instance.
+  """
+  __slots__ = ('instance', 'refs', 'held', 'creating', 'finalizer', '__weakref__')
+
+  def __init__(self) -> None:
+    self.instance: Any = None
+    self.refs: WeakSet[Any] = WeakSet()
+    self.held: List[Any] = []
+    self.creating = False
+    self.finalizer: Optional[finalize] = None
@@ -0,0 +1,241 @@
+"""Module for fixed-layout shared memory segments attached by several processes."""
+import atexit
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from threading import RLock
+from typing import Any, Dict, Optional, Set, Tuple
+
+try:
+  import fcntl
+except ImportError: # pragma: no cover - Windows
+  fcntl = None # type: ignore[assignment]
+
+FIELD_FORMATS = 'bBhHiIlLqQnNfd?c'
+# Layout fingerprint and number of attached processes.
+_HEADER = struct.Struct('<QQ')
+_ALIGNMENT = 8
+
+class SharedField:
+  """
+  Fixed-layout array stored in the shared memory segment of its class.
+
+  Reading the field returns a memoryview over the segment, cast to `format`.
+  """
+  __slots__ = ('format', 'length', 'name')
+
+  def __init__(self, format: str = 'B', length: int = 1) -> None:
+    if len(format) != 1 or format not in FIELD_FORMATS:
+      raise ValueError(f'Unsupported field format {format!r}, expected one of {FIELD_FORMATS!r}')
+
+    if length < 1:
+      raise ValueError(f'Field length must be positive, got {length}')
+
+    self.format = format
+    self.length = length
+    self.name = ''
+
+  def __set_name__(self, owner: type, name: str) -> None:
+    self.name = name
+
+  @property
+  def size(self) -> int:
+    """Size of the field in bytes."""
+    return struct.calcsize(self.format) * self.length
+
+  def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+    if instance is None:
+      return self
+
+    return type(instance)._shared_segment.view(self.name)
+
+  def __set__(self, instance: Any, value: Any) -> None:
+    """Copy a buffer of the same format and length into the segment."""
+    self.__get__(instance)[:] = value
+
+class SegmentLock:
+  """Reentrant lock excluding both the threads of this process and other processes."""
+  __slots__ = ('path', '_lock', '_depth', '_fd')
+
+  def __init__(self, path: str) -> None:
+    self.path = path
+    self._lock = RLock()
+    self._depth = 0
+    self._fd = -1
+
+  def __enter__(self) -> 'SegmentLock':
+    self._lock.acquire()
+
+    if self._depth == 0:
+      try:
+        # Opened per acquisition: a descriptor inherited across fork would share the lock with the parent.
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        try:
+          fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+          os.close(fd)
+          raise
+      except BaseException:
+        self._lock.release()
+        raise
+
+      self._fd = fd
+
+    self._depth += 1
+    return self
+
+  def __exit__(self, *exc_info: Any) -> None:
+    self._depth -= 1
+
+    if self._depth == 0:
+      fd, self._fd = self._fd, -1
+      fcntl.flock(fd, fcntl.LOCK_UN)
+      os.close(fd)
+
+    self._lock.release()
+
+class SharedSegment:
+  """
+  Shared memory segment laid out from a set of `SharedField`s.
+
+  Its header stores a fingerprint of the layout and the number of attached
+  processes. `attach` and `detach` must be called with `lock` held, and the
+  last process to detach unlinks the segment. Segments still attached when the
+  interpreter exits are detached then.
+  """
+  __slots__ = ('name', 'size', 'lock', '_offsets', '_fingerprint', '_memory', '_views')
+
+  def __init__(self, name: str, fields: Dict[str, SharedField]) -> None:
+    if fcntl is None:
+      raise NotImplementedError('Shared memory segments require a POSIX platform')
+
+    offset = _HEADER.size
+    self._offsets: Dict[str, Tuple[int, SharedField]] = {}
+
+    for field_name, field in fields.items():
+      self._offsets[field_name] = (offset, field)
+      offset += -(-field.size // _ALIGNMENT) * _ALIGNMENT
+
+    layout = repr([(field_name, field.format, field.length) for field_name, field in fields.items()])
+    self.name = name
+    self.size = offset
+    self.lock = SegmentLock(os.path.join(tempfile.gettempdir(), f'{name}.lock'))
+    self._fingerprint = int.from_bytes(hashlib.sha1(layout.encode()).digest()[:8], 'little')
+    self._memory: Optional[SharedMemory] = None
+    self._views: Dict[str, memoryview] = {}
+
+  @property
+  def attached(self) -> bool:
+    """Whether this process is attached to the segment."""
+    return self._memory is not None
+
+  def view(self, name: str) -> memoryview:
+    """Get the memoryview of a field."""
+    view = self._views.get(name)
+
+    if view is None:
+      raise RuntimeError(f'Shared memory segment {self.name!r} is not attached')
+
+    return view
+
+  def attach(self) -> bool:
+    """Create or attach the segment, returning True if this process created it."""
+    try:
+      memory = _open(self.name, True, self.size)
+      _HEADER.pack_into(memory.buf, 0, self._fingerprint, 0)
+      created = True
+    except FileExistsError:
+      memory = _open(self.name, False, 0)
+      created = False
+
+    fingerprint, count = _HEADER.unpack_from(memory.buf, 0)
+
+    if fingerprint != self._fingerprint or memory.size < self.size:
+      memory.close()
+      raise ValueError(f'Shared memory segment {self.name!r} was created with a different layout')
+
+    _HEADER.pack_into(memory.buf, 0, fingerprint, count + 1)
+    self._memory = memory
+    self._views = {
+      name: memory.buf[offset:offset + field.size].cast(field.format)
+      for name, (offset, field) in self._offsets.items()
+    }
+    _attached.add(self)
+    return created
+
+  def detach(self) -> None:
+    """Leave the segment, unlinking it if no other process is attached."""
+    memory = self._memory
+
+    if memory is None:
+      return
+
+    for view in self._views.values():
+      try:
+        view.release()
+      except BufferError:
+        # Buffers exported from the view keep it alive until they are collected.
+        pass
+
+    _attached.discard(self)
+    self._memory = None
+    self._views = {}
+    fingerprint, count = _HEADER.unpack_from(memory.buf, 0)
+    _HEADER.pack_into(memory.buf, 0, fingerprint, count - 1)
+
+    try:
+      memory.close()
+    except BufferError:
+      # Views exported by the caller keep the mapping alive until they are collected.
+      pass
+
+    if count == 1:
+      _unlink(memory)
+
+  def after_fork_in_child(self, keep: bool) -> None:
+    """Replace the lock, then count the child as attached or drop the inherited mapping."""
+    self.lock = SegmentLock(self.lock.path)
+
+    if self._memory is None:
+      return
+
+    if keep:
+      with self.lock:
+        fingerprint, count = _HEADER.unpack_from(self._memory.buf, 0)
+        _HEADER.pack_into(self._memory.buf, 0, fingerprint, count + 1)
+    else:
+      _attached.discard(self)
+      self._memory = None
+      self._views = {}
+
+# Segments attached by this process, detached at exit since the resource tracker ignores them.
+_attached: Set[SharedSegment] = set()
+
+def _detach_at_exit() -> None:
+  """Detach the segments left attached, so the attach counts stay right and the last process unlinks them."""
+  for segment in list(_attached):
+    with segment.lock:
+      segment.detach()
+
+atexit.register(_detach_at_exit)
+
+def _open(name: str, create: bool, size: int) -> SharedMemory:
+  """Open a segment whose lifetime is managed by its attach count, not by the resource tracker."""
+  if sys.version_info >= (3, 13):
+    return SharedMemory(name, create, size, track=False)
+
+  memory = SharedMemory(name, create, size)
+  resource_tracker.unregister(memory._name, 'shared_memory') # type: ignore[attr-defined]
+  return memory
+
+def _unlink(memory: SharedMemory) -> None:
+  if sys.version_info < (3, 13):
+    # `unlink` unregisters the name from the tracker, so it is registered back first.
+    resource_tracker.register(memory._name, 'shared_memory') # type: ignore[attr-defined]
+
+  memory.unlink()
@@ -0,0 +1,153 @@
+"""Utility module for opt-in singleton usage statistics."""
+from .lifecycle_hooks import LifecycleEvent, LifecycleEventName
+
+from bisect import bisect_left
+from threading import Lock
+from typing import Type, Dict, List, NamedTuple, Tuple, Any
+from weakref import WeakSet
+
+# Upper bounds in seconds of the latency buckets, the last bucket being unbounded.
+LATENCY_BOUNDS: Tuple[float, ...] = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+STATS_EVENTS: Tuple[LifecycleEventName, ...] = ('lock_wait', 'wait', 'create_end', 'detach', 'cleanup')
+
+class LatencySnapshot(NamedTuple):
+  """Latency histogram of one operation, in seconds."""
+  count: int
+  total: float
+  max: float
+  buckets: Tuple[int, ...]
+
+  @property
+  def mean(self) -> float:
+    """Mean latency, 0 without samples."""
+    return self.total / self.count if self.count else 0.0
+
+class StatsSnapshot(NamedTuple):
+  """Usage statistics of one singleton class."""
+  hits: int
+  misses: int
+  waits: int
+  failures: int
+  detaches: int
+  lock_wait: LatencySnapshot
+  init: LatencySnapshot
+  cleanup: LatencySnapshot
+
+class LatencyHistogram:
+  """Decade histogram of latencies."""
+  __slots__ = ('count', 'total', 'max', 'buckets')
+
+  def __init__(self) -> None:
+    self.count = 0
+    self.total = 0.0
+    self.max = 0.0
+    self.buckets: List[int] = [0] * (len(LATENCY_BOUNDS) + 1)
+
+  def add(self, seconds: float) -> None:
+    self.count += 1
+    self.total += seconds
+    self.max = max(self.max, seconds)
+    self.buckets[bisect_left(LATENCY_BOUNDS, seconds)] += 1
+
+  def snapshot(self) -> LatencySnapshot:
+    return LatencySnapshot(self.count, self.total, self.max, tuple(self.buckets))
+
+class ClassStats:
+  """Mutable statistics of one singleton class."""
+  __slots__ = ('hits', 'misses', 'waits', 'failures', 'detaches', 'lock_wait', 'init', 'cleanup')
+
+  def __init__(self) -> None:
+    self.hits = 0
+    self.misses = 0
+    self.waits = 0
+    self.failures = 0
+    self.detaches = 0
+    self.lock_wait = LatencyHistogram()
+    self.init = LatencyHistogram()
+    self.cleanup = LatencyHistogram()
+
+  def snapshot(self) -> StatsSnapshot:
+    return StatsSnapshot(
+      self.hits, self.misses, self.waits, self.failures, self.detaches,
+      self.lock_wait.snapshot(), self.init.snapshot(), self.cleanup.snapshot()
+    )
+
+class SingletonStats:
+  """
+  Registry of per-class statistics, recorded only while `enabled`.
+
+  Hits and misses are counted by the instrumented lookup, and every other figure
+  by `observe` from lifecycle events. Each class keeps its record in its own
+  namespace, so the lookup finds it without a registry access. Hits and misses are
+  counted without a lock and may undercount under contention.
+  """
+  enabled = False
+  _lock = Lock()
+  _classes: WeakSet[Type[Any]] = WeakSet()
+
+  @classmethod
+  def record_for(cls, owner: Type[Any]) -> ClassStats:
+    """
+    Get the statistics record of a class, creating it if needed.
+
+    :param owner: Singleton class
+    :return ClassStats: Mutable record of the class
+    """
+    record: ClassStats = owner.__dict__.get('_singleton_stats')
+
+    if record is None:
+      with cls._lock:
+        record = owner.__dict__.get('_singleton_stats') or ClassStats()
+        type.__setattr__(owner, '_singleton_stats', record)
+        cls._classes.add(owner)
+
+    return record
+
+  @classmethod
+  def observe(cls, event: LifecycleEvent) -> None:
+    """
+    Record a lifecycle event, as the subscriber registered while statistics are enabled.
+
+    :param event: Lifecycle event of one of `STATS_EVENTS`
+    :return None: No return value
+    """
+    record = cls.record_for(event.cls)
+    duration = event.duration or 0.0
+
+    with cls._lock:
+      if event.name == 'lock_wait':
+        record.lock_wait.add(duration)
+      elif event.name == 'wait':
+        record.waits += 1
+      elif event.name == 'create_end':
+        if event.error is None:
+          record.init.add(duration)
+        else:
+          record.failures += 1
+      elif event.name == 'detach':
+        record.detaches += 1
+      elif event.name == 'cleanup':
+        record.cleanup.add(duration)
+
+  @classmethod
+  def snapshot(cls) -> Dict[Type[Any], StatsSnapshot]:
+    """
+    Copy the statistics of every class recorded so far.
+
+    :return Dict[Type[Any], StatsSnapshot]: Statistics by class
+    """
+    with cls._lock:
+      return {owner: owner.__dict__['_singleton_stats'].snapshot() for owner in list(cls._classes)}
+
+  @classmethod
+  def reset(cls) -> None:
+    """
+    Discard the statistics of every class.
+
+    :return None: No return value
+    """
+    with cls._lock:
+      for owner in list(cls._classes):
+        type.__setattr__(owner, '_singleton_stats', None)
+
+      cls._classes.clear()
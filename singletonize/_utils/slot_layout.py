@@ -0,0 +1,145 @@
+"""Utility module for slots-backed singleton classes."""
+import inspect
+from typing import Callable, ClassVar, Dict, FrozenSet, Iterable, Tuple, Union, get_origin, Any
+
+# Slot holding the write state: unset while the instance is built, then True only during updates.
+UPDATING_SLOT = '_updating'
+_MISSING = object()
+
+class SlotLayout:
+  """
+  Builds the `__slots__` layout and write guard of `slots` singleton classes.
+
+  Public fields are sealed once the instance is built and can then only be
+  written by `update_instance`, private fields stay writable, and any other
+  name is rejected. The guard decides from sets computed at class creation,
+  without probing the instance.
+  """
+  @staticmethod
+  def fields(namespace: Dict[str, Any], declared: Union[bool, Iterable[str]]) -> Tuple[str, ...]:
+    """
+    Get the fields of a class: the declared names, else the annotated class attributes, else the `__init__` parameters.
+
+    :param namespace: Class namespace
+    :param declared: Field names, or True to derive them
+    :return Tuple[str, ...]: Field names in declaration order
+    :raises TypeError: If an annotated field has a class-level default
+    """
+    if declared is not True:
+      return tuple(dict.fromkeys(declared)) # type: ignore[arg-type]
+
+    annotations = SlotLayout._annotations(namespace)
+    fields = tuple(name for name, annotation in annotations.items() if not SlotLayout._is_class_var(annotation))
+
+    if fields:
+      defaults = [name for name in fields if name in namespace]
+
+      if defaults:
+        raise TypeError(f'Fields {defaults} of a slots singleton cannot have class-level defaults, set them in __init__')
+
+      return fields
+
+    init = namespace.get('__init__')
+
+    if init is None:
+      return ()
+
+    kinds = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    return tuple(parameter.name for parameter in list(inspect.signature(init).parameters.values())[1:] if parameter.kind in kinds)
+
+  @staticmethod
+  def apply(namespace: Dict[str, Any], bases: Tuple[type, ...], declared: Union[bool, Iterable[str]]) -> Tuple[str, ...]:
+    """
+    Add the `__slots__` and the write guard of a slots class to its namespace.
+
+    :param namespace: Class namespace, modified in place
+    :param bases: Class bases
+    :param declared: Field names, or True to derive them
+    :return Tuple[str, ...]: Every field of the class, inherited ones included
+    :raises TypeError: If a base has an instance dict or the class declares `__slots__`
+    """
+    if '__slots__' in namespace:
+      raise TypeError('A slots singleton derives its __slots__, it cannot declare them')
+
+    for base in bases:
+      if base.__dictoffset__:
+        raise TypeError(f'A slots singleton cannot derive from {base.__qualname__}, whose instances have a __dict__')
+
+    inherited = tuple(name for base in bases for name in getattr(base, '_slot_fields', ()))
+    own = [name for name in SlotLayout.fields(namespace, declared) if name not in inherited]
+    slots = list(own)
+
+    if not any(base.__weakrefoffset__ for base in bases):
+      slots.append('__weakref__')
+
+    if UPDATING_SLOT not in inherited:
+      slots.append(UPDATING_SLOT)
+      own.append(UPDATING_SLOT)
+
+    fields = (*inherited, *own)
+    namespace['__slots__'] = tuple(slots)
+
+    if '__setattr__' not in namespace:
+      namespace['__setattr__'] = SlotLayout.guard(fields)
+
+    return fields
+
+  @staticmethod
+  def guard(fields: Iterable[str]) -> Callable[[Any, str, Any], None]:
+    """Build the `__setattr__` of a slots class from its fields."""
+    names = frozenset(fields)
+    sealed: FrozenSet[str] = frozenset(name for name in names if not name.startswith('_'))
+    set_slot = object.__setattr__
+
+    def __setattr__(self: Any, key: str, value: Any) -> None:
+      if key in sealed:
+        try:
+          writable = self._updating
+        except AttributeError:
+          # Unset until the instance is built.
+          writable = True
+
+        if not writable:
+          raise AttributeError(f'Cannot set attribute {key} on singleton instance')
+      elif key not in names:
+        raise AttributeError(f'{type(self).__qualname__} has no field {key!r}, declare it to set it')
+
+      set_slot(self, key, value)
+
+    return __setattr__
+
+  @staticmethod
+  def attributes(obj: object) -> Dict[str, Any]:
+    """Get the attributes of an object from its `__dict__`, or from its fields if it is slots-backed."""
+    fields = getattr(type(obj), '_slot_fields', None)
+
+    if fields is None:
+      return vars(obj)
+
+    values: Dict[str, Any] = {}
+
+    for name in fields:
+      value = getattr(obj, name, _MISSING)
+
+      if value is not _MISSING and name != UPDATING_SLOT:
+        values[name] = value
+
+    return values
+
+  @staticmethod
+  def _annotations(namespace: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the annotations of a class namespace, evaluated lazily since Python 3.14."""
+    annotations = namespace.get('__annotations__')
+
+    if annotations is None and '__annotate__' in namespace:
+      import annotationlib # type: ignore[import-not-found]
+      annotations = annotationlib.call_annotate_function(namespace['__annotate__'], annotationlib.Format.FORWARDREF)
+
+    return dict(annotations or {})
+
+  @staticmethod
+  def _is_class_var(annotation: Any) -> bool:
+    if isinstance(annotation, str):
+      return annotation.startswith(('ClassVar', 'typing.ClassVar'))
+
+    return annotation is ClassVar or get_origin(annotation) is ClassVar
@@ -0,0 +1,129 @@
+"""Utility module for compiled serializers of singleton instance attributes."""
+from .slot_layout import SlotLayout
+
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Callable, Dict, Optional, Tuple, Any
+
+_encode = json.JSONEncoder(separators=(',', ':')).encode
+# Inline encoders of the exact scalar types, other values go through the JSON encoder.
+_SCALARS: Dict[type, Callable[[Any], str]] = {
+  str: encode_basestring_ascii,
+  int: int.__repr__,
+  bool: lambda value: 'true' if value else 'false',
+  type(None): lambda value: 'null'
+}
+# Layout changes after which a class stops compiling serializers for its dict-backed instances.
+MAX_RECOMPILES = 8
+
+class StateSerializer:
+  """
+  Serializer of the public attributes of one instance layout, compiled once per class.
+
+  The serializers of slots classes read their public fields, fixed at class
+  creation. Those of other classes read the public keys of the instance dict they
+  were compiled from, and check the dict still has exactly those keys in that
+  order, compiling a new serializer when it does not. Classes whose layout keeps changing fall back to
+  filtering the attributes on every call.
+  """
+  __slots__ = ('fields', 'recompiles', 'to_dict', 'to_json')
+
+  def __init__(self, fields: Optional[Tuple[str, ...]], layout: Tuple[Any, ...], slotted: bool, recompiles: int) -> None:
+    """
+    Compile the serializer.
+
+    :param fields: Public fields in order, None for the uncompiled fallback
+    :param layout: Keys of the instance dict in order, private ones included
+    :param slotted: Whether the fields are read from slots rather than the instance dict
+    :param recompiles: Number of serializers compiled for the class before this one
+    """
+    self.fields = fields
+    self.recompiles = recompiles
+
+    if fields is None:
+      self.to_dict: Callable[[Any], Dict[str, Any]] = StateSerializer._filter
+      self.to_json: Callable[[Any], bytes] = lambda obj: _encode(StateSerializer._filter(obj)).encode()
+      return
+
+    read = [f'obj.{name}' if slotted else f'state[{name!r}]' for name in fields]
+    header = ['  state = obj.__dict__', '  if tuple(state) != layout: raise KeyError'] if not slotted else []
+    keys = [('{' if index == 0 else ',') + encode_basestring_ascii(name) + ':' for index, name in enumerate(fields)]
+    source = '\n'.join([
+      'def to_dict(obj):',
+      *header,
+      '  return {' + ', '.join(f'{name!r}: {value}' for name, value in zip(fields, read)) + '}',
+      'def to_json(obj):',
+      *header,
+      *(f'  value = {value}\n  part_{index} = scalars.get(type(value), encode)(value)' for index, value in enumerate(read)),
+      '  return "".join((' + ''.join(f'{key!r}, part_{index}, ' for index, key in enumerate(keys)) + f'{"}" if fields else "{}"!r})).encode()'
+    ])
+    namespace: Dict[str, Any] = {'scalars': _SCALARS, 'encode': _encode, 'layout': layout}
+    exec(source, namespace)
+    self.to_dict = namespace['to_dict']
+    self.to_json = namespace['to_json']
+
+  @staticmethod
+  def as_dict(obj: object) -> Dict[str, Any]:
+    """
+    Get the public attributes of an object.
+
+    :param obj: Object to serialize
+    :return Dict[str, Any]: Public attributes by name
+    """
+    try:
+      return StateSerializer._of(obj).to_dict(obj)
+    except (KeyError, AttributeError):
+      return StateSerializer._recompile(obj).to_dict(obj)
+
+  @staticmethod
+  def as_json(obj: object) -> bytes:
+    """
+    Encode the public attributes of an object as a JSON object, without building a dict of them.
+
+    :param obj: Object to serialize
+    :return bytes: UTF-8 encoded JSON object
+    :raises TypeError: If an attribute is not JSON serializable
+    """
+    try:
+      return StateSerializer._of(obj).to_json(obj)
+    except (KeyError, AttributeError):
+      return StateSerializer._recompile(obj).to_json(obj)
+
+  @staticmethod
+  def _of(obj: object) -> 'StateSerializer':
+    """Get the serializer stored on the class of an object, compiling it on first use."""
+    serializer: Optional[StateSerializer] = type(obj).__dict__.get('_singleton_serializer')
+    return serializer if serializer is not None else StateSerializer._compile(obj, 0)
+
+  @staticmethod
+  def _recompile(obj: object) -> 'StateSerializer':
+    """Replace a serializer whose layout no longer matches the object."""
+    current: Optional[StateSerializer] = type(obj).__dict__.get('_singleton_serializer')
+    recompiles = current.recompiles + 1 if current is not None else 0
+
+    # The layout of slots classes never changes, an unset field is only skipped by the fallback.
+    if getattr(type(obj), '_slot_fields', None) is not None:
+      return StateSerializer(None, (), False, recompiles)
+
+    return StateSerializer._compile(obj, recompiles)
+
+  @staticmethod
+  def _compile(obj: object, recompiles: int) -> 'StateSerializer':
+    """Compile the serializer of the layout of an object and store it on its class."""
+    fields: Optional[Tuple[str, ...]] = getattr(type(obj), '_slot_fields', None)
+
+    if fields is not None:
+      serializer = StateSerializer(tuple(name for name in fields if not name.startswith('_')), (), True, recompiles)
+    elif recompiles > MAX_RECOMPILES:
+      serializer = StateSerializer(None, (), False, recompiles)
+    else:
+      state = vars(obj)
+      public = tuple(key for key in state if isinstance(key, str) and not key.startswith('_'))
+      serializer = StateSerializer(public, tuple(state), False, recompiles)
+
+    type.__setattr__(type(obj), '_singleton_serializer', serializer)
+    return serializer
+
+  @staticmethod
+  def _filter(obj: object) -> Dict[str, Any]:
+    return {key: value for key, value in SlotLayout.attributes(obj).items() if not key.startswith('_')}
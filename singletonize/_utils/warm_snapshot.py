@@ -0,0 +1,181 @@
+"""Utility module for memory-mapped warm-start snapshots of singleton instances."""
+import importlib
+import io
+import json
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import warnings
+from typing import Type, Callable, Dict, List, Optional, Tuple, Union, Any
+
+WarmStartKey = Union[str, Callable[[], str]]
+MAGIC = b'SGLZSNP1'
+_PREFIX = struct.Struct('<8sI')
+# Alignment of the pickle stream and of every buffer in the file.
+ALIGNMENT = 64
+
+def _align(offset: int) -> int:
+  return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def _view(buffer: Any, format: str, shape: Tuple[int, ...]) -> memoryview:
+  """Rebuild a memoryview over a buffer mapped from the snapshot file."""
+  view = memoryview(buffer).cast('B')
+  return view if format == 'B' and len(shape) == 1 else view.cast(format, shape)
+
+class _SnapshotPickler(pickle.Pickler):
+  """Pickler keeping live singletons by reference and contiguous memoryviews out of band."""
+  def __init__(self, file: io.BytesIO, owner: Any, buffers: List[pickle.PickleBuffer]) -> None:
+    super().__init__(file, protocol=5, buffer_callback=buffers.append)
+    self.owner = owner
+
+  def persistent_id(self, obj: Any) -> Optional[Tuple[str, ...]]:
+    if obj is self.owner:
+      return ('self',)
+
+    cls = type(obj)
+
+    if obj is not None and cls.__dict__.get('_singleton_instance') is obj:
+      return ('singleton', cls.__module__, cls.__qualname__)
+
+    return None
+
+  def reducer_override(self, obj: Any) -> Any:
+    if type(obj) is memoryview and obj.c_contiguous:
+      return _view, (pickle.PickleBuffer(obj), obj.format, obj.shape)
+
+    return NotImplemented
+
+class _SnapshotUnpickler(pickle.Unpickler):
+  """Unpickler resolving singleton references to the live instances."""
+  def __init__(self, file: io.BytesIO, owner: Any, buffers: List[memoryview]) -> None:
+    super().__init__(file, buffers=buffers)
+    self.owner = owner
+
+  def persistent_load(self, pid: Tuple[str, ...]) -> Any:
+    if pid == ('self',):
+      return self.owner
+
+    _, module, qualname = pid
+    target: Any = importlib.import_module(module)
+
+    for name in qualname.split('.'):
+      target = getattr(target, name)
+
+    return target()
+
+class WarmSnapshot:
+  """
+  Snapshot file of the attributes of a singleton instance, restored memory-mapped.
+
+  The file holds a JSON header, naming the class and its version key, then a
+  pickle stream, then the buffers pickled out of band. Restoring maps the file
+  read-only, checks the header and unpickles the attributes, handing the mapped
+  buffers to the objects that support out-of-band pickling, such as NumPy arrays
+  and memoryviews, without copying them. Live singletons referenced by the
+  attributes are stored by reference and resolved to the current instances.
+  """
+  @staticmethod
+  def key_of(key: WarmStartKey) -> str:
+    """Get the version key, calling it if it is callable."""
+    return str(key() if callable(key) else key)
+
+  @staticmethod
+  def write(path: str, owner: Type[Any], key: str, instance: object, state: Dict[str, Any]) -> None:
+    """
+    Write a snapshot atomically, replacing any previous one.
+
+    :param path: Snapshot file path
+    :param owner: Singleton class
+    :param key: Version key of the state
+    :param instance: Instance the state belongs to
+    :param state: Attributes of the instance
+    :return None: No return value
+    """
+    stream = io.BytesIO()
+    buffers: List[pickle.PickleBuffer] = []
+    _SnapshotPickler(stream, instance, buffers).dump(state)
+    raws = [buffer.raw() for buffer in buffers]
+
+    layout: List[Tuple[int, int]] = []
+    offset = _align(stream.tell())
+
+    for raw in raws:
+      layout.append((offset, raw.nbytes))
+      offset = _align(offset + raw.nbytes)
+
+    header = json.dumps({
+      'class': f'{owner.__module__}.{owner.__qualname__}',
+      'key': key,
+      'state': stream.tell(),
+      'buffers': layout
+    }).encode()
+    base = _align(_PREFIX.size + len(header))
+    directory = os.path.dirname(os.path.abspath(path))
+
+    with tempfile.NamedTemporaryFile('wb', dir=directory, prefix='.snapshot-', delete=False) as file:
+      try:
+        file.write(_PREFIX.pack(MAGIC, len(header)))
+        file.write(header)
+        file.seek(base)
+        file.write(stream.getbuffer())
+
+        for (start, _), raw in zip(layout, raws):
+          file.seek(base + start)
+          file.write(raw)
+
+        file.truncate(base + offset)
+      except BaseException:
+        file.close()
+        os.unlink(file.name)
+        raise
+
+    os.replace(file.name, path)
+
+  @staticmethod
+  def read(path: str, owner: Type[Any], key: str, instance: object) -> Optional[Dict[str, Any]]:
+    """
+    Restore the attributes saved by `write`, if the snapshot matches the class and key.
+
+    :param path: Snapshot file path
+    :param owner: Singleton class
+    :param key: Expected version key
+    :param instance: Object the attributes are restored for, resolving its self references
+    :return Optional[Dict[str, Any]]: Attributes, or None if the snapshot is missing, stale or unreadable
+    """
+    try:
+      with open(path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+      # Missing or empty file.
+      return None
+
+    view = memoryview(mapped)
+
+    try:
+      magic, size = _PREFIX.unpack_from(view)
+
+      if magic != MAGIC:
+        raise ValueError('not a singleton snapshot')
+
+      header = json.loads(bytes(view[_PREFIX.size:_PREFIX.size + size]))
+
+      if header['class'] != f'{owner.__module__}.{owner.__qualname__}' or header['key'] != key:
+        return None
+
+      base = _align(_PREFIX.size + size)
+      buffers = [view[base + start:base + start + length] for start, length in header['buffers']]
+
+      if any(len(buffer) != length for buffer, (_, length) in zip(buffers, header['buffers'])):
+        raise ValueError('truncated snapshot')
+
+      stream = io.BytesIO(view[base:base + header['state']])
+      state: Dict[str, Any] = _SnapshotUnpickler(stream, instance, buffers).load()
+      return state
+    except Exception as error:
+      warnings.warn(f'Ignoring unreadable snapshot {path} of {owner.__qualname__}: {error!r}', RuntimeWarning, stacklevel=2)
+      return None
+    finally:
+      # Restored objects keep the mapping alive through their buffers, it is closed with the last one.
+      view.release()
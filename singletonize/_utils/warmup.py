@@ -0,0 +1,59 @@
+"""Utility module for parallel singleton warm-up."""
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Type, Dict, Tuple, Iterable, NamedTuple, Optional, Union, Any
+
+WarmupSpec = Union[
+  Type[Any],
+  Tuple[Type[Any], Tuple[Any, ...]],
+  Tuple[Type[Any], Tuple[Any, ...], Dict[str, Any]]
+]
+
+class WarmupResult(NamedTuple):
+  """Outcome of warming up one singleton class."""
+  instance: Any
+  duration: float
+  error: Optional[BaseException]
+
+def _normalize(spec: WarmupSpec) -> Tuple[Type[Any], Tuple[Any, ...], Dict[str, Any]]:
+  """Expand a warm-up spec into its class, arguments and keyword arguments."""
+  if isinstance(spec, type):
+    return spec, (), {}
+
+  if len(spec) == 2:
+    return spec[0], tuple(spec[1]), {}
+
+  return spec[0], tuple(spec[1]), dict(spec[2])
+
+def _create(cls: Type[Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> WarmupResult:
+  """Create one instance, timing it and capturing its error."""
+  start = perf_counter()
+
+  try:
+    instance = cls(*args, **kwargs)
+  except Exception as error:
+    return WarmupResult(None, perf_counter() - start, error)
+
+  return WarmupResult(instance, perf_counter() - start, None)
+
+def warmup(specs: Iterable[WarmupSpec], max_workers: Optional[int] = None) -> Dict[Type[Any], WarmupResult]:
+  """
+  Create independent singletons concurrently on a thread pool.
+
+  Each class goes through its regular single-flight creation, so warming up a class
+  that is being created elsewhere simply waits for that creation. A failing class
+  does not stop the others; its error is reported in its result.
+
+  :param specs: Classes, `(cls, args)` or `(cls, args, kwargs)` tuples to create
+  :param max_workers: Maximum number of threads, defaults to one per class
+  :return Dict[Type[Any], WarmupResult]: Instance, duration in seconds and error per class
+  """
+  normalized = [_normalize(spec) for spec in specs]
+
+  if not normalized:
+    return {}
+
+  with ThreadPoolExecutor(max_workers=max_workers or len(normalized), thread_name_prefix='singletonize-warmup') as executor:
+    futures = {cls: executor.submit(_create, cls, args, kwargs) for cls, args, kwargs in normalized}
+
+  return {cls: future.result() for cls, future in futures.items()}
@@ -0,0 +1,28 @@
+import json
+import pytest
+from benchmarks import Result, run, check_regressions
+from benchmarks.__main__ import main
+from pathlib import Path
+
+def test_check_regressions() -> None:
+  results = [Result('hit', 'ns', 120.0, 110.0, 7), Result('other', 'ns', 1e9, 1e9, 7)]
+
+  assert check_regressions(results, {'hit': 200}) == []
+  assert len(check_regressions(results, {'hit': 100})) == 1
+  assert len(check_regressions(results, {'hit': 200}, {'hit': 90.0}, tolerance=0.25)) == 1
+  assert check_regressions(results, {'hit': 200}, {'hit': 100.0}, tolerance=0.25) == []
+
+def test_run_rejects_unknown_group() -> None:
+  with pytest.raises(ValueError):
+    run(['unknown'])
+
+def test_quick_run_reports_json_and_fails_on_regression(tmp_path: Path) -> None:
+  output = tmp_path / 'report.json'
+  thresholds = tmp_path / 'thresholds.json'
+  thresholds.write_text(json.dumps({'instance_as_dict[Settings,fields=16]': 0.001}))
+
+  assert main(['data', '--quick', '--thresholds', str(thresholds), '--output', str(output)]) == 1
+  report = json.loads(output.read_text())
+  assert {result['name'] for result in report['results']} >= {'update_instance[Settings,fields=1]', 'instance_as_dict[Settings,fields=16]'}
+  assert all(result['median'] > 0 for result in report['results'])
+  assert [regression.split(':')[0] for regression in report['regressions']] == ['instance_as_dict[Settings,fields=16]']
@@ -0,0 +1,82 @@
+import gc
+import threading
+from singletonize import (
+  Singleton, Multiton, LifecycleEvent, live_singletons, detach_all, reset_many, flush_cleanup, subscribe, unsubscribe
+)
+from typing import List, Any
+
+class Config(Singleton, cleanup='deep'):
+  def __init__(self, env: str = 'dev') -> None:
+    self.env = env
+
+class Database(Singleton, cleanup='deep', depends_on=(Config,)):
+  def __init__(self) -> None:
+    self.config = Config()
+
+class Pool(Multiton, cleanup='deep'):
+  def __init__(self, name: str) -> None:
+    self.name = name
+
+def test_live_singletons_filters_by_base_and_module() -> None:
+  detach_all(module=__name__)
+  Config(), Pool('a')
+
+  assert set(live_singletons(module=__name__)) == {Config, Pool}
+  assert live_singletons(base=Multiton, module=__name__) == [Pool]
+  assert live_singletons(module=__name__.rpartition('.')[0]) and not live_singletons(module=f'{__name__}x')
+
+def test_detach_all_runs_one_cleanup_pass(monkeypatch: Any) -> None:
+  assert flush_cleanup(5)
+  Database(), Pool('a'), Pool('b')
+  holders = [{'obj': obj} for obj in (Config(), Database(), *Pool.instances().values())]
+  events: List[LifecycleEvent] = []
+  subscription = subscribe(events.append, ['detach'])
+
+  collections: List[int] = []
+  monkeypatch.setattr(gc, 'collect', lambda generation=2: collections.append(generation) or 0)
+  referrers: List[int] = []
+  get_referrers = gc.get_referrers
+  monkeypatch.setattr(gc, 'get_referrers', lambda *objs: referrers.append(len(objs)) or get_referrers(*objs))
+
+  try:
+    detached = detach_all(module=__name__)
+  finally:
+    unsubscribe(subscription)
+
+  assert flush_cleanup(5)
+  # Dependents are detached before their dependencies.
+  assert detached.index(Database) < detached.index(Config)
+  assert [event.cls for event in events] == detached
+  # Tuple referrers cost one scan each, the four instances share a single one.
+  assert collections == [2] and referrers[0] == 4 and referrers.count(4) == 1
+  assert all(holder['obj'] is None for holder in holders)
+  assert not live_singletons(module=__name__)
+
+def test_reset_many_recreates_with_new_arguments() -> None:
+  first = Config('dev')
+  results = reset_many({Config: ('prod',), Database: ()})
+
+  assert results[Config].instance is Config() is not first
+  assert Config().env == 'prod' and Database().config is Config()
+
+def test_concurrent_bulk_operations_do_not_deadlock() -> None:
+  classes = [Config, Database, Pool]
+  errors: List[BaseException] = []
+
+  def churn(order: List[type]) -> None:
+    try:
+      for _ in range(200):
+        Config(), Pool('a')
+        detach_all(order)
+    except BaseException as error:
+      errors.append(error)
+
+  threads = [threading.Thread(target=churn, args=(order,)) for order in (classes, classes[::-1])]
+
+  for thread in threads:
+    thread.start()
+
+  for thread in threads:
+    thread.join(10)
+
+  assert not any(thread.is_alive() for thread in threads) and not errors
@@ -0,0 +1,120 @@
+import pytest
+import time
+from singletonize._metaclasses import SingletonMeta
+from threading import Lock
+
+events: list[str] = []
+events_lock = Lock()
+
+def record(event: str) -> None:
+  with events_lock:
+    events.append(event)
+
+class Config(metaclass=SingletonMeta):
+  def __init__(self, env: str = 'dev') -> None:
+    time.sleep(0.05)
+    self.env = env
+    record('init Config')
+
+  def __del__(self) -> None:
+    record('del Config')
+
+class Database(metaclass=SingletonMeta, depends_on=(Config,)):
+  def __init__(self) -> None:
+    time.sleep(0.1)
+    self.env = Config().env
+    record('init Database')
+
+class Cache(metaclass=SingletonMeta, depends_on=(Config,)):
+  def __init__(self) -> None:
+    time.sleep(0.1)
+    record('init Cache')
+
+class Service(metaclass=SingletonMeta, depends_on=(Database, Cache)):
+  def __init__(self) -> None:
+    record('init Service')
+
+class Broken(metaclass=SingletonMeta):
+  def __init__(self) -> None:
+    raise ValueError('boom')
+
+class NeedsBroken(metaclass=SingletonMeta, depends_on=(Broken,)):
+  pass
+
+def detach_all() -> None:
+  for cls in (Service, Cache, Database, Config, Broken, NeedsBroken):
+    SingletonMeta.detach(cls)
+
+def test_dependencies_declared() -> None:
+  assert SingletonMeta.get_dependencies(Service) == (Database, Cache)
+  assert SingletonMeta.get_dependencies(Config) == ()
+
+def test_dependency_cycle_detected() -> None:
+  with pytest.raises(TypeError, match='Dependency cycle: Config -> Service -> (Database|Cache) -> Config'):
+    SingletonMeta.add_dependencies(Config, Service)
+
+  assert SingletonMeta.get_dependencies(Config) == ()
+
+  with pytest.raises(TypeError, match='can only depend on Singleton classes'):
+    class Invalid(metaclass=SingletonMeta, depends_on=(int,)):
+      pass
+
+def test_initialize_by_levels() -> None:
+  detach_all()
+  events.clear()
+
+  start = time.perf_counter()
+  results = SingletonMeta.initialize([Service, (Config, ('prod',))])
+  elapsed = time.perf_counter() - start
+
+  assert all(result.error is None for result in results.values())
+  assert set(results) == {Service, Database, Cache, Config}
+  assert events[0] == 'init Config'
+  assert set(events[1:3]) == {'init Database', 'init Cache'}
+  assert events[3] == 'init Service'
+  assert Database().env == 'prod'
+  assert elapsed < 0.3
+
+def test_initialize_skips_failed_dependents() -> None:
+  results = SingletonMeta.initialize([NeedsBroken])
+
+  assert isinstance(results[Broken].error, ValueError)
+  assert isinstance(results[NeedsBroken].error, RuntimeError)
+  assert not SingletonMeta.has_instance(NeedsBroken)
+
+def test_shutdown_dependents_first() -> None:
+  detach_all()
+  SingletonMeta.initialize([Service])
+  events.clear()
+
+  order: list[type] = []
+  original = SingletonMeta._remove
+
+  def spy(cls: type) -> object:
+    order.append(cls)
+    return original.__func__(SingletonMeta, cls) #type: ignore
+
+  SingletonMeta._remove = spy #type: ignore
+
+  try:
+    errors = SingletonMeta.shutdown([Config])
+  finally:
+    SingletonMeta._remove = original #type: ignore
+
+  assert set(errors) == {Service, Database, Cache, Config}
+  assert all(error is None for error in errors.values())
+  assert order[0] is Service
+  assert set(order[1:3]) == {Database, Cache}
+  assert order[3] is Config
+  assert not any(SingletonMeta.has_instance(cls) for cls in (Service, Database, Cache, Config))
+
+def test_detach_cascade() -> None:
+  detach_all()
+  SingletonMeta.initialize([Service])
+
+  SingletonMeta.detach(Database, cascade=True)
+
+  assert not SingletonMeta.has_instance(Database)
+  assert not SingletonMeta.has_instance(Service)
+  assert SingletonMeta.has_instance(Cache)
+  assert SingletonMeta.has_instance(Config)
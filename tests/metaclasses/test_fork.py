@@ -0,0 +1,104 @@
+import gc
+import os
+import pytest
+from singletonize._metaclasses import SingletonMeta
+from threading import Event, Thread
+from typing import Callable
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+
+class InheritedSingleton(metaclass=SingletonMeta):
+  def __init__(self, value: int) -> None:
+    self.value = value
+
+class RecreatedSingleton(metaclass=SingletonMeta, fork='recreate-in-child'):
+  def __init__(self) -> None:
+    self.pid = os.getpid()
+
+class FailingSingleton(metaclass=SingletonMeta, fork='fail'):
+  pass
+
+def run_in_child(check: Callable[[], str]) -> str:
+  read_fd, write_fd = os.pipe()
+  pid = os.fork()
+
+  if pid == 0:
+    os.close(read_fd)
+
+    try:
+      result = check()
+    except BaseException as error:
+      result = f'error: {error!r}'
+
+    os.write(write_fd, result.encode())
+    os._exit(0)
+
+  os.close(write_fd)
+
+  with os.fdopen(read_fd) as reader:
+    output = reader.read()
+
+  os.waitpid(pid, 0)
+  return output
+
+def test_fork_policies() -> None:
+  for cls in (InheritedSingleton, RecreatedSingleton, FailingSingleton):
+    SingletonMeta.detach(cls)
+
+  inherited = InheritedSingleton(1)
+  RecreatedSingleton()
+  FailingSingleton()
+
+  def check() -> str:
+    results = [
+      InheritedSingleton() is inherited,
+      RecreatedSingleton().pid == os.getpid(),
+    ]
+
+    try:
+      FailingSingleton()
+    except RuntimeError:
+      results.append(True)
+
+    return ','.join(str(result) for result in results)
+
+  assert run_in_child(check) == 'True,True,True'
+  assert FailingSingleton() is not None
+
+def test_fork_invalid_policy() -> None:
+  with pytest.raises(ValueError, match='Unknown fork policy'):
+    class Invalid(metaclass=SingletonMeta, fork='share'): #type: ignore
+      pass
+
+def test_fork_resets_held_locks() -> None:
+  SingletonMeta.detach(InheritedSingleton)
+
+  acquired = Event()
+  release = Event()
+
+  def hold_lock() -> None:
+    with SingletonMeta._locks[InheritedSingleton]: #type: ignore
+      acquired.set()
+      release.wait()
+
+  thread = Thread(target=hold_lock)
+  thread.start()
+  acquired.wait()
+
+  try:
+    assert run_in_child(lambda: str(InheritedSingleton(2).value)) == '2'
+  finally:
+    release.set()
+    thread.join()
+
+def test_prefork_freezes_heap() -> None:
+  SingletonMeta.detach(InheritedSingleton)
+
+  try:
+    results = SingletonMeta.prefork([(InheritedSingleton, (3,))])
+
+    assert results[InheritedSingleton].error is None
+    assert gc.get_freeze_count() > 0
+    assert run_in_child(lambda: str(InheritedSingleton().value)) == '3'
+  finally:
+    gc.unfreeze()
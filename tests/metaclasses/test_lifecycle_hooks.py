@@ -0,0 +1,106 @@
+import pytest
+import threading
+from singletonize import Singleton, LifecycleEvent, flush_cleanup, subscribe, unsubscribe
+from singletonize._metaclasses import SingletonMeta
+from typing import Iterator, List
+
+class Observed(Singleton):
+  pass
+
+class Broken(Singleton):
+  def __init__(self) -> None:
+    raise ValueError('boom')
+
+@pytest.fixture(autouse=True)
+def detached() -> Iterator[None]:
+  Observed.detach()
+  flush_cleanup(5)
+  yield
+  Observed.detach()
+  flush_cleanup(5)
+
+def test_events_follow_the_lifecycle() -> None:
+  events: List[LifecycleEvent] = []
+  subscription = subscribe(events.append, events=('create_start', 'create_end', 'detach', 'cleanup', 'reset'))
+
+  try:
+    Observed()
+    Observed.reset_instance()
+    flush_cleanup(5)
+  finally:
+    unsubscribe(subscription)
+
+  assert [event.name for event in events] == ['create_start', 'create_end', 'reset', 'detach', 'create_start', 'create_end', 'cleanup']
+  assert all(event.cls is Observed for event in events)
+  assert events[1].duration is not None and events[1].error is None
+
+def test_failed_creation_reports_error() -> None:
+  events: List[LifecycleEvent] = []
+  subscription = subscribe(events.append, events=('create_end',))
+
+  try:
+    with pytest.raises(ValueError):
+      Broken()
+  finally:
+    unsubscribe(subscription)
+
+  assert isinstance(events[0].error, ValueError)
+
+def test_hits_are_sampled() -> None:
+  hits: List[LifecycleEvent] = []
+  Observed()
+  subscription = subscribe(hits.append, events=('hit',), sample_rate=0.25)
+  assert SingletonMeta.__dict__['__call__'] is SingletonMeta._instrumented_call
+
+  try:
+    for _ in range(100):
+      Observed()
+  finally:
+    unsubscribe(subscription)
+
+  assert len(hits) == 25
+  assert SingletonMeta.__dict__['__call__'] is SingletonMeta._plain_call
+
+def test_handler_errors_are_reported(monkeypatch: pytest.MonkeyPatch) -> None:
+  reported: List[type] = []
+  monkeypatch.setattr('sys.excepthook', lambda kind, *_: reported.append(kind))
+
+  def handler(event: LifecycleEvent) -> None:
+    raise RuntimeError('handler')
+
+  subscription = subscribe(handler)
+
+  try:
+    instance = Observed()
+  finally:
+    unsubscribe(subscription)
+
+  assert Observed() is instance
+  assert reported and set(reported) == {RuntimeError}
+
+def test_handlers_run_outside_class_lock() -> None:
+  acquired: List[bool] = []
+
+  def handler(event: LifecycleEvent) -> None:
+    outcome: List[bool] = []
+    lock = SingletonMeta._locks[Observed]
+    thread = threading.Thread(target=lambda: outcome.append(lock.acquire(timeout=1) and (lock.release() or True)))
+    thread.start()
+    thread.join()
+    acquired.extend(outcome)
+
+  subscription = subscribe(handler, events=('lock_wait', 'create_end'))
+
+  try:
+    Observed()
+  finally:
+    unsubscribe(subscription)
+
+  assert acquired == [True, True]
+
+def test_invalid_subscriptions_are_rejected() -> None:
+  with pytest.raises(ValueError):
+    subscribe(print, events=('created',)) # type: ignore[arg-type]
+
+  with pytest.raises(ValueError):
+    subscribe(print, sample_rate=0)
@@ -0,0 +1,84 @@
+import pytest
+import threading
+from singletonize import Singleton, Multiton, MemoryUsage, memory_report, start_memory_sampling, stop_memory_sampling
+from singletonize._utils import MemoryAccounting
+from typing import Iterator, List, Tuple, Any
+
+class Buffers(Singleton):
+  def __init__(self) -> None:
+    self.buffer = memoryview(bytearray(1 << 20))
+    self.rows: List[Any] = []
+
+class Holder(Singleton):
+  def __init__(self) -> None:
+    self.buffers = Buffers()
+
+class Shard(Multiton):
+  def __init__(self, name: str) -> None:
+    self.rows = list(range(1000))
+
+class Pair:
+  __slots__ = ('left', 'right')
+
+@pytest.fixture(autouse=True)
+def fresh_history() -> Iterator[None]:
+  MemoryAccounting.reset()
+  yield
+  stop_memory_sampling()
+  MemoryAccounting.reset()
+
+def test_report_counts_each_singleton_once() -> None:
+  Buffers.reset_instance()
+  Holder.reset_instance()
+  Shard('a'), Shard('b')
+  report = memory_report()
+
+  assert report[Buffers].bytes > 1 << 20
+  # The buffers singleton is accounted with its own class only.
+  assert report[Holder].bytes < 1 << 10
+  assert report[Shard].instances == 2
+  assert list(report.values()) == sorted(report.values(), key=lambda usage: usage.bytes, reverse=True)
+
+def test_walk_is_bounded_and_follows_slots_and_cycles() -> None:
+  pair = Pair()
+  pair.left = [pair, bytearray(4096)]
+  pair.right = {'self': pair}
+
+  size, objects, truncated = MemoryAccounting.deep_size([pair], 1000)
+  assert size > 4096 and not truncated
+
+  assert MemoryAccounting.deep_size([pair], 2)[1:] == (2, True)
+  assert memory_report(max_objects=3)[Buffers].truncated
+
+def test_growing_classes_are_flagged() -> None:
+  Buffers.reset_instance()
+
+  for _ in range(MemoryAccounting.window):
+    Buffers().rows.append(list(range(100)))
+    usage = memory_report()[Buffers]
+
+  assert usage.growing
+  assert not memory_report()[Buffers].growing
+
+def test_sampler_reports_growth_in_background() -> None:
+  Buffers.reset_instance()
+  grown: List[Tuple[type, MemoryUsage]] = []
+  flagged = threading.Event()
+
+  def on_growth(cls: type, usage: MemoryUsage) -> None:
+    grown.append((cls, usage))
+    flagged.set()
+
+  start_memory_sampling(0.01, on_growth)
+
+  for _ in range(500):
+    if flagged.wait(0.01):
+      break
+
+    Buffers().rows.append(list(range(100)))
+
+  stop_memory_sampling()
+  assert grown and grown[0][0] is Buffers and grown[0][1].growing
+
+  with pytest.raises(ValueError):
+    start_memory_sampling(0)
@@ -0,0 +1,99 @@
+import pytest
+import time
+from singletonize import Singleton, Multiton, flush_cleanup
+from threading import Event
+from typing import Callable
+
+class Token(Singleton, ttl=0.2, refresh_ahead=0.5):
+  fail = False
+  started = Event()
+  release = Event()
+
+  def __init__(self, value: str) -> None:
+    cls = type(self)
+
+    if cls.started.is_set():
+      cls.release.wait(5)
+
+    if cls.fail:
+      raise ConnectionError('auth server down')
+
+    self.value = value
+    self.created = time.monotonic()
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5) -> bool:
+  deadline = time.monotonic() + timeout
+
+  while not condition():
+    if time.monotonic() > deadline:
+      return False
+
+    time.sleep(0.01)
+
+  return True
+
+@pytest.fixture(autouse=True)
+def reset_token() -> None:
+  Token.fail = False
+  Token.started.clear()
+  Token.release.clear()
+  Token.detach()
+
+def test_refresh_ahead_swaps_instance() -> None:
+  first = Token('abc')
+  start = Token.refresh_stats().refreshes
+
+  assert wait_until(lambda: Token.refresh_stats().refreshes > start)
+
+  second = Token()
+  assert second is not first
+  assert second.value == 'abc'
+  assert Token.refresh_stats().last_duration is not None
+  assert flush_cleanup(5)
+  # Callers still holding the replaced instance keep using it.
+  assert first.value == 'abc'
+
+def test_old_instance_served_during_rebuild() -> None:
+  first = Token('abc')
+  Token.started.set()
+
+  time.sleep(0.3)
+  assert Token() is first
+
+  Token.release.set()
+  assert wait_until(lambda: Token() is not first)
+
+def test_failed_refresh_keeps_instance() -> None:
+  first = Token('abc')
+  failures = Token.refresh_stats().failures
+  Token.fail = True
+
+  assert wait_until(lambda: Token.refresh_stats().failures >= failures + 2)
+  assert Token() is first
+  assert isinstance(Token.refresh_stats().last_error, ConnectionError)
+
+  Token.fail = False
+  assert wait_until(lambda: Token() is not first)
+  assert Token.refresh_stats().last_error is None
+
+def test_detach_cancels_refresh() -> None:
+  Token('abc')
+  refreshes = Token.refresh_stats().refreshes
+  Token.detach()
+
+  time.sleep(0.3)
+  assert not Token.has_instance()
+  assert Token.refresh_stats().refreshes == refreshes
+
+def test_invalid_ttl() -> None:
+  with pytest.raises(ValueError, match='ttl must be positive'):
+    class Expired(Singleton, ttl=0):
+      pass
+
+  with pytest.raises(ValueError, match='refresh_ahead'):
+    class Late(Singleton, ttl=1, refresh_ahead=1.5):
+      pass
+
+  with pytest.raises(TypeError, match='do not support ttl'):
+    class Keyed(Multiton, ttl=1):
+      pass
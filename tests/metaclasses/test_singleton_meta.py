@@ -1,4 +1,7 @@
+import pytest
+import time
 from singletonize._metaclasses import SingletonMeta, SingletonABCMeta
+from threading import Barrier, Thread
 
 class MySingleton(metaclass=SingletonMeta):
   def __init__(self, value: int):
@@ -73,7 +76,7 @@ def test_singleton_instance_deletion() -> None:
   assert not SingletonMeta.has_instance(MySingleton)
 
   assert MySingleton not in SingletonMeta._refs #type: ignore
-  assert MySingleton not in SingletonMeta._locks #type: ignore
+  assert MySingleton in SingletonMeta._locks #type: ignore
 
   instance2 = MySingleton(2)
   assert instance1 is not instance2
@@ -148,7 +151,7 @@ def test_singleton_abc_instance_deletion() -> None:
   assert not SingletonABCMeta.has_instance(MySingletonABC)
 
   assert MySingletonABC not in SingletonABCMeta._refs #type: ignore
-  assert MySingletonABC not in SingletonABCMeta._locks #type: ignore
+  assert MySingletonABC in SingletonABCMeta._locks #type: ignore
 
   instance2 = MySingletonABC(2)
   assert instance1 is not instance2
@@ -173,3 +176,255 @@ def test_singleton_abc_instance_with_existing_del() -> None:
   instance1.__del__()
 
   assert not SingletonABCMeta.has_instance(MySingletonABC)
+
+class FalsySingleton(metaclass=SingletonMeta):
+  def __init__(self) -> None:
+    self.items: list[int] = []
+
+  def __len__(self) -> int:
+    return len(self.items)
+
+class ChildSingleton(NoDelSingleton):
+  pass
+
+def test_singleton_falsy_instance() -> None:
+  SingletonMeta.detach(FalsySingleton)
+
+  instance1 = FalsySingleton()
+  assert not instance1
+  assert FalsySingleton._singleton_instance is instance1 #type: ignore
+  assert FalsySingleton() is instance1
+  assert SingletonMeta.has_instance(FalsySingleton)
+
+  SingletonMeta.detach(FalsySingleton)
+  assert not SingletonMeta.has_instance(FalsySingleton)
+  assert FalsySingleton._singleton_instance is None #type: ignore
+
+def test_singleton_slot_per_class() -> None:
+  SingletonMeta.detach(NoDelSingleton)
+  SingletonMeta.detach(ChildSingleton)
+
+  parent = NoDelSingleton(1)
+  assert not SingletonMeta.has_instance(ChildSingleton)
+
+  child = ChildSingleton(2)
+  assert child is not parent
+  assert child.value == 2
+  assert NoDelSingleton(3) is parent
+
+class SlowSingleton(metaclass=SingletonMeta):
+  calls = 0
+
+  def __init__(self, value: int) -> None:
+    type(self).calls += 1
+    time.sleep(0.05)
+    self.value = value
+
+class FailingSingleton(metaclass=SingletonMeta):
+  def __init__(self) -> None:
+    time.sleep(0.05)
+    raise ValueError('boom')
+
+class RecursiveSingleton(metaclass=SingletonMeta):
+  def __init__(self) -> None:
+    RecursiveSingleton()
+
+def test_singleton_lock_kept_across_detach() -> None:
+  lock = SingletonMeta._locks[NoDelSingleton] #type: ignore
+
+  NoDelSingleton(1)
+  SingletonMeta.detach(NoDelSingleton)
+  NoDelSingleton(2)
+
+  assert SingletonMeta._locks[NoDelSingleton] is lock #type: ignore
+
+def test_singleton_single_flight_creation() -> None:
+  SingletonMeta.detach(SlowSingleton)
+  SlowSingleton.calls = 0
+
+  n_threads = 64
+  barrier = Barrier(n_threads)
+  results: list[SlowSingleton] = []
+
+  def create_instance(value: int) -> None:
+    barrier.wait()
+    results.append(SlowSingleton(value))
+
+  threads = [Thread(target=create_instance, args=(i,)) for i in range(n_threads)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert SlowSingleton.calls == 1
+  assert len(results) == n_threads
+  assert all(result is results[0] for result in results)
+  assert not SingletonMeta._pending #type: ignore
+
+def test_singleton_single_flight_failure_propagates() -> None:
+  n_threads = 8
+  barrier = Barrier(n_threads)
+  errors: list[ValueError] = []
+
+  def create_instance() -> None:
+    barrier.wait()
+    try:
+      FailingSingleton()
+    except ValueError as error:
+      errors.append(error)
+
+  threads = [Thread(target=create_instance) for _ in range(n_threads)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert len(errors) == n_threads
+  assert len({id(error) for error in errors}) == n_threads
+  assert all(str(error) == 'boom' for error in errors)
+  assert len({id(error.__cause__ or error) for error in errors}) == 1
+  assert not SingletonMeta.has_instance(FailingSingleton)
+  assert FailingSingleton not in SingletonMeta._pending #type: ignore
+
+def test_singleton_recursive_construction() -> None:
+  with pytest.raises(RuntimeError, match='Recursive construction of singleton RecursiveSingleton'):
+    RecursiveSingleton()
+
+  assert not SingletonMeta.has_instance(RecursiveSingleton)
+
+class DeepCleanupSingleton(metaclass=SingletonMeta, cleanup='deep'):
+  def __init__(self, value: int) -> None:
+    self.value = value
+
+class InheritedCleanupSingleton(DeepCleanupSingleton):
+  pass
+
+class Holder:
+  def __init__(self, value: object) -> None:
+    self.value = value
+
+def test_singleton_cleanup_strategy_per_class() -> None:
+  assert SingletonMeta.get_cleanup_strategy(NoDelSingleton) == 'attributes-only'
+  assert SingletonMeta.get_cleanup_strategy(DeepCleanupSingleton) == 'deep'
+  assert SingletonMeta.get_cleanup_strategy(InheritedCleanupSingleton) == 'deep'
+
+  SingletonMeta.detach(DeepCleanupSingleton)
+  instance = DeepCleanupSingleton(1)
+  container = {'instance': instance}
+
+  SingletonMeta.detach(DeepCleanupSingleton)
+  assert SingletonMeta.flush_cleanup()
+  assert container['instance'] is None
+
+def test_singleton_cleanup_strategy_invalid() -> None:
+  with pytest.raises(ValueError, match='Unknown cleanup strategy'):
+    class InvalidSingleton(metaclass=SingletonMeta, cleanup='fast'): #type: ignore
+      pass
+
+  with pytest.raises(ValueError, match='Unknown cleanup strategy'):
+    SingletonMeta.set_cleanup_strategy('fast') #type: ignore
+
+def test_singleton_cleanup_strategy_global() -> None:
+  SingletonMeta.set_cleanup_strategy('none')
+
+  try:
+    SingletonMeta.detach(NoDelSingleton)
+    instance = NoDelSingleton(1)
+
+    SingletonMeta.detach(NoDelSingleton)
+    assert SingletonMeta.flush_cleanup()
+    assert instance.value == 1
+    assert SingletonMeta.get_cleanup_strategy(DeepCleanupSingleton) == 'deep'
+  finally:
+    SingletonMeta.set_cleanup_strategy('attributes-only')
+
+class TrackedSingleton(metaclass=SingletonMeta, cleanup='tracked'):
+  def __init__(self, value: int) -> None:
+    self.value = value
+
+def test_singleton_tracked_cleanup() -> None:
+  SingletonMeta.detach(TrackedSingleton)
+  instance = TrackedSingleton(1)
+  tracked = Holder(instance)
+  untracked = Holder(instance)
+  tracked_dict = {'instance': instance}
+  tracked_list = [instance]
+  tracked_set = {instance}
+
+  for holder in (tracked, tracked_dict, tracked_list, tracked_set):
+    SingletonMeta.track(TrackedSingleton, holder)
+
+  SingletonMeta.detach(TrackedSingleton)
+  assert SingletonMeta.flush_cleanup()
+
+  assert tracked.value is None
+  assert tracked_dict['instance'] is None
+  assert tracked_list[0] is None
+  assert not tracked_set
+  assert untracked.value is instance
+  assert not hasattr(instance, 'value')
+
+def test_singleton_track_unsupported_holder() -> None:
+  with pytest.raises(TypeError, match='Cannot track tuple holder'):
+    SingletonMeta.track(TrackedSingleton, (TrackedSingleton(1),))
+
+def test_singleton_untracked_by_default() -> None:
+  SingletonMeta.detach(NoDelSingleton)
+  instance = NoDelSingleton(1)
+  holder = Holder(instance)
+
+  SingletonMeta.track(NoDelSingleton, holder)
+  SingletonMeta.detach(NoDelSingleton)
+  assert SingletonMeta.flush_cleanup()
+
+  assert holder.value is instance
+  assert not hasattr(instance, 'value')
+
+class SlotsSingleton(metaclass=SingletonMeta):
+  __slots__ = ('value',)
+
+  def __init__(self, value: int) -> None:
+    self.value = value
+
+def test_singleton_without_weakref_support() -> None:
+  SingletonMeta.detach(SlotsSingleton)
+
+  instance = SlotsSingleton(1)
+  assert SlotsSingleton(2) is instance
+  assert not SingletonMeta._pending #type: ignore
+
+  SingletonMeta.detach(SlotsSingleton)
+  assert not SingletonMeta.has_instance(SlotsSingleton)
+
+def test_singleton_install_failure_releases_waiters(monkeypatch: pytest.MonkeyPatch) -> None:
+  SingletonMeta.detach(SlowSingleton)
+
+  def failing_set_del(instance: object) -> None:
+    raise TypeError('install failed')
+
+  monkeypatch.setattr(SingletonMeta, '_set_del', failing_set_del)
+
+  n_threads = 4
+  barrier = Barrier(n_threads)
+  errors: list[BaseException] = []
+
+  def create_instance() -> None:
+    barrier.wait()
+    try:
+      SlowSingleton(1)
+    except TypeError as error:
+      errors.append(error)
+
+  threads = [Thread(target=create_instance) for _ in range(n_threads)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join(5)
+
+  assert not any(thread.is_alive() for thread in threads)
+  assert len(errors) == n_threads
+  assert SlowSingleton not in SingletonMeta._pending #type: ignore
+  assert not SingletonMeta.has_instance(SlowSingleton)
+
+  monkeypatch.undo()
+  assert SlowSingleton(2).value == 2
@@ -0,0 +1,67 @@
+import pytest
+import time
+from concurrent.futures import ThreadPoolExecutor
+from singletonize import Singleton, SingletonABC, flush_cleanup
+from singletonize._metaclasses import SingletonMeta
+from typing import Iterator
+
+class Counted(Singleton):
+  def __init__(self) -> None:
+    time.sleep(0.05)
+
+class CountedABC(SingletonABC):
+  pass
+
+class Failing(Singleton):
+  def __init__(self) -> None:
+    raise ValueError('boom')
+
+@pytest.fixture(autouse=True)
+def stats_enabled() -> Iterator[None]:
+  Counted.detach()
+  CountedABC.detach()
+  flush_cleanup(5)
+  SingletonMeta.reset_stats()
+  SingletonMeta.enable_stats()
+  yield
+  SingletonMeta.disable_stats()
+  SingletonMeta.reset_stats()
+
+def test_stats_disabled_restores_plain_call() -> None:
+  SingletonMeta.disable_stats()
+
+  assert SingletonMeta.__dict__['__call__'] is SingletonMeta._plain_call
+  Counted()
+  assert Counted not in SingletonMeta.stats()
+
+def test_stats_hits_misses_and_latencies() -> None:
+  with ThreadPoolExecutor(max_workers=8) as executor:
+    list(executor.map(lambda _: Counted(), range(8)))
+
+  for _ in range(10):
+    Counted()
+    CountedABC()
+
+  Counted.detach()
+  assert flush_cleanup(5)
+
+  stats = SingletonMeta.stats()[Counted]
+  assert stats.hits + stats.misses == 18
+  assert stats.misses >= 1
+  assert stats.waits == stats.misses - 1
+  assert stats.init.count == 1
+  assert stats.init.mean >= 0.05
+  assert stats.lock_wait.count == stats.misses
+  assert stats.detaches == 1
+  assert stats.cleanup.count == 1
+  assert sum(stats.init.buckets) == 1
+  assert SingletonMeta.stats()[CountedABC].hits == 9
+
+def test_stats_failures_and_reset() -> None:
+  with pytest.raises(ValueError):
+    Failing()
+
+  assert SingletonMeta.stats()[Failing].failures == 1
+
+  SingletonMeta.reset_stats()
+  assert SingletonMeta.stats() == {}
@@ -0,0 +1,112 @@
+import gc
+import pytest
+import time
+from concurrent.futures import ThreadPoolExecutor
+from singletonize import Singleton, ThreadLocalSingleton, flush_cleanup
+from threading import Event
+from weakref import ref
+
+class Config(Singleton):
+  def __init__(self, version: int = 0, delay: float = 0.0) -> None:
+    time.sleep(delay)
+    self.version = version
+
+class GracefulConfig(Singleton, grace=0.2):
+  def __init__(self, version: int = 0) -> None:
+    self.version = version
+
+class PerThread(ThreadLocalSingleton):
+  pass
+
+def test_swap_never_exposes_missing_instance() -> None:
+  Config.detach()
+  Config(1)
+  stop = Event()
+
+  def read() -> set[int]:
+    versions = set()
+
+    while not stop.is_set():
+      versions.add(Config().version)
+
+    return versions
+
+  with ThreadPoolExecutor(max_workers=4) as executor:
+    readers = [executor.submit(read) for _ in range(4)]
+    new = Config.swap_instance(2, delay=0.1)
+    stop.set()
+
+  assert Config() is new
+  assert all(reader.result() <= {1, 2} for reader in readers)
+
+def test_swapped_instance_stays_usable_until_dropped() -> None:
+  Config.detach()
+  old = Config(1)
+  Config.swap_instance(2)
+
+  assert flush_cleanup(5)
+  assert old.version == 1
+
+  retired = ref(old)
+  del old
+  gc.collect()
+  assert retired() is None
+
+def test_swap_retires_after_borrow() -> None:
+  Config.detach()
+  old = Config(1)
+
+  with Config.borrow() as borrowed:
+    assert borrowed is old
+    Config.swap_instance(2)
+    assert flush_cleanup(5)
+    assert borrowed.version == 1
+
+  assert flush_cleanup(5)
+  assert old.version == 1
+  assert Config().version == 2
+
+def test_borrows_are_counted_per_class() -> None:
+  Config.detach()
+  GracefulConfig.detach()
+  record = Config.__dict__['_singleton_record']
+
+  with Config.borrow(1) as borrowed, GracefulConfig.borrow(1):
+    Config.swap_instance(2)
+    assert record.retiring == {id(borrowed): borrowed}
+    assert list(GracefulConfig.__dict__['_singleton_record'].borrows.values()) == [1]
+
+  assert record.borrows == {} and record.retiring == {}
+
+def test_swap_grace_period() -> None:
+  GracefulConfig.detach()
+  old = GracefulConfig(1)
+  GracefulConfig.swap_instance(2)
+
+  assert flush_cleanup(5)
+  assert old.version == 1
+
+  retired = ref(old)
+  del old
+  gc.collect()
+  # The registry keeps it until the grace period has passed.
+  assert retired() is not None
+
+  time.sleep(0.4)
+  gc.collect()
+  assert retired() is None
+
+def test_swap_without_instance_installs() -> None:
+  Config.detach()
+
+  assert Config.swap_instance(3) is Config()
+
+def test_borrow_creates_instance() -> None:
+  Config.detach()
+
+  with Config.borrow(4) as instance:
+    assert instance.version == 4
+
+def test_swap_unsupported() -> None:
+  with pytest.raises(TypeError, match='do not support swapping'):
+    PerThread.swap_instance()
@@ -1,4 +1,4 @@
-from singletonize import Singleton
+from singletonize import Singleton, flush_cleanup
 
 class MySingleton(Singleton):
   def __init__(self, value: int):
@@ -64,6 +64,7 @@ def test_update_instance() -> None:
 
   assert updated_instance.value == 42
   assert instance is updated_instance
+  assert MySingleton.update_instance(value=43).value == 43
 
 def test_instance_as_dict() -> None:
   MySingleton.detach()
@@ -88,3 +89,32 @@ def test_no_instance_after_detach() -> None:
   MySingleton.get_instance(1)
   MySingleton.detach()
   assert MySingleton.get_instance_or_none() is None
+
+class EmptyCacheSingleton(Singleton):
+  def __init__(self) -> None:
+    self.entries: dict[str, int] = {}
+
+  def __len__(self) -> int:
+    return len(self.entries)
+
+def test_instance_as_dict_falsy_instance() -> None:
+  EmptyCacheSingleton.detach()
+
+  instance = EmptyCacheSingleton.get_instance()
+  assert not instance
+  assert EmptyCacheSingleton.instance_as_dict() == {"entries": {}}
+
+class TrackedSingleton(Singleton, cleanup='tracked'):
+  def __init__(self, value: int):
+    self.value = value
+
+def test_track() -> None:
+  TrackedSingleton.detach()
+
+  instance = TrackedSingleton.get_instance(1)
+  holder = {"instance": instance}
+  TrackedSingleton.track(holder)
+
+  TrackedSingleton.detach()
+  assert flush_cleanup()
+  assert holder["instance"] is None
@@ -0,0 +1,115 @@
+import asyncio
+import pytest
+from abc import abstractmethod
+from singletonize import AsyncSingleton, AsyncSingletonABC
+from typing import Any
+
+class MyAsyncSingleton(AsyncSingleton):
+  creations = 0
+  closed = 0
+
+  def __init__(self, value: int) -> None:
+    self.value = value
+
+  @classmethod
+  async def acreate(cls, *args: Any, **kwargs: Any) -> 'MyAsyncSingleton':
+    cls.creations += 1
+    instance = await super().acreate(*args, **kwargs)
+    await asyncio.sleep(0.01)
+    instance.connected = True
+    return instance
+
+  async def aclose(self) -> None:
+    type(self).closed += 1
+
+class FailingAsyncSingleton(AsyncSingleton):
+  @classmethod
+  async def acreate(cls, *args: Any, **kwargs: Any) -> 'FailingAsyncSingleton':
+    await asyncio.sleep(0.01)
+    raise ConnectionError('unreachable')
+
+class AbstractAsyncSingleton(AsyncSingletonABC):
+  @abstractmethod
+  def some_method(self) -> int:
+    pass
+
+class ConcreteAsyncSingleton(AbstractAsyncSingleton):
+  def __init__(self, value: int) -> None:
+    self.value = value
+
+  def some_method(self) -> int:
+    return self.value
+
+def test_async_singleton_instance() -> None:
+  async def run() -> None:
+    await MyAsyncSingleton.adetach()
+
+    instance1 = await MyAsyncSingleton.aget_instance(1)
+    instance2 = await MyAsyncSingleton.aget_instance(2)
+
+    assert instance1 is instance2
+    assert instance1.value == 1
+    assert instance1.connected
+    assert MyAsyncSingleton() is instance1
+    assert MyAsyncSingleton.has_instance()
+
+  asyncio.run(run())
+
+def test_async_singleton_single_flight() -> None:
+  async def run() -> None:
+    await MyAsyncSingleton.adetach()
+    MyAsyncSingleton.creations = 0
+
+    instances = await asyncio.gather(*(MyAsyncSingleton.aget_instance(i) for i in range(50)))
+
+    assert MyAsyncSingleton.creations == 1
+    assert all(instance is instances[0] for instance in instances)
+
+  asyncio.run(run())
+
+def test_async_singleton_failure_propagates() -> None:
+  async def run() -> None:
+    results = await asyncio.gather(
+      *(FailingAsyncSingleton.aget_instance() for _ in range(5)),
+      return_exceptions=True
+    )
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert not FailingAsyncSingleton.has_instance()
+
+    with pytest.raises(ConnectionError):
+      await FailingAsyncSingleton.aget_instance()
+
+  asyncio.run(run())
+
+def test_async_singleton_requires_await() -> None:
+  asyncio.run(MyAsyncSingleton.adetach())
+
+  with pytest.raises(RuntimeError, match='use `await MyAsyncSingleton.aget_instance\\(\\)`'):
+    MyAsyncSingleton(1)
+
+def test_async_singleton_adetach() -> None:
+  async def run() -> None:
+    await MyAsyncSingleton.adetach()
+    MyAsyncSingleton.closed = 0
+
+    instance1 = await MyAsyncSingleton.aget_instance(1)
+    await MyAsyncSingleton.adetach()
+
+    assert MyAsyncSingleton.closed == 1
+    assert not MyAsyncSingleton.has_instance()
+
+    instance2 = await MyAsyncSingleton.areset_instance(2)
+    assert instance2 is not instance1
+    assert instance2.value == 2
+
+  asyncio.run(run())
+
+def test_async_singleton_abc_instance() -> None:
+  async def run() -> None:
+    instance = await ConcreteAsyncSingleton.aget_instance(10)
+
+    assert instance.some_method() == 10
+    assert ConcreteAsyncSingleton() is instance
+
+  asyncio.run(run())
@@ -0,0 +1,105 @@
+import json
+import pytest
+from singletonize import Singleton, StateChanges
+
+class Heartbeat(Singleton):
+  def __init__(self) -> None:
+    self.host = 'db-1'
+    self.load = 0.5
+    self.ready = True
+    self._secret = 'hidden'
+
+class SnapshotHeartbeat(Singleton, snapshot=True):
+  def __init__(self) -> None:
+    self.host = 'db-1'
+    self.load = 0.5
+
+class SlotHeartbeat(Singleton, slots=('host', 'load', 'tags', '_secret')):
+  def __init__(self) -> None:
+    self.host = 'dé-1'
+    self.load = None
+    self._secret = 'hidden'
+
+@pytest.mark.parametrize('cls', [Heartbeat, SnapshotHeartbeat, SlotHeartbeat])
+def test_serializers_match_public_attributes(cls: type) -> None:
+  cls.detach()
+  assert cls.instance_as_dict() == {} and cls.instance_as_json() == b'{}'
+
+  instance = cls()
+  expected = {key: value for key, value in instance.snapshot().items() if not key.startswith('_')}
+
+  assert cls.instance_as_dict() == expected
+  assert json.loads(cls.instance_as_json()) == expected
+
+def test_serializer_follows_layout_changes() -> None:
+  Heartbeat.detach()
+  heartbeat = Heartbeat()
+  assert Heartbeat.instance_as_dict() == {'host': 'db-1', 'load': 0.5, 'ready': True}
+
+  # Layouts keep changing past the recompile budget, the fallback stays correct.
+  for index in range(20):
+    setattr(heartbeat, f'extra_{index}', [index])
+    assert json.loads(Heartbeat.instance_as_json())[f'extra_{index}'] == [index]
+    delattr(heartbeat, f'extra_{index}')
+    assert Heartbeat.instance_as_dict() == {'host': 'db-1', 'load': 0.5, 'ready': True}
+
+  heartbeat.payload = object()
+
+  with pytest.raises(TypeError):
+    Heartbeat.instance_as_json()
+
+def test_serializer_checks_the_exact_layout() -> None:
+  class Point(Singleton):
+    def __init__(self) -> None:
+      self.a = 1
+      self._p = 2
+
+  point = Point()
+  assert Point.instance_as_dict() == {'a': 1}
+
+  # Same number of keys, different layout.
+  del point._p
+  point.c = 3
+  assert Point.instance_as_dict() == {'a': 1, 'c': 3}
+  assert json.loads(Point.instance_as_json()) == {'a': 1, 'c': 3}
+
+def test_changes_since_returns_only_changed_fields() -> None:
+  Heartbeat.detach()
+  Heartbeat()
+  first = Heartbeat.instance_changes_since()
+  assert first == StateChanges(first.version, {'host': 'db-1', 'load': 0.5, 'ready': True}, (), True)
+
+  Heartbeat.update_instance(load=0.9, _secret='changed')
+  second = Heartbeat.instance_changes_since(first.version)
+  assert (second.changed, second.removed, second.full) == ({'load': 0.9}, (), False)
+
+  Heartbeat().extra = 1
+  del Heartbeat().ready
+  third = Heartbeat.instance_changes_since(second.version)
+  assert (third.changed, third.removed, third.full) == ({'extra': 1}, ('ready',), False)
+  assert Heartbeat.instance_changes_since(third.version).changed == {}
+  assert Heartbeat.instance_changes_since(third.version + 10).full
+
+@pytest.mark.parametrize('cls', [SnapshotHeartbeat, SlotHeartbeat])
+def test_changes_since_tracks_updates_of_every_layout(cls: type) -> None:
+  cls.detach()
+  cls()
+  version = cls.instance_changes_since().version
+
+  cls.update_instance(load=2.0)
+  changes = cls.instance_changes_since(version)
+
+  assert (changes.changed, changes.full) == ({'load': 2.0}, False)
+
+def test_replaced_instance_resends_full_state() -> None:
+  Heartbeat.detach()
+  Heartbeat()
+  version = Heartbeat.instance_changes_since().version
+
+  Heartbeat.detach()
+  assert Heartbeat.instance_changes_since(version) == StateChanges(version, {}, (), True)
+
+  Heartbeat()
+  changes = Heartbeat.instance_changes_since(version)
+  assert changes.full and changes.changed == {'host': 'db-1', 'load': 0.5, 'ready': True}
+  assert changes.version > version
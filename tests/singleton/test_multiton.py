@@ -0,0 +1,94 @@
+import pytest
+import time
+from concurrent.futures import ThreadPoolExecutor
+from singletonize import Multiton, flush_cleanup
+from typing import Any
+
+class Client(Multiton, key=lambda dsn, **options: dsn):
+  creations = 0
+
+  def __init__(self, dsn: str, timeout: float = 5.0) -> None:
+    type(self).creations += 1
+    time.sleep(0.05)
+    self.dsn = dsn
+
+class Tokenizer(Multiton, max_instances=2):
+  def __init__(self, model: str) -> None:
+    self.model = model
+
+class Queue(Multiton, max_instances=2, eviction='fifo'):
+  def __init__(self, name: str) -> None:
+    self.name = name
+
+class FailingMultiton(Multiton):
+  def __init__(self, value: Any) -> None:
+    raise ValueError(value)
+
+def test_one_instance_per_key() -> None:
+  Client.detach()
+
+  assert Client('a') is Client('a', timeout=1.0)
+  assert Client('a') is not Client('b')
+  assert Client.has_instance('a')
+  assert not Client.has_instance('c')
+  assert Client.get_instance_or_none('b').dsn == 'b'
+  assert set(Client.instances()) == {'a', 'b'}
+  assert Client.is_instance(Client('a'))
+
+def test_single_flight_per_key() -> None:
+  Client.detach()
+  Client.creations = 0
+
+  with ThreadPoolExecutor(max_workers=16) as executor:
+    results = list(executor.map(lambda index: Client('ab'[index % 2]), range(32)))
+
+  assert Client.creations == 2
+  assert len({id(result) for result in results}) == 2
+
+def test_lru_eviction() -> None:
+  Tokenizer.detach()
+  first, second = Tokenizer('a'), Tokenizer('b')
+
+  assert Tokenizer('a') is first
+  Tokenizer('c')
+
+  assert list(Tokenizer.instances()) == [('a',), ('c',)]
+  assert flush_cleanup(5)
+  assert vars(second) == {}
+  assert vars(first) == {'model': 'a'}
+
+def test_fifo_eviction() -> None:
+  Queue.detach()
+  Queue('a')
+  Queue('b')
+  Queue('a')
+  Queue('c')
+
+  assert list(Queue.instances()) == [('b',), ('c',)]
+
+def test_evict_reset_and_detach() -> None:
+  Tokenizer.detach()
+  first = Tokenizer('a')
+
+  assert Tokenizer.reset_instance('a') is not first
+  assert Tokenizer.evict('a')
+  assert not Tokenizer.evict('a')
+
+  Tokenizer('a')
+  Tokenizer.detach()
+  assert Tokenizer.instances() == {}
+
+def test_failure_does_not_register() -> None:
+  with pytest.raises(ValueError):
+    FailingMultiton(1)
+
+  assert not FailingMultiton.has_instance(1)
+
+def test_invalid_options() -> None:
+  with pytest.raises(ValueError, match='max_instances'):
+    class Unbounded(Multiton, max_instances=0):
+      pass
+
+  with pytest.raises(ValueError, match='Unknown eviction policy'):
+    class Random(Multiton, eviction='random'): #type: ignore
+      pass
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from singletonize import ThreadLocalSingleton, ContextSingleton, flush_cleanup
+from threading import Thread
+from typing import Any, List
+
+class Parser(ThreadLocalSingleton):
+  def __init__(self, name: str = '') -> None:
+    self.name = name
+
+class RequestCache(ContextSingleton):
+  def __init__(self) -> None:
+    self.entries: List[Any] = []
+
+class Recursive(ThreadLocalSingleton):
+  def __init__(self) -> None:
+    Recursive()
+
+def run_in_thread(target: Any) -> List[Any]:
+  results: List[Any] = []
+  thread = Thread(target=lambda: results.append(target()))
+  thread.start()
+  thread.join()
+  return results
+
+def test_thread_local_instances() -> None:
+  Parser.detach()
+  parser = Parser('main')
+
+  other = run_in_thread(lambda: (Parser('worker'), Parser()))[0]
+
+  assert Parser() is parser
+  assert other[0] is other[1]
+  assert other[0] is not parser
+  assert run_in_thread(Parser.has_instance) == [False]
+
+def test_thread_local_released_when_thread_ends() -> None:
+  parsers = run_in_thread(lambda: Parser('worker'))
+  assert flush_cleanup(5)
+  assert vars(parsers[0]) == {}
+
+def test_thread_local_detach_and_reset() -> None:
+  Parser.detach()
+  parser = Parser('first')
+
+  assert Parser.reset_instance('second') is not parser
+  assert Parser().name == 'second'
+
+  Parser.detach()
+  assert Parser.get_instance_or_none() is None
+
+def test_thread_local_recursive_construction() -> None:
+  with pytest.raises(RuntimeError, match='Recursive construction'):
+    Recursive()
+
+def test_context_instances_per_task() -> None:
+  async def handle() -> RequestCache:
+    cache = RequestCache()
+    await asyncio.sleep(0)
+    assert RequestCache() is cache
+    return cache
+
+  async def main() -> List[RequestCache]:
+    return list(await asyncio.gather(handle(), handle()))
+
+  first, second = asyncio.run(main())
+  assert first is not second
+  assert flush_cleanup(5)
+  assert vars(first) == {}
+
+def test_context_scope() -> None:
+  outer = RequestCache()
+
+  with RequestCache.scope():
+    inner = RequestCache()
+    assert inner is not outer
+
+  assert RequestCache() is outer
+  assert flush_cleanup(5)
+  assert vars(inner) == {}
+  RequestCache.detach()
+
+def test_scoped_track() -> None:
+  holder: List[Any] = []
+
+  with pytest.raises(RuntimeError, match='no instance'):
+    RequestCache.track(holder)
+
+  with RequestCache.scope():
+    holder.append(RequestCache())
+    RequestCache.track(holder)
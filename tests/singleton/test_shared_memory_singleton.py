@@ -0,0 +1,101 @@
+import os
+import pytest
+import time
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from singletonize import SharedMemorySingleton, SharedField
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+
+SEGMENT = f'sz_test_singleton_{os.getpid()}'
+
+class Lookup(SharedMemorySingleton, segment=SEGMENT):
+  weights = SharedField('d', 4)
+  flags = SharedField('B', 8)
+
+  def __init__(self, label: str = '') -> None:
+    self.label = label
+
+  def init_shared(self) -> None:
+    self.weights[0] = 1.5
+
+class Plain(SharedMemorySingleton):
+  pass
+
+def test_shared_fields_across_processes() -> None:
+  Lookup.detach()
+  lookup = Lookup('parent')
+
+  assert list(lookup.weights) == [1.5, 0.0, 0.0, 0.0]
+
+  pid = os.fork()
+
+  if pid == 0:
+    with Lookup.shared_lock():
+      Lookup().weights[1] = 2.5
+
+    Lookup.detach()
+    os._exit(0)
+
+  os.waitpid(pid, 0)
+
+  assert lookup.weights[1] == 2.5
+  Lookup.update_instance(weights=array('d', [3.0] * 4))
+  assert list(lookup.weights) == [3.0] * 4
+
+  Lookup.detach()
+
+  with pytest.raises(FileNotFoundError):
+    SharedMemory(SEGMENT)
+
+  with pytest.raises(RuntimeError, match='not attached'):
+    lookup.weights
+
+def test_update_waits_for_other_processes() -> None:
+  Lookup.detach()
+  lookup = Lookup()
+  ready, signal = os.pipe()
+  pid = os.fork()
+
+  if pid == 0:
+    with Lookup.shared_lock():
+      os.write(signal, b'1')
+      time.sleep(0.3)
+      Lookup().weights[2] = 4.5
+
+    Lookup.detach()
+    os._exit(0)
+
+  os.read(ready, 1)
+  start = time.perf_counter()
+  Lookup.update_instance(label='parent')
+
+  assert time.perf_counter() - start >= 0.2
+  assert lookup.weights[2] == 4.5 and lookup.label == 'parent'
+
+  os.waitpid(pid, 0)
+  os.close(ready)
+  os.close(signal)
+  Lookup.detach()
+
+def test_init_shared_runs_on_creation() -> None:
+  Lookup.detach()
+
+  assert Lookup.reset_instance().weights[0] == 1.5
+  Lookup.detach()
+
+def test_guard_rejects_field_assignment() -> None:
+  lookup = Lookup()
+
+  with pytest.raises(AttributeError):
+    lookup.flags = b'\0' * 8
+
+  Lookup.detach()
+
+def test_no_shared_fields() -> None:
+  assert Plain() is Plain()
+
+  with pytest.raises(TypeError, match='declares no shared fields'):
+    Plain.shared_lock()
+
+  Plain.detach()
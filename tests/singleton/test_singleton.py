@@ -24,3 +24,22 @@ def test_singleton_instance() -> None:
 
   assert test1 is test2
   assert id(test1) == id(test2)
+
+class DelSingleton(Singleton):
+  deleted = 0
+
+  def __init__(self, value: int):
+    self.value = value
+
+  def __del__(self) -> None:
+    type(self).deleted += 1
+
+def test_singleton_with_del() -> None:
+  DelSingleton.detach()
+
+  instance = DelSingleton(1)
+  assert DelSingleton(2) is instance
+
+  instance.__del__()
+  assert DelSingleton.deleted == 1
+  assert not DelSingleton.has_instance()
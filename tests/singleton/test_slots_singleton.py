@@ -0,0 +1,106 @@
+import asyncio
+import pytest
+from singletonize import Singleton, AsyncSingleton, flush_cleanup
+from typing import ClassVar
+
+class Endpoint(Singleton, slots=True):
+  host: str
+  port: int
+  _hits: int
+  default_port: ClassVar[int] = 80
+
+  def __init__(self, host: str = 'localhost', port: int = 0) -> None:
+    self.host = host
+    self.port = port or self.default_port
+    self._hits = 0
+
+class Derived(Singleton, slots=True):
+  def __init__(self, name: str = 'derived', *, level: int = 1) -> None:
+    self.name = name
+    self.level = level
+
+class Child(Endpoint):
+  scheme: str
+
+  def __init__(self) -> None:
+    super().__init__()
+    self.scheme = 'https'
+
+class Pool(AsyncSingleton, slots=('dsn', 'connections')):
+  def __init__(self, dsn: str) -> None:
+    self.dsn = dsn
+
+  @classmethod
+  async def acreate(cls, dsn: str) -> 'Pool':
+    pool = await super().acreate(dsn)
+    pool.connections = 4
+    return pool
+
+@pytest.fixture(autouse=True)
+def detached() -> None:
+  for cls in (Endpoint, Derived, Child):
+    cls.detach()
+
+def test_fields_are_slots() -> None:
+  endpoint = Endpoint('example.org')
+
+  assert not hasattr(endpoint, '__dict__')
+  assert Endpoint.__slots__ == ('host', 'port', '_hits', '__weakref__', '_updating')
+  assert (endpoint.host, endpoint.port) == ('example.org', 80)
+  assert Derived.__slots__[:2] == ('name', 'level')
+  assert Derived().level == 1
+
+def test_write_guard() -> None:
+  endpoint = Endpoint()
+
+  with pytest.raises(AttributeError, match='Cannot set attribute host'):
+    endpoint.host = 'other'
+
+  with pytest.raises(AttributeError, match='no field'):
+    endpoint.unknown = 1
+
+  endpoint._hits += 1
+  assert Endpoint.update_instance(host='other', port=8080) is endpoint
+  assert Endpoint.instance_as_dict() == {'host': 'other', 'port': 8080}
+  assert Endpoint.snapshot()['_hits'] == 1
+
+def test_subclasses_extend_the_layout() -> None:
+  child = Child()
+
+  assert not hasattr(child, '__dict__')
+  assert Child.__slots__ == ('scheme',)
+  assert (child.host, child.scheme) == ('localhost', 'https')
+
+  with pytest.raises(AttributeError):
+    child.scheme = 'http'
+
+def test_cleanup_releases_fields() -> None:
+  endpoint = Endpoint()
+  Endpoint.detach()
+  assert flush_cleanup(5)
+
+  assert not hasattr(endpoint, 'host')
+
+def test_async_factory_writes_before_sealing() -> None:
+  pool = asyncio.run(Pool.aget_instance('postgres://'))
+
+  try:
+    assert (pool.dsn, pool.connections) == ('postgres://', 4)
+
+    with pytest.raises(AttributeError):
+      pool.connections = 8
+  finally:
+    Pool.detach()
+
+def test_invalid_layouts() -> None:
+  with pytest.raises(TypeError, match='class-level defaults'):
+    class Defaulted(Singleton, slots=True):
+      port: int = 80
+
+  with pytest.raises(TypeError, match='snapshot'):
+    class Snapshot(Singleton, slots=True, snapshot=True):
+      pass
+
+  with pytest.raises(TypeError, match='__slots__'):
+    class Declared(Singleton, slots=True):
+      __slots__ = ('port',)
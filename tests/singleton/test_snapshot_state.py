@@ -0,0 +1,92 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from singletonize import Singleton, flush_cleanup
+from threading import Event
+
+class Config(Singleton, snapshot=True):
+  def __init__(self) -> None:
+    self.low = 0
+    self.high = 0
+
+class Plain(Singleton):
+  def __init__(self) -> None:
+    self.value = 0
+
+class Published(Singleton, snapshot=True):
+  def __init__(self) -> None:
+    self.value = 0
+    self.first = vars(self)
+
+def test_readers_never_see_partial_updates() -> None:
+  Config.detach()
+  Config()
+  stop = Event()
+
+  def read() -> int:
+    reads = 0
+
+    while not stop.is_set():
+      state = Config.snapshot()
+      assert state['low'] == state['high']
+      reads += 1
+
+    return reads
+
+  with ThreadPoolExecutor(max_workers=4) as executor:
+    readers = [executor.submit(read) for _ in range(4)]
+
+    for version in range(1, 2000):
+      Config.update_instance(low=version, high=version)
+
+    stop.set()
+
+  assert all(reader.result() > 0 for reader in readers)
+  assert Config().low == Config().high == 1999
+
+def test_snapshot_keeps_its_version() -> None:
+  Config.detach()
+  config = Config()
+  before = Config.snapshot()
+
+  Config.update_instance(low=1, high=1)
+  config.extra = 'new'
+
+  assert (before['low'], 'extra' in before) == (0, False)
+  assert (Config.snapshot()['low'], config.extra) == (1, 'new')
+
+  with pytest.raises(TypeError):
+    before['low'] = 2 # type: ignore[index]
+
+  with pytest.raises(AttributeError):
+    config.low = 2
+
+def test_snapshot_survives_cleanup() -> None:
+  Config.detach()
+  Config().update_instance(low=3, high=3)
+  state = Config.snapshot()
+
+  Config.detach()
+  assert flush_cleanup(5)
+  assert state['low'] == state['high'] == 3
+
+def test_plain_classes_snapshot_a_copy() -> None:
+  Plain.detach()
+  Plain()
+  state = Plain.snapshot()
+
+  Plain.update_instance(value=1)
+  Plain.update_instance(value=2)
+
+  assert state['value'] == 0
+  assert Plain().value == 2
+
+def test_snapshot_holds_only_attributes() -> None:
+  Plain.detach()
+  Plain.update_instance(value=1)
+  Published.detach()
+  published = Published()
+
+  assert set(Plain.snapshot()) == {'value'}
+  assert set(Published.snapshot()) == {'value', 'first'}
+  # The dict published while building was not mutated afterwards.
+  assert published.first == {'value': 0}
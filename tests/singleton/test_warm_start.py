@@ -0,0 +1,85 @@
+import pytest
+from pathlib import Path
+from singletonize import Singleton, Multiton, flush_cleanup
+from typing import List
+
+class Source(Singleton):
+  def __init__(self) -> None:
+    self.rows = 3
+
+def test_restore_skips_init(tmp_path: Path) -> None:
+  builds: List[int] = []
+
+  class Index(Singleton, warm_start=tmp_path / 'index.snap', warm_start_key='v1'):
+    def __init__(self) -> None:
+      builds.append(1)
+      self.table = {row: str(row) for row in range(Source().rows)}
+      self.blob = memoryview(bytearray(b'abc' * 100))
+      self.source = Source()
+      self.self_ref = self
+      self._hidden = 'kept'
+
+  Index()
+  Index.save_snapshot()
+  Index.detach()
+  flush_cleanup(5)
+
+  index = Index()
+
+  assert builds == [1]
+  assert index.table == {0: '0', 1: '1', 2: '2'} and index._hidden == 'kept'
+  assert index.blob.readonly and bytes(index.blob[:3]) == b'abc'
+  assert index.source is Source() and index.self_ref is index
+
+  with pytest.raises(AttributeError):
+    index.table = {}
+
+def test_stale_or_unreadable_snapshot_rebuilds(tmp_path: Path) -> None:
+  builds: List[int] = []
+  version = ['v1']
+  path = tmp_path / 'config.snap'
+
+  class Config(Singleton, warm_start=path, warm_start_key=lambda: version[0]):
+    def __init__(self) -> None:
+      builds.append(1)
+      self.value = len(builds)
+
+  Config()
+  Config.save_snapshot()
+  Config.detach()
+  version[0] = 'v2'
+  assert Config.reset_instance().value == 2
+
+  path.write_bytes(b'garbage')
+  Config.detach()
+
+  with pytest.warns(RuntimeWarning):
+    assert Config().value == 3
+
+def test_slots_instance_is_restored_sealed(tmp_path: Path) -> None:
+  class Table(Singleton, slots=('rows', '_cursor'), warm_start=tmp_path / 'table.snap', warm_start_key='v1'):
+    def __init__(self) -> None:
+      self.rows = (1, 2)
+      self._cursor = 0
+
+  Table()
+  Table.save_snapshot()
+  Table.detach()
+  table = Table()
+
+  assert (table.rows, table._cursor) == ((1, 2), 0)
+
+  with pytest.raises(AttributeError):
+    table.rows = ()
+
+def test_invalid_warm_start_declarations(tmp_path: Path) -> None:
+  with pytest.raises(ValueError):
+    class Unkeyed(Singleton, warm_start=tmp_path / 'unkeyed.snap'):
+      pass
+
+  with pytest.raises(TypeError):
+    class Pool(Multiton, warm_start=tmp_path / 'pool.snap', warm_start_key='v1'):
+      pass
+
+  with pytest.raises(TypeError):
+    Source.save_snapshot(tmp_path / 'source.snap')
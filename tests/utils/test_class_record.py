@@ -0,0 +1,56 @@
+import gc
+import pytest
+from singletonize._utils import ClassRecord, RecordField
+
+def test_fields_live_in_the_class_record() -> None:
+  field: RecordField[int] = RecordField('refresh_stats')
+
+  class Base:
+    pass
+
+  class Child(Base):
+    pass
+
+  ClassRecord.attach(Base)
+  ClassRecord.attach(Child)
+  field[Base] = 1
+
+  assert field[Base] == 1
+  assert getattr(Base.__dict__['_singleton_record'], 'refresh_stats') == 1
+  assert Child not in field and int not in field
+  assert field.get(Child) is None
+  assert field.setdefault(Child, 2) == 2
+  assert {Base, Child} <= set(field.keys())
+
+  with pytest.raises(KeyError):
+    del field[int]
+
+  with pytest.raises(TypeError):
+    field[int] = 3
+
+  assert field.pop(Base) == 1
+  assert field.pop(Base, 3) == 3
+  assert Base not in field and Child in field
+
+  field.clear()
+  assert Child not in field and not hasattr(Child.__dict__['_singleton_record'], 'refresh_stats')
+
+def test_records_go_away_with_their_class() -> None:
+  field: RecordField[int] = RecordField('refresh_stats')
+
+  class Root:
+    pass
+
+  class Transient(Root):
+    pass
+
+  ClassRecord.attach(Root)
+  ClassRecord.attach(Transient)
+  field[Transient] = 1
+  assert Transient in ClassRecord.owners()
+
+  del Root, Transient
+  gc.collect()
+
+  assert not [cls for cls in ClassRecord.owners() if cls.__qualname__.endswith('Transient')]
+  assert not [cls for cls in field if cls.__qualname__.endswith('Transient')]
@@ -0,0 +1,91 @@
+import gc
+import time
+from singletonize._utils import CleanupScheduler, InstanceCleaner
+from typing import Any
+from weakref import ref
+
+class MySingleton:
+  def __init__(self) -> None:
+    self.attr1 = "value1"
+    self.attr2 = "value2"
+
+def test_schedule_runs_in_background() -> None:
+  obj = MySingleton()
+  CleanupScheduler.schedule(obj, "attributes-only")
+
+  assert CleanupScheduler.flush(5)
+  assert CleanupScheduler.pending() == 0
+  assert not hasattr(obj, 'attr1')
+
+def test_schedule_does_not_block_caller(monkeypatch: Any) -> None:
+  original = InstanceCleaner.cleanup
+
+  def slow_cleanup(*args: Any, **kwargs: Any) -> None:
+    time.sleep(0.2)
+    original(*args, **kwargs)
+
+  monkeypatch.setattr(InstanceCleaner, 'cleanup', slow_cleanup)
+
+  start = time.perf_counter()
+  CleanupScheduler.schedule(MySingleton(), "attributes-only")
+  assert time.perf_counter() - start < 0.1
+
+  assert CleanupScheduler.flush(5)
+
+def test_schedule_none_strategy() -> None:
+  obj = MySingleton()
+  CleanupScheduler.schedule(obj, "none")
+
+  assert CleanupScheduler.flush(5)
+  assert obj.attr1 == "value1"
+
+def test_schedule_coalesces_collections(monkeypatch: Any) -> None:
+  collections: list[int] = []
+  monkeypatch.setattr(gc, 'collect', lambda generation=2: collections.append(generation) or 0)
+
+  referrers: list[int] = []
+  get_referrers = gc.get_referrers
+  monkeypatch.setattr(gc, 'get_referrers', lambda *objs: referrers.append(len(objs)) or get_referrers(*objs))
+
+  assert CleanupScheduler.flush(5)
+
+  objs = [MySingleton() for _ in range(10)]
+  containers = [{'obj': obj} for obj in objs]
+
+  # Holding the condition keeps the worker from draining until every job is queued.
+  with CleanupScheduler._condition: #type: ignore
+    for obj in objs:
+      CleanupScheduler.schedule(obj, "deep")
+
+  assert CleanupScheduler.flush(5)
+  assert collections == [2]
+  # Tuple referrers still cost one scan each, but the objects share a single one.
+  assert referrers[0] == len(objs)
+  assert referrers.count(len(objs)) == 1
+  assert all(container['obj'] is None for container in containers)
+
+def test_schedule_frees_without_collection(monkeypatch: Any) -> None:
+  collections: list[int] = []
+  monkeypatch.setattr(gc, 'collect', lambda generation=2: collections.append(generation) or 0)
+
+  obj = MySingleton()
+  obj.attr1 = obj # type: ignore
+  weak = ref(obj)
+
+  CleanupScheduler.schedule(obj, "attributes-only")
+  del obj
+
+  assert CleanupScheduler.flush(5)
+  assert weak() is None
+  assert collections == []
+
+def test_schedule_reports_errors(monkeypatch: Any) -> None:
+  errors: list[type[BaseException] | None] = []
+  monkeypatch.setattr('sys.excepthook', lambda kind, *_: errors.append(kind))
+
+  obj = MySingleton()
+  _ = ((obj,),)
+  CleanupScheduler.schedule(obj, "deep")
+
+  assert CleanupScheduler.flush(5)
+  assert errors == [ValueError]
@@ -79,3 +79,55 @@ def test_cleanup_object_in_nested_tuple() -> None:
 
   with pytest.raises(ValueError, match="Cannot modify tuple referrer."):
     InstanceCleaner.cleanup(obj)
+
+def test_cleanup_unknown_strategy() -> None:
+  with pytest.raises(ValueError, match="Unknown cleanup strategy 'fast'"):
+    InstanceCleaner.cleanup(MySingleton(), "fast") #type: ignore
+
+def test_cleanup_strategy_none() -> None:
+  obj = MySingleton()
+  ref_dict = {'key': obj}
+  InstanceCleaner.cleanup(obj, "none")
+
+  assert obj.attr1 == "value1"
+  assert ref_dict['key'] is obj
+
+def test_cleanup_strategy_attributes_only() -> None:
+  obj = MySingleton()
+  ref_dict = {'key': obj}
+  InstanceCleaner.cleanup(obj, "attributes-only")
+
+  assert not hasattr(obj, 'attr1')
+  assert ref_dict['key'] is obj
+
+def test_cleanup_strategy_tracked() -> None:
+  class Holder:
+    def __init__(self, obj: object) -> None:
+      self.obj = obj
+      self.other = "value"
+
+  class SlotsHolder:
+    __slots__ = ('obj', '__private')
+
+    def __init__(self, obj: object) -> None:
+      self.obj = obj
+      self.__private = obj
+
+    def private(self) -> object:
+      return self.__private
+
+  obj = MySingleton()
+  holder = Holder(obj)
+  slots_holder = SlotsHolder(obj)
+  untracked = Holder(obj)
+  ref_dict = {'key': obj}
+
+  InstanceCleaner.cleanup(obj, "tracked", [obj, holder, slots_holder])
+
+  assert not hasattr(obj, 'attr1')
+  assert holder.obj is None
+  assert holder.other == "value"
+  assert slots_holder.obj is None
+  assert slots_holder.private() is None
+  assert untracked.obj is obj
+  assert ref_dict['key'] is obj
@@ -0,0 +1,121 @@
+import asyncio
+import operator
+import pytest
+import sys
+from singletonize import Singleton, untouched_proxies
+from singletonize._utils import LazyProxy, UntouchedLazyProxy
+from typing import Any, Generator, List
+
+class MySingleton(Singleton):
+  created = 0
+
+  def __init__(self, value: int) -> None:
+    type(self).created += 1
+    self.value = value
+    self.items = [1, 2, 3]
+
+  def double(self) -> int:
+    return self.value * 2
+
+  def __len__(self) -> int:
+    return len(self.items)
+
+def test_lazy_defers_creation() -> None:
+  MySingleton.detach()
+  MySingleton.created = 0
+
+  proxy = MySingleton.lazy(5)
+
+  assert MySingleton.created == 0
+  assert not MySingleton.has_instance()
+
+  assert proxy.value == 5
+  assert MySingleton.created == 1
+  assert proxy.double() == 10
+  assert len(proxy) == 3
+  assert MySingleton.created == 1
+
+def test_lazy_forwards_to_current_instance() -> None:
+  MySingleton.detach()
+
+  proxy = MySingleton.lazy(1)
+  assert proxy.value == 1
+
+  MySingleton.reset_instance(2)
+  assert proxy.value == 2
+
+  MySingleton.detach()
+  assert proxy.value == 1
+
+def test_lazy_untouched_report() -> None:
+  MySingleton.detach()
+
+  touched = MySingleton.lazy(1)
+  untouched = MySingleton.lazy(2)
+  line = sys._getframe().f_lineno - 1
+
+  assert type(touched) is UntouchedLazyProxy
+  assert touched.value == 1
+  assert type(touched) is LazyProxy
+
+  report = [location for cls, location in untouched_proxies() if cls is MySingleton]
+  assert len(report) == 1
+  assert report[0] == f'{__file__}:{line}'
+
+  del untouched
+
+class Resource(Singleton):
+  def __init__(self, size: int = 3) -> None:
+    self.size = size
+    self.entered: List[int] = []
+
+  def __enter__(self) -> 'Resource':
+    self.entered.append(1)
+    return self
+
+  def __exit__(self, *exc_info: Any) -> None:
+    self.entered.pop()
+
+  async def __aenter__(self) -> 'Resource':
+    return self.__enter__()
+
+  async def __aexit__(self, *exc_info: Any) -> None:
+    self.__exit__(*exc_info)
+
+  def __await__(self) -> Generator[Any, None, int]:
+    yield from asyncio.sleep(0).__await__()
+    return self.size
+
+  def __index__(self) -> int:
+    return self.size
+
+  def __add__(self, other: int) -> int:
+    return self.size + other
+
+  def __radd__(self, other: int) -> int:
+    return other + self.size
+
+  def __lt__(self, other: int) -> bool:
+    return self.size < other
+
+def test_lazy_forwards_protocols() -> None:
+  Resource.detach()
+  proxy = Resource.lazy()
+
+  with proxy as resource:
+    assert resource is Resource() and resource.entered == [1]
+
+  async def use() -> int:
+    async with proxy as resource:
+      assert resource.entered == [1]
+
+    return await proxy
+
+  assert asyncio.run(use()) == 3
+  assert (proxy + 1, 1 + proxy, proxy < 4, [0, 1, 2, 3][proxy], operator.index(proxy)) == (4, 4, True, 3, 3)
+
+  with pytest.raises(TypeError):
+    proxy - 1
+
+  # Equality and hashing stay identity based.
+  assert proxy != Resource() and proxy == proxy and hash(proxy) != hash(Resource())
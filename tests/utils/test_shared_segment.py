@@ -0,0 +1,84 @@
+import os
+import pytest
+import subprocess
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from singletonize._utils import SharedField, SharedSegment
+
+pytestmark = pytest.mark.skipif(os.name != 'posix', reason='requires a POSIX platform')
+
+def make_segment(name: str, length: int = 4) -> SharedSegment:
+  counts = SharedField('q', length)
+  counts.name = 'counts'
+  flags = SharedField('B', 3)
+  flags.name = 'flags'
+  return SharedSegment(name, {'counts': counts, 'flags': flags})
+
+def test_segment_attach_and_unlink() -> None:
+  name = f'sz_test_segment_{os.getpid()}'
+  first, second = make_segment(name), make_segment(name)
+
+  with first.lock:
+    assert first.attach() is True
+
+  with second.lock:
+    assert second.attach() is False
+
+  first.view('counts')[2] = 42
+  second.view('flags')[:] = b'abc'
+
+  assert second.view('counts')[2] == 42
+  assert bytes(first.view('flags')) == b'abc'
+
+  with first.lock:
+    first.detach()
+
+  with pytest.raises(RuntimeError, match='not attached'):
+    first.view('counts')
+
+  assert second.view('counts')[2] == 42
+
+  with second.lock:
+    second.detach()
+
+  with pytest.raises(FileNotFoundError):
+    SharedMemory(name)
+
+def test_segment_layout_mismatch() -> None:
+  name = f'sz_test_layout_{os.getpid()}'
+  segment = make_segment(name)
+
+  with segment.lock:
+    segment.attach()
+
+  try:
+    with pytest.raises(ValueError, match='different layout'):
+      make_segment(name, length=8).attach()
+  finally:
+    segment.detach()
+
+def test_segment_detached_at_exit() -> None:
+  name = f'sz_test_exit_{os.getpid()}'
+  script = '\n'.join([
+    'from singletonize._utils import SharedField, SharedSegment',
+    'field = SharedField("q", 4)',
+    'field.name = "counts"',
+    f'segment = SharedSegment({name!r}, {{"counts": field}})',
+    'with segment.lock:',
+    '  segment.attach()',
+    'counts = segment.view("counts")',
+    'counts[0] = 7'
+  ])
+  result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, timeout=30)
+
+  assert result.returncode == 0 and not result.stderr
+
+  with pytest.raises(FileNotFoundError):
+    SharedMemory(name)
+
+def test_field_validation() -> None:
+  with pytest.raises(ValueError, match='Unsupported field format'):
+    SharedField('x')
+
+  with pytest.raises(ValueError, match='must be positive'):
+    SharedField('d', 0)
@@ -0,0 +1,44 @@
+import time
+from singletonize import Singleton, SingletonABC, warmup
+
+class SlowSingleton(Singleton):
+  def __init__(self, value: int = 0) -> None:
+    time.sleep(0.2)
+    self.value = value
+
+class OtherSlowSingleton(SingletonABC):
+  def __init__(self, value: int = 0, name: str = '') -> None:
+    time.sleep(0.2)
+    self.value = value
+    self.name = name
+
+class FailingSingleton(Singleton):
+  def __init__(self) -> None:
+    raise ValueError('boom')
+
+def test_warmup_runs_concurrently() -> None:
+  SlowSingleton.detach()
+  OtherSlowSingleton.detach()
+
+  start = time.perf_counter()
+  results = warmup([(SlowSingleton, (1,)), (OtherSlowSingleton, (2,), {'name': 'other'})])
+  elapsed = time.perf_counter() - start
+
+  assert elapsed < 0.35
+  assert results[SlowSingleton].instance is SlowSingleton()
+  assert results[SlowSingleton].duration >= 0.2
+  assert results[OtherSlowSingleton].instance.name == 'other'
+  assert all(result.error is None for result in results.values())
+
+def test_warmup_isolates_failures() -> None:
+  SlowSingleton.detach()
+
+  results = warmup([FailingSingleton, SlowSingleton], max_workers=2)
+
+  assert isinstance(results[FailingSingleton].error, ValueError)
+  assert results[FailingSingleton].instance is None
+  assert results[SlowSingleton].error is None
+  assert SlowSingleton.has_instance()
+
+def test_warmup_empty() -> None:
+  assert warmup([]) == {}